@@ -1,4 +1,5 @@
 from gamehub.api.dependencies.connection_handler import T_ConnectionHandler
 from gamehub.api.dependencies.room_manager import T_RoomManager
+from gamehub.api.dependencies.shard_router import T_ShardRouter
 
-__all__ = ["T_ConnectionHandler", "T_RoomManager"]
+__all__ = ["T_ConnectionHandler", "T_RoomManager", "T_ShardRouter"]
@@ -0,0 +1,8 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+
+
+@lru_cache
+def get_bot_executor() -> Executor:
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver"))
@@ -3,11 +3,15 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from gamehub.api.dependencies.client_manager import T_ClientManager
-from gamehub.api.dependencies.event_bus import T_EventBus
-from gamehub.api.dependencies.message_sender import T_MessageSender
-from gamehub.api.dependencies.room_manager import T_RoomManager
-from gamehub.api.dependencies.turn_timer_registry import T_TurnTimerRegistry
+from gamehub.api.dependencies.client_manager import T_ClientManager, get_client_manager
+from gamehub.api.dependencies.event_bus import T_EventBus, get_event_bus
+from gamehub.api.dependencies.event_scheduler import get_event_scheduler
+from gamehub.api.dependencies.message_sender import T_MessageSender, get_message_sender
+from gamehub.api.dependencies.shard_router import T_ShardRouter, resolve_shard_router
+from gamehub.api.dependencies.turn_timer_registry import (
+    T_TurnTimerRegistry,
+    get_turn_timer_registry,
+)
 from gamehub.api.socket_server import ConnectionHandler
 from gamehub.core.setup_bus import setup_event_bus
 
@@ -17,11 +21,31 @@ def get_connection_handler(
     event_bus: T_EventBus,
     client_manager: T_ClientManager,
     message_sender: T_MessageSender,
-    room_manager: T_RoomManager,
+    shard_router: T_ShardRouter,
     turn_timer_registry: T_TurnTimerRegistry,
 ) -> ConnectionHandler:
-    setup_event_bus(event_bus, message_sender, room_manager, turn_timer_registry)
+    setup_event_bus(
+        event_bus,
+        message_sender,
+        shard_router.room_manager,
+        turn_timer_registry,
+        shard_router,
+    )
     return ConnectionHandler(client_manager, event_bus)
 
 
+def resolve_connection_handler() -> ConnectionHandler:
+    event_bus = get_event_bus()
+    client_manager = get_client_manager()
+    return get_connection_handler(
+        event_bus=event_bus,
+        client_manager=client_manager,
+        message_sender=get_message_sender(client_manager=client_manager),
+        shard_router=resolve_shard_router(),
+        turn_timer_registry=get_turn_timer_registry(
+            event_scheduler=get_event_scheduler(event_bus=event_bus)
+        ),
+    )
+
+
 T_ConnectionHandler = Annotated[ConnectionHandler, Depends(get_connection_handler)]
@@ -0,0 +1,12 @@
+import os
+from functools import lru_cache
+from typing import Optional
+
+from gamehub.core.move_log import MoveLog
+
+
+@lru_cache
+def get_move_log() -> Optional[MoveLog]:
+    if directory := os.environ.get("GAMEHUB_MOVE_LOG_DIR"):
+        return MoveLog(directory)
+    return None
@@ -3,14 +3,38 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from gamehub.api.dependencies.bot_executor import get_bot_executor
 from gamehub.api.dependencies.event_bus import T_EventBus
-from gamehub.api.dependencies.rooms_factory import default_rooms
+from gamehub.api.dependencies.event_scheduler import T_EventScheduler
+from gamehub.api.dependencies.rooms_factory import default_rooms, room_factories
+from gamehub.api.dependencies.shard_map import T_ShardMap
 from gamehub.core.room_manager import RoomManager
+from gamehub.core.room_pool import RoomPool
+from gamehub.games.chinese_poker.bots import MonteCarloStrategy
 
 
 @lru_cache
-def get_room_manager(event_bus: T_EventBus) -> RoomManager:
-    return RoomManager(rooms=list(default_rooms(event_bus)), event_bus=event_bus)
+def get_room_manager(
+    event_bus: T_EventBus, event_scheduler: T_EventScheduler, shard_map: T_ShardMap
+) -> RoomManager:
+    bot_strategy = MonteCarloStrategy(get_bot_executor())
+    rooms = default_rooms(event_bus, bot_strategy)
+    if shard_map is not None:
+        rooms = (room for room in rooms if shard_map.is_local(room.room_id))
+    return RoomManager(
+        rooms=list(rooms),
+        event_bus=event_bus,
+        room_pool=RoomPool(
+            room_factories=room_factories(event_bus, bot_strategy),
+            max_rooms=1000,
+            idle_ttl_seconds=300,
+            max_memory_bytes=768 * 1024 * 1024,
+            inbox_size=64,
+            room_id_offset=shard_map.shard_index if shard_map else 0,
+            room_id_stride=shard_map.num_shards if shard_map else 1,
+        ),
+        event_scheduler=event_scheduler,
+    )
 
 
 T_RoomManager = Annotated[RoomManager, Depends(get_room_manager)]
@@ -1,12 +1,16 @@
+from functools import partial
 from typing import Iterator
 
 from gamehub.core.event_bus import EventBus
 from gamehub.core.game_room import GameRoom
+from gamehub.core.room_pool import RoomFactory
+from gamehub.core.transition_policy import TransitionPolicy
 from gamehub.games.chinese_poker import (
     ChinesePokerConfiguration,
     ChinesePokerGameLogic,
     ChinesePokerMove,
 )
+from gamehub.games.chinese_poker.bots import BotStrategy
 from gamehub.games.rock_paper_scissors import RPSGameLogic, RPSMove
 from gamehub.games.tic_tac_toe import TicTacToeGameLogic, TicTacToeMove
 
@@ -30,7 +34,11 @@ def _rps_room(event_bus: EventBus, room_id: int) -> GameRoom:
 
 
 def _chinese_poker_room(
-    event_bus: EventBus, room_id: int, point_threshold: int, credits_per_point: int
+    event_bus: EventBus,
+    bot_strategy: BotStrategy,
+    room_id: int,
+    point_threshold: int,
+    credits_per_point: int,
 ) -> GameRoom:
     return GameRoom(
         room_id=room_id,
@@ -40,22 +48,40 @@ def _chinese_poker_room(
                 cards_per_player=13,
                 game_over_point_threshold=point_threshold,
                 credits_per_point=credits_per_point,
-            )
+            ),
+            bot_strategy=bot_strategy,
         ),
         move_parser=ChinesePokerMove.model_validate,
         event_bus=event_bus,
+        transition_policy=TransitionPolicy(coalesce_updates=True),
     )
 
 
-def default_rooms(event_bus: EventBus) -> Iterator[GameRoom]:
+def default_rooms(event_bus: EventBus, bot_strategy: BotStrategy) -> Iterator[GameRoom]:
     yield _chinese_poker_room(
-        event_bus, room_id=1, point_threshold=25, credits_per_point=100
+        event_bus, bot_strategy, room_id=1, point_threshold=25, credits_per_point=100
     )
     yield _chinese_poker_room(
-        event_bus, room_id=2, point_threshold=25, credits_per_point=200
+        event_bus, bot_strategy, room_id=2, point_threshold=25, credits_per_point=200
     )
     yield _chinese_poker_room(
-        event_bus, room_id=3, point_threshold=20, credits_per_point=400
+        event_bus, bot_strategy, room_id=3, point_threshold=20, credits_per_point=400
     )
     yield _rps_room(event_bus, room_id=4)
     yield _tic_tac_toe_room(event_bus, room_id=5)
+
+
+def room_factories(
+    event_bus: EventBus, bot_strategy: BotStrategy
+) -> dict[str, RoomFactory]:
+    return {
+        "chinese_poker": partial(
+            _chinese_poker_room,
+            event_bus,
+            bot_strategy,
+            point_threshold=25,
+            credits_per_point=100,
+        ),
+        "rock_paper_scissors": partial(_rps_room, event_bus),
+        "tic_tac_toe": partial(_tic_tac_toe_room, event_bus),
+    }
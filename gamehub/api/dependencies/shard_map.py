@@ -0,0 +1,14 @@
+from functools import lru_cache
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from gamehub.core.shard_map import ShardMap
+
+
+@lru_cache
+def get_shard_map() -> Optional[ShardMap]:
+    return ShardMap.from_env()
+
+
+T_ShardMap = Annotated[Optional[ShardMap], Depends(get_shard_map)]
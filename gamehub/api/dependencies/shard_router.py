@@ -0,0 +1,33 @@
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends
+
+from gamehub.api.dependencies.event_bus import T_EventBus, get_event_bus
+from gamehub.api.dependencies.event_scheduler import get_event_scheduler
+from gamehub.api.dependencies.room_manager import T_RoomManager, get_room_manager
+from gamehub.api.dependencies.shard_map import T_ShardMap, get_shard_map
+from gamehub.core.shard_router import ShardRouter
+
+
+@lru_cache
+def get_shard_router(
+    room_manager: T_RoomManager, event_bus: T_EventBus, shard_map: T_ShardMap
+) -> ShardRouter:
+    return ShardRouter(room_manager, event_bus, shard_map)
+
+
+def resolve_shard_router() -> ShardRouter:
+    event_bus = get_event_bus()
+    shard_map = get_shard_map()
+    room_manager = get_room_manager(
+        event_bus=event_bus,
+        event_scheduler=get_event_scheduler(event_bus=event_bus),
+        shard_map=shard_map,
+    )
+    return get_shard_router(
+        room_manager=room_manager, event_bus=event_bus, shard_map=shard_map
+    )
+
+
+T_ShardRouter = Annotated[ShardRouter, Depends(get_shard_router)]
@@ -0,0 +1,43 @@
+import os
+from functools import lru_cache
+from typing import Optional
+
+from gamehub.api.dependencies.event_bus import get_event_bus
+from gamehub.api.dependencies.event_scheduler import get_event_scheduler
+from gamehub.api.dependencies.room_manager import T_RoomManager, get_room_manager
+from gamehub.api.dependencies.shard_map import T_ShardMap, get_shard_map
+from gamehub.api.dependencies.turn_timer_registry import (
+    T_TurnTimerRegistry,
+    get_turn_timer_registry,
+)
+from gamehub.core.snapshot_store import SnapshotStore
+
+
+@lru_cache
+def get_snapshot_store(
+    room_manager: T_RoomManager,
+    turn_timer_registry: T_TurnTimerRegistry,
+    shard_map: T_ShardMap,
+) -> Optional[SnapshotStore]:
+    if not (directory := os.environ.get("GAMEHUB_SNAPSHOT_DIR")):
+        return None
+    os.makedirs(directory, exist_ok=True)
+    file_name = (
+        f"rooms-{shard_map.shard_index}.snapshot" if shard_map else "rooms.snapshot"
+    )
+    return SnapshotStore(
+        os.path.join(directory, file_name), room_manager, turn_timer_registry
+    )
+
+
+def resolve_snapshot_store() -> Optional[SnapshotStore]:
+    event_bus = get_event_bus()
+    event_scheduler = get_event_scheduler(event_bus=event_bus)
+    shard_map = get_shard_map()
+    return get_snapshot_store(
+        room_manager=get_room_manager(
+            event_bus=event_bus, event_scheduler=event_scheduler, shard_map=shard_map
+        ),
+        turn_timer_registry=get_turn_timer_registry(event_scheduler=event_scheduler),
+        shard_map=shard_map,
+    )
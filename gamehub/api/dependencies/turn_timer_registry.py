@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import Annotated, Iterator
 
 from fastapi import Depends
@@ -14,6 +14,7 @@ def _create_turn_timer(event_scheduler: EventScheduler, room_id: int) -> TurnTim
         room_id=room_id,
         timeout_seconds=60,
         reminders_at_seconds_remaining=[30, 5],
+        offline_grace_seconds=2,
     )
 
 
@@ -24,7 +25,12 @@ def _turn_timers(event_scheduler: EventScheduler) -> Iterator[TurnTimer]:
 
 @lru_cache
 def get_turn_timer_registry(event_scheduler: T_EventScheduler) -> TurnTimerRegistry:
-    return TurnTimerRegistry(turn_timers=list(_turn_timers(event_scheduler)))
+    return TurnTimerRegistry(
+        turn_timers=list(_turn_timers(event_scheduler)),
+        turn_timer_factories={
+            "chinese_poker": partial(_create_turn_timer, event_scheduler)
+        },
+    )
 
 
 T_TurnTimerRegistry = Annotated[TurnTimerRegistry, Depends(get_turn_timer_registry)]
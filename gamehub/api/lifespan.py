@@ -0,0 +1,62 @@
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI
+
+from gamehub.api.dependencies.connection_handler import resolve_connection_handler
+from gamehub.api.dependencies.event_bus import get_event_bus
+from gamehub.api.dependencies.move_log import get_move_log
+from gamehub.api.dependencies.shard_map import get_shard_map
+from gamehub.api.dependencies.shard_router import resolve_shard_router
+from gamehub.api.dependencies.snapshot_store import resolve_snapshot_store
+from gamehub.core.move_log import MoveLog, RoomLog, load_room_logs
+from gamehub.core.room_snapshot import RoomSnapshot
+from gamehub.core.setup_bus import setup_move_log, setup_snapshot_store
+from gamehub.core.shard_map import ShardMap
+from gamehub.core.snapshot_store import SnapshotStore, load_room_snapshots
+
+
+def _saved_rooms(
+    shard_map: Optional[ShardMap],
+    move_log: Optional[MoveLog],
+    snapshot_store: Optional[SnapshotStore],
+) -> tuple[list[RoomLog], list[RoomSnapshot]]:
+    room_logs = load_room_logs(move_log.directory) if move_log else []
+    snapshots = load_room_snapshots(snapshot_store.path) if snapshot_store else []
+    if shard_map is not None:
+        room_logs = [log for log in room_logs if shard_map.is_local(log.room_id)]
+        snapshots = [s for s in snapshots if shard_map.is_local(s.room_id)]
+    if move_log is not None:
+        logged_room_ids = {room_log.room_id for room_log in room_logs}
+        snapshots = [s for s in snapshots if s.room_id in logged_room_ids]
+    return room_logs, snapshots
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    shard_map = get_shard_map()
+    move_log = get_move_log()
+    snapshot_store = resolve_snapshot_store()
+    if shard_map is None and move_log is None and snapshot_store is None:
+        yield
+        return
+    resolve_connection_handler()
+    shard_router = resolve_shard_router()
+    room_logs, snapshots = _saved_rooms(shard_map, move_log, snapshot_store)
+    if snapshot_store is not None:
+        setup_snapshot_store(get_event_bus(), snapshot_store)
+        failed_room_ids = await snapshot_store.restore(snapshots, room_logs)
+        snapshot_store.start()
+    else:
+        failed_room_ids = await shard_router.room_manager.restore_rooms(room_logs)
+    if move_log is not None:
+        for room_id in failed_room_ids:
+            move_log.set_aside(room_id)
+        setup_move_log(get_event_bus(), move_log)
+    await shard_router.start()
+    yield
+    await shard_router.close()
+    if snapshot_store is not None:
+        await snapshot_store.close()
+    if move_log is not None:
+        move_log.close()
@@ -1,5 +1,15 @@
+from gamehub.api.socket_server.client_connection import (
+    ClientConnection,
+    OverflowPolicy,
+)
 from gamehub.api.socket_server.client_manager import ClientManager
 from gamehub.api.socket_server.connection_handler import ConnectionHandler
 from gamehub.api.socket_server.message_sender import SocketMessageSender
 
-__all__ = ["ClientManager", "ConnectionHandler", "SocketMessageSender"]
+__all__ = [
+    "ClientConnection",
+    "ClientManager",
+    "ConnectionHandler",
+    "OverflowPolicy",
+    "SocketMessageSender",
+]
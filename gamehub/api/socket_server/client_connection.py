@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from collections import Counter, deque
+from enum import Enum
+from typing import Hashable, Optional
+
+from fastapi import WebSocket
+
+
+class OverflowPolicy(Enum):
+    DROP_SUPERSEDED = "DROP_SUPERSEDED"
+    COALESCE = "COALESCE"
+    DISCONNECT = "DISCONNECT"
+
+
+class ClientConnection:
+    def __init__(
+        self,
+        client: WebSocket,
+        max_queue_size: int,
+        overflow_policy: OverflowPolicy,
+    ):
+        self._client = client
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._frames: deque[tuple[Optional[Hashable], str]] = deque()
+        self._has_frames = asyncio.Event()
+        self._is_idle = asyncio.Event()
+        self._is_idle.set()
+        self._overflowed = False
+        self._writer: Optional[asyncio.Task] = None
+
+    @property
+    def client(self) -> WebSocket:
+        return self._client
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._frames)
+
+    def enqueue(self, frame: str, coalesce_key: Optional[Hashable] = None) -> None:
+        if self._overflowed or (self._writer is not None and self._writer.done()):
+            return
+        if len(self._frames) >= self._max_queue_size:
+            self._handle_overflow(coalesce_key)
+        if not self._overflowed:
+            self._frames.append((coalesce_key, frame))
+        self._is_idle.clear()
+        self._has_frames.set()
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_frames())
+
+    def _handle_overflow(self, coalesce_key: Optional[Hashable]) -> None:
+        if self._overflow_policy == OverflowPolicy.COALESCE and (
+            self._drop_superseded_frames(coalesce_key)
+        ):
+            return
+        if self._overflow_policy != OverflowPolicy.DISCONNECT and (
+            self._drop_oldest_superseded_frame(coalesce_key)
+        ):
+            return
+        logging.warning(f"Outbound queue overflow, disconnecting: {self._client}")
+        self._overflowed = True
+        self._frames.clear()
+        if self._writer is not None:
+            self._writer.cancel()
+        self._writer = asyncio.create_task(self._close_client())
+
+    def _drop_superseded_frames(self, coalesce_key: Optional[Hashable]) -> bool:
+        if coalesce_key is None:
+            return False
+        num_frames = len(self._frames)
+        self._frames = deque(f for f in self._frames if f[0] != coalesce_key)
+        return len(self._frames) < num_frames
+
+    def _drop_oldest_superseded_frame(self, coalesce_key: Optional[Hashable]) -> bool:
+        num_newer_frames = Counter(key for key, _ in self._frames if key is not None)
+        if coalesce_key is not None:
+            num_newer_frames[coalesce_key] += 1
+        for index, (key, _) in enumerate(self._frames):
+            num_newer_frames[key] -= 1
+            if key is not None and num_newer_frames[key] > 0:
+                del self._frames[index]
+                return True
+        return False
+
+    async def _send_frames(self) -> None:
+        while True:
+            if not self._frames:
+                self._has_frames.clear()
+                self._is_idle.set()
+                await self._has_frames.wait()
+                continue
+            _, frame = self._frames.popleft()
+            await self._client.send_text(frame)
+
+    async def _close_client(self) -> None:
+        try:
+            await self._client.close()
+        except Exception as e:
+            logging.warning(f"Unable to close client: {e}")
+        finally:
+            self._is_idle.set()
+
+    async def _write_frames(self) -> None:
+        try:
+            await self._send_frames()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"Unable to write to client: {e}")
+        finally:
+            self._frames.clear()
+            if not self._overflowed:
+                self._is_idle.set()
+
+    async def flush(self) -> None:
+        await self._is_idle.wait()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.cancel()
+        self._frames.clear()
+        self._is_idle.set()
@@ -2,22 +2,34 @@ from typing import Optional
 
 from fastapi import WebSocket
 
+from gamehub.api.socket_server.client_connection import (
+    ClientConnection,
+    OverflowPolicy,
+)
 from gamehub.core.exceptions import InvalidPlayerIdError
 
 
 class ClientManager:
-    def __init__(self):
-        self._player_id_to_client = {}
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_SUPERSEDED,
+    ):
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._player_id_to_connection = {}
         self._client_to_player_id = {}
 
     def associate_player_id(self, player_id: str, client: WebSocket):
         existing_id = self._client_to_player_id.get(client)
         if not existing_id:
-            existing_client = self._player_id_to_client.get(player_id)
-            if existing_client:
+            existing_connection = self._player_id_to_connection.get(player_id)
+            if existing_connection:
                 raise InvalidPlayerIdError("Player id already in use by another client")
             elif player_id.strip():
-                self._player_id_to_client[player_id] = client
+                self._player_id_to_connection[player_id] = ClientConnection(
+                    client, self._max_queue_size, self._overflow_policy
+                )
                 self._client_to_player_id[client] = player_id
             else:
                 raise InvalidPlayerIdError("Player id cannot be empty")
@@ -29,8 +41,13 @@ class ClientManager:
     def remove(self, client: WebSocket) -> Optional[str]:
         player_id = self._client_to_player_id.pop(client, None)
         if player_id:
-            self._player_id_to_client.pop(player_id, None)
+            if connection := self._player_id_to_connection.pop(player_id, None):
+                connection.close()
             return player_id
 
+    def get_connection(self, player_id: str) -> Optional[ClientConnection]:
+        return self._player_id_to_connection.get(player_id)
+
     def get_client(self, player_id: str) -> Optional[WebSocket]:
-        return self._player_id_to_client.get(player_id)
+        if connection := self.get_connection(player_id):
+            return connection.client
@@ -1,11 +1,122 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
 from gamehub.api.socket_server.client_manager import ClientManager
-from gamehub.core.events.outgoing_message import OutgoingMessage
+from gamehub.api.socket_server.replay_buffer import ReplayBuffer
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
+from gamehub.core.message import Message, MessageType
+
+_SHARED_STATE_MESSAGES = frozenset(
+    {
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_STATE,
+        MessageType.TURN_TIMER_ALERT,
+    }
+)
 
 
 class SocketMessageSender:
-    def __init__(self, client_manager: ClientManager):
+    def __init__(
+        self,
+        client_manager: ClientManager,
+        replay_buffer_size: int = 64,
+        max_replay_bytes: int = 64 * 1024 * 1024,
+        replay_ttl_seconds: float = 120,
+    ):
         self._client_manager = client_manager
+        self._replay_buffer_size = replay_buffer_size
+        self._max_replay_bytes = max_replay_bytes
+        self._replay_ttl_seconds = replay_ttl_seconds
+        self._replay_buffers: OrderedDict[str, ReplayBuffer] = OrderedDict()
+        self._replay_bytes = 0
+        self._replay_expiry: OrderedDict[str, float] = OrderedDict()
+
+    @property
+    def replay_bytes(self) -> int:
+        return self._replay_bytes
+
+    @staticmethod
+    def _coalesce_key(message: Message, is_broadcast: bool) -> Optional[Hashable]:
+        if is_broadcast and message.message_type in _SHARED_STATE_MESSAGES:
+            return message.message_type, message.payload.get("room_id")
+
+    def forget_client(self, player_disconnected: PlayerDisconnected) -> None:
+        player_id = player_disconnected.player_id
+        if player_id in self._replay_buffers:
+            self._replay_expiry.pop(player_id, None)
+            self._replay_expiry[player_id] = time.monotonic() + self._replay_ttl_seconds
+
+    def _drop_replay_buffer(self, player_id: str) -> None:
+        self._replay_expiry.pop(player_id, None)
+        if replay_buffer := self._replay_buffers.pop(player_id, None):
+            self._replay_bytes -= replay_buffer.num_bytes
+
+    def _expire_replay_buffers(self) -> None:
+        now = time.monotonic()
+        while self._replay_expiry and next(iter(self._replay_expiry.values())) <= now:
+            self._drop_replay_buffer(next(iter(self._replay_expiry)))
+
+    def _replay_buffer(
+        self, player_id: str, is_connected: bool
+    ) -> Optional[ReplayBuffer]:
+        self._expire_replay_buffers()
+        if is_connected:
+            self._replay_expiry.pop(player_id, None)
+        if (replay_buffer := self._replay_buffers.get(player_id)) is not None:
+            self._replay_buffers.move_to_end(player_id)
+        elif is_connected:
+            replay_buffer = ReplayBuffer(self._replay_buffer_size)
+            self._replay_buffers[player_id] = replay_buffer
+        return replay_buffer
+
+    def _evict_replay_buffers(self) -> None:
+        while self._replay_bytes > self._max_replay_bytes and self._replay_buffers:
+            self._drop_replay_buffer(next(iter(self._replay_buffers)))
+
+    def _deliver(
+        self, player_id: str, frame: str, coalesce_key: Optional[Hashable]
+    ) -> None:
+        connection = self._client_manager.get_connection(player_id)
+        replay_buffer = self._replay_buffer(player_id, connection is not None)
+        if replay_buffer is None:
+            return
+        num_bytes = replay_buffer.num_bytes
+        stamped_frame = replay_buffer.append(frame)
+        self._replay_bytes += replay_buffer.num_bytes - num_bytes
+        self._evict_replay_buffers()
+        if connection:
+            connection.enqueue(stamped_frame, coalesce_key)
 
     async def send(self, message_event: OutgoingMessage) -> None:
-        if client := self._client_manager.get_client(message_event.player_id):
-            await client.send_text(message_event.message.model_dump_json())
+        self._deliver(
+            message_event.player_id,
+            message_event.message.model_dump_json(),
+            self._coalesce_key(message_event.message, is_broadcast=False),
+        )
+
+    async def broadcast(self, broadcast_event: OutgoingBroadcast) -> None:
+        frame = broadcast_event.message.model_dump_json()
+        coalesce_key = self._coalesce_key(broadcast_event.message, is_broadcast=True)
+        for recipient in broadcast_event.recipients:
+            self._deliver(recipient, frame, coalesce_key)
+
+    async def resume(self, resume_event: OutgoingResume) -> None:
+        self._expire_replay_buffers()
+        replay_buffer = self._replay_buffers.get(resume_event.player_id)
+        missed_frames = (
+            replay_buffer.frames_after(resume_event.buffer_id, resume_event.last_seen)
+            if replay_buffer
+            else None
+        )
+        if missed_frames is None:
+            for message in resume_event.fallback:
+                await self.send(OutgoingMessage(resume_event.player_id, message))
+        elif connection := self._client_manager.get_connection(resume_event.player_id):
+            for frame in missed_frames:
+                connection.enqueue(frame)
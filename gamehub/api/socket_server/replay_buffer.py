@@ -0,0 +1,51 @@
+from collections import deque
+from typing import Optional
+from uuid import uuid4
+
+
+def stamp_frame(buffer_id: str, sequence: int, frame: str) -> str:
+    return f'{{"buffer_id":"{buffer_id}","sequence":{sequence},{frame[1:]}'
+
+
+class ReplayBuffer:
+    def __init__(self, capacity: int, buffer_id: Optional[str] = None):
+        self._capacity = capacity
+        self._frames: deque[tuple[int, str]] = deque()
+        self._buffer_id = buffer_id or uuid4().hex
+        self._last_sequence = 0
+        self._num_bytes = 0
+
+    @property
+    def buffer_id(self) -> str:
+        return self._buffer_id
+
+    @property
+    def last_sequence(self) -> int:
+        return self._last_sequence
+
+    @property
+    def num_bytes(self) -> int:
+        return self._num_bytes
+
+    def append(self, frame: str) -> str:
+        self._last_sequence += 1
+        if len(self._frames) == self._capacity:
+            _, dropped = self._frames.popleft()
+            self._num_bytes -= len(dropped)
+        self._frames.append((self._last_sequence, frame))
+        self._num_bytes += len(frame)
+        return stamp_frame(self._buffer_id, self._last_sequence, frame)
+
+    def frames_after(
+        self, buffer_id: Optional[str], last_seen: int
+    ) -> Optional[list[str]]:
+        if buffer_id != self._buffer_id:
+            return None
+        first_buffered = self._last_sequence - len(self._frames) + 1
+        if not first_buffered - 1 <= last_seen <= self._last_sequence:
+            return None
+        num_missed = self._last_sequence - last_seen
+        missed = list(self._frames)[len(self._frames) - num_missed :]
+        return [
+            stamp_frame(self._buffer_id, sequence, frame) for sequence, frame in missed
+        ]
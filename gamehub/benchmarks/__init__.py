@@ -0,0 +1,14 @@
+from gamehub.benchmarks.baselines import Comparison, compare_runs, load_run, save_run
+from gamehub.benchmarks.cases import BENCHMARKS
+from gamehub.benchmarks.runner import BenchmarkResult, BenchmarkRun, run_benchmarks
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "BenchmarkRun",
+    "Comparison",
+    "compare_runs",
+    "load_run",
+    "run_benchmarks",
+    "save_run",
+]
@@ -0,0 +1,3 @@
+from gamehub.benchmarks.cli import main
+
+main()
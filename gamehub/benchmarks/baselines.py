@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import Optional
+
+from gamehub.benchmarks.runner import BenchmarkRun
+
+
+def git_revision(directory: Optional[str] = None) -> str:
+    def _git(*args: str) -> str:
+        return subprocess.run(
+            ("git", *args), cwd=directory, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        revision = _git("rev-parse", "--short", "HEAD")
+        is_dirty = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{revision}-dirty" if is_dirty else revision
+
+
+def baseline_path(directory: str, revision: str) -> str:
+    return os.path.join(directory, f"{revision}.json")
+
+
+def save_run(run: BenchmarkRun, directory: str) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = baseline_path(directory, run.revision)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(run.to_dict(), file, indent=2)
+    return path
+
+
+def load_run(revision_or_path: str, directory: str) -> BenchmarkRun:
+    path = revision_or_path
+    if not os.path.isfile(path):
+        path = baseline_path(directory, revision_or_path)
+    with open(path, encoding="utf-8") as file:
+        return BenchmarkRun.from_dict(json.load(file))
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_seconds: float
+    current_seconds: float
+    is_regression: bool
+
+    @property
+    def change(self) -> float:
+        return self.current_seconds / self.baseline_seconds - 1
+
+
+def compare_runs(
+    baseline: BenchmarkRun, current: BenchmarkRun, threshold: float
+) -> list[Comparison]:
+    baseline_results = {result.name: result for result in baseline.results}
+    comparisons = []
+    for result in current.results:
+        if (baseline_result := baseline_results.get(result.name)) is None:
+            continue
+        comparisons.append(
+            Comparison(
+                name=result.name,
+                baseline_seconds=baseline_result.best_seconds,
+                current_seconds=result.best_seconds,
+                is_regression=(
+                    result.best_seconds > baseline_result.best_seconds * (1 + threshold)
+                ),
+            )
+        )
+    return comparisons
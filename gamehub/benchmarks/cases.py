@@ -0,0 +1,166 @@
+import json
+from random import Random
+from typing import Callable, Coroutine
+
+from gamehub.core.event_bus import EventBus
+from gamehub.core.events.player_disconnected import PlayerDisconnected
+from gamehub.core.events.request import Request, RequestType
+from gamehub.core.events.request_events import MakeMove
+from gamehub.core.message import Message, MessageType
+from gamehub.core.request_parser import RequestParser
+from gamehub.games.chinese_poker import ChinesePokerConfiguration, ChinesePokerGameLogic
+from gamehub.games.chinese_poker.bots import GreedyStrategy
+from gamehub.games.chinese_poker.credits import calculate_credits
+from gamehub.games.chinese_poker.game_state import ChinesePokerState
+from gamehub.games.chinese_poker.hand import hand_value
+from gamehub.games.chinese_poker.player import players_shared_views
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
+from gamehub.games.chinese_poker.transitions.move_validator import (
+    MoveContext,
+    validate_move,
+)
+from gamehub.games.playing_cards import PlayingCard, deal_hands
+from gamehub.games.tic_tac_toe.game_state import TicTacToeState
+from gamehub.games.tic_tac_toe.player import TicTacToePlayer
+
+Benchmark = Callable[[], object]
+
+_CONFIGURATION = ChinesePokerConfiguration(
+    num_players=4,
+    cards_per_player=13,
+    game_over_point_threshold=25,
+    credits_per_point=100,
+)
+
+_HANDS = (
+    "Ks",
+    "9d 9c",
+    "Th Td Tc",
+    "3h 4c 5d 6s 7s",
+    "2h 5h 8h Jh Ah",
+    "Qd Qs Qc 4d 4s",
+    "8d 8s 8h 8c Jd",
+    "9s Ts Js Qs Ks",
+)
+
+
+def _parse_hand(cards: str) -> tuple[PlayingCard, ...]:
+    return tuple(PlayingCard(rank=card[0], suit=card[1]) for card in cards.split())
+
+
+def _complete(coroutine: Coroutine) -> object:
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("Benchmarked coroutine suspended")
+
+
+def _mid_game_state(num_moves: int = 6) -> ChinesePokerState:
+    game_logic = ChinesePokerGameLogic(_CONFIGURATION, Random(0))
+    state = game_logic.initial_state("Ana", "Bob", "Cid", "Dan")
+    while num_moves or state.status != ChinesePokerStatus.AWAIT_PLAYER_ACTION:
+        if state.status == ChinesePokerStatus.AWAIT_PLAYER_ACTION:
+            move = GreedyStrategy.choose_move(state, _CONFIGURATION)
+            state = game_logic.make_move(state, move)
+            num_moves -= 1
+        else:
+            state = game_logic.next_automated_state(state)
+    return state
+
+
+def bench_hand_value() -> Benchmark:
+    hands = [_parse_hand(hand) for hand in _HANDS]
+    return lambda: [hand_value(hand) for hand in hands]
+
+
+def bench_validate_move() -> Benchmark:
+    state = _mid_game_state()
+    move = GreedyStrategy.choose_move(state, _CONFIGURATION)
+    context = MoveContext(state=state, move=move, configuration=_CONFIGURATION)
+    return lambda: validate_move(context)
+
+
+def bench_shared_view() -> Benchmark:
+    state = _mid_game_state()
+    return lambda: state.shared_view(_CONFIGURATION)
+
+
+def bench_players_shared_views() -> Benchmark:
+    players = _mid_game_state().players
+    return lambda: tuple(players_shared_views(players, 100))
+
+
+def bench_calculate_credits() -> Benchmark:
+    points = {"Ana": 3, "Bob": 17, "Cid": 9, "Dan": 0}
+    return lambda: calculate_credits(points, 100)
+
+
+def bench_parse_request() -> Benchmark:
+    event_bus = EventBus()
+    event_bus.subscribe(MakeMove, lambda _: None)
+    parser = RequestParser(event_bus)
+    raw_request = json.dumps(
+        {
+            "request_type": RequestType.MAKE_MOVE.value,
+            "payload": {"room_id": 1, "move": {"cards": [{"rank": "3", "suit": "d"}]}},
+        }
+    )
+    return lambda: _complete(
+        parser.parse_request(Request(player_id="Ana", raw_request=raw_request))
+    )
+
+
+def bench_event_bus_publish() -> Benchmark:
+    async def _async_handler(_):
+        pass
+
+    event_bus = EventBus()
+    for _ in range(3):
+        event_bus.subscribe(PlayerDisconnected, lambda _: None)
+    for _ in range(2):
+        event_bus.subscribe(PlayerDisconnected, _async_handler)
+    event = PlayerDisconnected("Ana")
+    return lambda: _complete(event_bus.publish(event))
+
+
+def bench_message_dump_json() -> Benchmark:
+    state = _mid_game_state()
+    message = Message(
+        message_type=MessageType.GAME_STATE,
+        payload={
+            "room_id": 1,
+            "shared_view": state.shared_view(_CONFIGURATION).model_dump(),
+        },
+    )
+    return message.model_dump_json
+
+
+def bench_tic_tac_toe_winner() -> Benchmark:
+    state = TicTacToeState(
+        (
+            TicTacToePlayer(player_id="Ana", selections={0, 5, 7}),
+            TicTacToePlayer(player_id="Bob", selections={1, 2, 4}),
+        )
+    )
+    return state._winner
+
+
+def bench_deal_hands() -> Benchmark:
+    rng = Random(0)
+    return lambda: tuple(deal_hands(4, 13, rng))
+
+
+BENCHMARKS: dict[str, Callable[[], Benchmark]] = {
+    "hand_value": bench_hand_value,
+    "validate_move": bench_validate_move,
+    "chinese_poker_shared_view": bench_shared_view,
+    "players_shared_views": bench_players_shared_views,
+    "calculate_credits": bench_calculate_credits,
+    "parse_request": bench_parse_request,
+    "event_bus_publish": bench_event_bus_publish,
+    "message_dump_json": bench_message_dump_json,
+    "tic_tac_toe_winner": bench_tic_tac_toe_winner,
+    "deal_hands": bench_deal_hands,
+}
@@ -0,0 +1,65 @@
+import argparse
+import sys
+from typing import Optional
+
+from gamehub.benchmarks.baselines import (
+    compare_runs,
+    git_revision,
+    load_run,
+    save_run,
+)
+from gamehub.benchmarks.cases import BENCHMARKS
+from gamehub.benchmarks.runner import BenchmarkResult, run_benchmarks
+
+DEFAULT_DIRECTORY = ".benchmarks"
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(
+        f"{result.name:<28} {result.best_seconds * 1e6:>10.2f} us "
+        f"(median {result.median_seconds * 1e6:.2f} us)"
+    )
+
+
+def _run(args: argparse.Namespace) -> None:
+    revision = args.revision or git_revision()
+    run = run_benchmarks(revision, args.only, args.repeat, on_result=_print_result)
+    print(f"Saved {save_run(run, args.directory)}")
+
+
+def _compare(args: argparse.Namespace) -> None:
+    try:
+        baseline = load_run(args.baseline, args.directory)
+        current = load_run(args.current or git_revision(), args.directory)
+    except FileNotFoundError as e:
+        sys.exit(f"No benchmark baseline at {e.filename}")
+    comparisons = compare_runs(baseline, current, args.threshold)
+    print(f"{baseline.revision} -> {current.revision}")
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison.is_regression else ""
+        print(
+            f"{comparison.name:<28} {comparison.baseline_seconds * 1e6:>10.2f} us "
+            f"-> {comparison.current_seconds * 1e6:>10.2f} us "
+            f"{comparison.change:>+8.1%} {flag}".rstrip()
+        )
+    if regressions := [c.name for c in comparisons if c.is_regression]:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run and compare microbenchmarks")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run benchmarks, save a baseline")
+    run_parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--revision", help="Defaults to the git revision")
+    run_parser.set_defaults(handler=_run)
+    compare_parser = commands.add_parser("compare", help="Compare two baselines")
+    compare_parser.add_argument("baseline", help="Revision or path of a baseline")
+    compare_parser.add_argument("current", nargs="?", help="Defaults to git revision")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    compare_parser.set_defaults(handler=_compare)
+    args = parser.parse_args(argv)
+    args.handler(args)
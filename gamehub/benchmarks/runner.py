@@ -0,0 +1,82 @@
+import platform
+import statistics
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+from gamehub.benchmarks.cases import BENCHMARKS, Benchmark
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    best_seconds: float
+    median_seconds: float
+    calls_per_repeat: int
+
+
+@dataclass(frozen=True)
+class BenchmarkRun:
+    revision: str
+    created_at: str
+    python_version: str
+    results: tuple[BenchmarkResult, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "revision": self.revision,
+            "created_at": self.created_at,
+            "python_version": self.python_version,
+            "results": {
+                result.name: {
+                    "best_seconds": result.best_seconds,
+                    "median_seconds": result.median_seconds,
+                    "calls_per_repeat": result.calls_per_repeat,
+                }
+                for result in self.results
+            },
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "BenchmarkRun":
+        return BenchmarkRun(
+            revision=data["revision"],
+            created_at=data["created_at"],
+            python_version=data["python_version"],
+            results=tuple(
+                BenchmarkResult(name=name, **result)
+                for name, result in data["results"].items()
+            ),
+        )
+
+
+def measure(name: str, benchmark: Benchmark, repeat: int = 5) -> BenchmarkResult:
+    timer = timeit.Timer(benchmark)
+    calls, _ = timer.autorange()
+    timings = [elapsed / calls for elapsed in timer.repeat(repeat, calls)]
+    return BenchmarkResult(
+        name=name,
+        best_seconds=min(timings),
+        median_seconds=statistics.median(timings),
+        calls_per_repeat=calls,
+    )
+
+
+def run_benchmarks(
+    revision: str,
+    names: Optional[Iterable[str]] = None,
+    repeat: int = 5,
+    on_result: Callable[[BenchmarkResult], None] = lambda _: None,
+) -> BenchmarkRun:
+    results = []
+    for name in BENCHMARKS if names is None else names:
+        result = measure(name, BENCHMARKS[name](), repeat)
+        on_result(result)
+        results.append(result)
+    return BenchmarkRun(
+        revision=revision,
+        created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        python_version=platform.python_version(),
+        results=tuple(results),
+    )
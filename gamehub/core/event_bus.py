@@ -1,5 +1,8 @@
 import asyncio
-from collections import defaultdict
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from enum import Enum
 from typing import Awaitable, Callable, Type, TypeVar
 
 E = TypeVar("E")
@@ -7,20 +10,88 @@ S = Callable[[E], None]
 A = Callable[[E], Awaitable[None]]
 
 
+class DispatchPolicy(Enum):
+    SEQUENTIAL = "SEQUENTIAL"
+    CONCURRENT = "CONCURRENT"
+    FIRE_AND_FORGET = "FIRE_AND_FORGET"
+
+
+@dataclass(frozen=True)
+class _Dispatch:
+    sync_handlers: tuple[S, ...]
+    async_handlers: tuple[A, ...]
+    policy: DispatchPolicy
+
+
 class EventBus:
-    def __init__(self):
+    def __init__(self, max_errors: int = 100):
         self._sync_handlers = defaultdict(list)
         self._async_handlers = defaultdict(list)
+        self._dispatch_policies = {}
+        self._dispatch_table = {}
+        self._background_tasks = set()
+        self._errors: deque[Exception] = deque(maxlen=max_errors)
 
     def subscribe(self, event_type: Type[E], handler: S | A) -> None:
         if asyncio.iscoroutinefunction(handler):
             self._async_handlers[event_type].append(handler)
         else:
             self._sync_handlers[event_type].append(handler)
+        self._dispatch_table.clear()
+
+    def set_dispatch_policy(self, event_type: Type[E], policy: DispatchPolicy) -> None:
+        self._dispatch_policies[event_type] = policy
+        self._dispatch_table.clear()
+
+    @staticmethod
+    def _handlers_along_mro(handlers: dict[type, list], mro: tuple[type, ...]) -> tuple:
+        return tuple(h for t in mro if t in handlers for h in handlers[t])
+
+    def _compile_dispatch(self, event_type: Type[E]) -> _Dispatch:
+        mro = event_type.__mro__
+        policies = (
+            self._dispatch_policies[t] for t in mro if t in self._dispatch_policies
+        )
+        dispatch = _Dispatch(
+            sync_handlers=self._handlers_along_mro(self._sync_handlers, mro),
+            async_handlers=self._handlers_along_mro(self._async_handlers, mro),
+            policy=next(policies, DispatchPolicy.SEQUENTIAL),
+        )
+        self._dispatch_table[event_type] = dispatch
+        return dispatch
+
+    @property
+    def errors(self) -> list[Exception]:
+        return list(self._errors)
+
+    def _collect_background_task(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and (error := task.exception()):
+            logging.error(f"Event handler failed: {error}", exc_info=error)
+            self._errors.append(error)
+
+    def _fire_and_forget(self, event: E, handlers: tuple[A, ...]) -> None:
+        for async_handler in handlers:
+            task = asyncio.create_task(async_handler(event))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._collect_background_task)
 
     async def publish(self, event: E) -> None:
-        event_type = type(event)
-        for sync_handler in self._sync_handlers[event_type]:
+        dispatch = self._dispatch_table.get(type(event))
+        if dispatch is None:
+            dispatch = self._compile_dispatch(type(event))
+        for sync_handler in dispatch.sync_handlers:
             sync_handler(event)
-        for async_handler in self._async_handlers[event_type]:
-            await async_handler(event)
+        async_handlers = dispatch.async_handlers
+        policy = dispatch.policy
+        if policy == DispatchPolicy.CONCURRENT:
+            await asyncio.gather(*(handler(event) for handler in async_handlers))
+        elif policy == DispatchPolicy.FIRE_AND_FORGET:
+            self._fire_and_forget(event, async_handlers)
+        else:
+            for async_handler in async_handlers:
+                await async_handler(event)
+
+    async def join(self) -> None:
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
@@ -1,20 +1,110 @@
 import asyncio
+import heapq
+import logging
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Optional
 
 from gamehub.core.event_bus import EventBus
 
+_MAX_CANCELLED_SHARE = 0.5
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+    due_at: float
+    sequence: int
+    event: any = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+    is_queued: bool = field(default=True, compare=False)
+
 
 class EventScheduler:
     def __init__(self, event_bus: EventBus) -> None:
         self._event_bus = event_bus
+        self._queue: list[ScheduledEvent] = []
+        self._num_pending = 0
+        self._num_cancelled = 0
+        self._sequence = count()
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self._publishing: set[asyncio.Task] = set()
+
+    @property
+    def num_pending_events(self) -> int:
+        return self._num_pending
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    def schedule_event(self, event: any, delay_seconds: int) -> ScheduledEvent:
+        due_at = asyncio.get_running_loop().time() + delay_seconds
+        scheduled = ScheduledEvent(due_at, next(self._sequence), event)
+        heapq.heappush(self._queue, scheduled)
+        self._num_pending += 1
+        if self._queue[0] is scheduled:
+            self._wakeup.set()
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+        return scheduled
+
+    def cancel_event(self, scheduled: ScheduledEvent) -> None:
+        if scheduled.cancelled or not scheduled.is_queued:
+            return
+        scheduled.cancelled = True
+        self._num_pending -= 1
+        self._num_cancelled += 1
+        if self._num_cancelled > len(self._queue) * _MAX_CANCELLED_SHARE:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._queue = [
+            scheduled for scheduled in self._queue if not scheduled.cancelled
+        ]
+        heapq.heapify(self._queue)
+        self._num_cancelled = 0
+        self._wakeup.set()
+
+    def _pop(self) -> ScheduledEvent:
+        scheduled = heapq.heappop(self._queue)
+        scheduled.is_queued = False
+        if scheduled.cancelled:
+            self._num_cancelled -= 1
+        else:
+            self._num_pending -= 1
+        return scheduled
+
+    async def _wait_until(self, due_at: float) -> None:
+        self._wakeup.clear()
+        delay = due_at - asyncio.get_running_loop().time()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except TimeoutError:
+            pass
+
+    def _collect_publishing(self, task: asyncio.Task) -> None:
+        self._publishing.discard(task)
+        if not task.cancelled() and (error := task.exception()):
+            logging.error(f"Failed to publish scheduled event: {error}", exc_info=error)
 
-    def schedule_event(self, event: any, delay_seconds: int) -> asyncio.Task:
-        async def schedule_event():
-            await asyncio.sleep(delay_seconds)
-            await self._event_bus.publish(event)
+    def _publish(self, event: any) -> None:
+        task = asyncio.create_task(self._event_bus.publish(event))
+        self._publishing.add(task)
+        task.add_done_callback(self._collect_publishing)
 
-        return asyncio.create_task(schedule_event())
+    async def join(self) -> None:
+        while self._publishing:
+            await asyncio.gather(*self._publishing, return_exceptions=True)
 
-    @staticmethod
-    def cancel_event(task: asyncio.Task) -> None:
-        if not task.done():
-            task.cancel()
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            scheduled = self._queue[0]
+            if scheduled.cancelled:
+                self._pop()
+            elif scheduled.due_at > loop.time():
+                await self._wait_until(scheduled.due_at)
+            else:
+                self._publish(self._pop().event)
+        self._runner = None
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class _GameLogEvent:
+    room_id: int
+
+
+@dataclass(frozen=True)
+class GameCreated(_GameLogEvent):
+    game_type: str
+    player_ids: tuple[str, ...]
+    seed: int
+
+
+@dataclass(frozen=True)
+class MoveAccepted(_GameLogEvent):
+    move: dict
+
+
+@dataclass(frozen=True)
+class GameFinished(_GameLogEvent): ...
@@ -14,6 +14,7 @@ class GameStateUpdate(_GameStateEvent):
     shared_view: BaseModel
     private_views: dict[str, BaseModel]
     recipients: Iterable[str]
+    intermediate_shared_views: tuple[BaseModel, ...] = ()
 
 
 @dataclass(frozen=True)
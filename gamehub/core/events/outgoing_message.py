@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from gamehub.core.message import Message
 
@@ -7,3 +8,17 @@ from gamehub.core.message import Message
 class OutgoingMessage:
     player_id: str
     message: Message
+
+
+@dataclass(frozen=True)
+class OutgoingBroadcast:
+    recipients: tuple[str, ...]
+    message: Message
+
+
+@dataclass(frozen=True)
+class OutgoingResume:
+    player_id: str
+    last_seen: int
+    fallback: tuple[Message, ...]
+    buffer_id: Optional[str] = None
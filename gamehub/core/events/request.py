@@ -9,6 +9,8 @@ class RequestType(Enum):
     WATCH_GAME = "WATCH_GAME"
     JOIN_GAME_BY_TYPE = "JOIN_GAME_BY_TYPE"
     MAKE_MOVE = "MAKE_MOVE"
+    SYNC_GAME = "SYNC_GAME"
+    SET_UPDATE_MODE = "SET_UPDATE_MODE"
 
 
 class Request(BaseModel):
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -11,12 +12,19 @@ class DirectedRequest(BaseModel):
 class JoinGameById(DirectedRequest): ...
 
 
-class RejoinGame(DirectedRequest): ...
+class RejoinGame(DirectedRequest):
+    last_seen: Optional[int] = None
+    buffer_id: Optional[str] = None
 
 
 class WatchGame(DirectedRequest): ...
 
 
+class SyncGame(DirectedRequest):
+    last_seen: Optional[int] = None
+    buffer_id: Optional[str] = None
+
+
 class MakeMove(DirectedRequest):
     move: dict
 
@@ -26,6 +34,11 @@ class JoinGameByType(BaseModel):
     game_type: str
 
 
+class SetUpdateMode(BaseModel):
+    player_id: str
+    delta_updates: bool
+
+
 @dataclass(frozen=True)
 class RequestFailed:
     player_id: str
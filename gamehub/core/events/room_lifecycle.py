@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RoomCreated:
+    room_id: int
+    game_type: str
+
+
+@dataclass(frozen=True)
+class RoomRestored:
+    room_id: int
+    player_ids: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RoomRemoved:
+    room_id: int
+
+
+@dataclass(frozen=True)
+class ReclaimIdleRoom:
+    room_id: int
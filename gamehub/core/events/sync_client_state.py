@@ -14,3 +14,5 @@ class SyncClientState(Generic[T]):
     room_state: RoomState[T]
     shared_view: Optional[BaseModel] = None
     private_view: Optional[BaseModel] = None
+    last_seen: Optional[int] = None
+    buffer_id: Optional[str] = None
@@ -17,6 +17,12 @@ class GameLogic(Protocol, Generic[S, M, C]):
     @property
     def configuration(self) -> Optional[C]: ...
 
+    def reseed(self, seed: int) -> None: ...
+
+    def random_state(self) -> object: ...
+
+    def restore_random_state(self, state: object) -> None: ...
+
     def initial_state(self, *player_ids: str) -> S: ...
 
     def make_move(self, state: S, move: M) -> S: ...
@@ -27,6 +33,4 @@ class GameLogic(Protocol, Generic[S, M, C]):
         self, state: S, room_id: int, recipients: Iterable[str]
     ) -> Iterator[object]: ...
 
-    def state_after_timeout(
-        self, state: S, timed_out_player_id: str
-    ) -> Optional[S]: ...
+    def timeout_move(self, state: S, timed_out_player_id: str) -> Optional[M]: ...
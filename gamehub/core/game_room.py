@@ -1,17 +1,25 @@
-from typing import Generic, Iterator, Optional, TypeVar
+import asyncio
+import logging
+import random
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
 
 from pydantic import ValidationError
 
 from gamehub.core.event_bus import EventBus
+from gamehub.core.events.game_log import GameCreated, GameFinished, MoveAccepted
 from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import GameStateUpdate
 from gamehub.core.events.request_events import RequestFailed
+from gamehub.core.events.room_lifecycle import RoomRestored
 from gamehub.core.events.sync_client_state import SyncClientState
 from gamehub.core.exceptions import InvalidMoveError
 from gamehub.core.game_logic import GameLogic
 from gamehub.core.game_state import GameState
+from gamehub.core.move_log import RoomLog
 from gamehub.core.move_parser import MoveParser
+from gamehub.core.room_snapshot import RoomSnapshot
 from gamehub.core.room_state import RoomState
+from gamehub.core.transition_policy import TransitionPolicy
 
 S = TypeVar("S", bound=GameState)
 C = TypeVar("C")
@@ -25,15 +33,21 @@ class GameRoom(Generic[S, M, C]):
         game_logic: GameLogic[S, M, C],
         move_parser: MoveParser[M],
         event_bus: EventBus,
+        transition_policy: Optional[TransitionPolicy] = None,
     ):
         self._room_id = room_id
         self._logic = game_logic
         self._event_bus = event_bus
+        self._transition_policy = transition_policy or TransitionPolicy()
         self._players = list()
         self._spectators = set()
         self._offline_players = set()
         self._game_state = None
+        self._seed: Optional[int] = None
+        self._num_inputs = 0
         self._parse_move = move_parser
+        self._last_chain_length = 0
+        self._longest_chain_length = 0
 
     @property
     def game_type(self) -> str:
@@ -43,6 +57,17 @@ class GameRoom(Generic[S, M, C]):
     def is_full(self) -> bool:
         return len(self._players) >= self._logic.num_players
 
+    @property
+    def num_players(self) -> int:
+        return len(self._players)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._players and not self._spectators
+
+    def members(self) -> frozenset[str]:
+        return frozenset(self._notification_recipients())
+
     def _notification_recipients(self) -> Iterator[str]:
         yield from self._players
         yield from self._spectators
@@ -53,17 +78,95 @@ class GameRoom(Generic[S, M, C]):
         self._offline_players = set()
         self._game_state = None
 
-    async def _set_game_state(self, state: S) -> None:
-        self._game_state = state
-        await self._notify_game_state_update()
+    async def _publish_derived_events(self, state: S) -> None:
         for derived_event in self._logic.derived_events(
             state, self._room_id, recipients=list(self._notification_recipients())
         ):
             await self._event_bus.publish(derived_event)
+
+    async def _yield_to_other_rooms(self, state: S, num_steps: int) -> bool:
+        yield_every_steps = self._transition_policy.yield_every_steps
+        if yield_every_steps and num_steps % yield_every_steps == 0:
+            await asyncio.sleep(0)
+        return self._game_state is state
+
+    def _next_automated_state(self, state: S) -> Optional[S]:
         if state.is_terminal():
+            return None
+        return self._logic.next_automated_state(state)
+
+    def _exceeds_step_limit(self, num_steps: int) -> bool:
+        if num_steps < self._transition_policy.max_automated_steps:
+            return False
+        logging.error(
+            f"Room {self._room_id} exceeded {num_steps} automated transitions"
+        )
+        return True
+
+    async def _abandon_game(self) -> None:
+        recipients = list(self._notification_recipients())
+        for player_id in recipients:
+            await self._event_bus.publish(
+                RequestFailed(player_id, "Game abandoned: it stopped making progress")
+            )
+        self._reset()
+        await self._event_bus.publish(GameFinished(room_id=self._room_id))
+        await self._event_bus.publish(GameRoomUpdate(self.room_state(), recipients))
+
+    async def _set_game_state(self, state: S) -> None:
+        policy = self._transition_policy
+        private_views = {}
+        intermediate_shared_views = []
+        num_steps = 0
+        is_stuck = False
+        while True:
+            self._game_state = state
+            if policy.coalesce_updates:
+                private_views.update(state.private_views())
+            else:
+                await self._notify_game_state_update()
+            await self._publish_derived_events(state)
+            if not (next_state := self._next_automated_state(state)):
+                break
+            if is_stuck := self._exceeds_step_limit(num_steps):
+                break
+            if policy.include_intermediate_views:
+                intermediate_shared_views.append(
+                    state.shared_view(self._logic.configuration)
+                )
+            num_steps += 1
+            if not await self._yield_to_other_rooms(state, num_steps):
+                self._record_chain_length(num_steps)
+                return
+            state = next_state
+        self._record_chain_length(num_steps)
+        if policy.coalesce_updates:
+            await self._event_bus.publish(
+                GameStateUpdate(
+                    room_id=self._room_id,
+                    shared_view=state.shared_view(self._logic.configuration),
+                    private_views=private_views,
+                    recipients=list(self._notification_recipients()),
+                    intermediate_shared_views=tuple(intermediate_shared_views),
+                )
+            )
+        if is_stuck:
+            await self._abandon_game()
+        elif state.is_terminal():
             self._reset()
-        elif new_state := self._logic.next_automated_state(state):
-            await self._set_game_state(new_state)
+            await self._event_bus.publish(GameFinished(room_id=self._room_id))
+
+    def _record_chain_length(self, num_steps: int) -> None:
+        self._last_chain_length = num_steps
+        self._longest_chain_length = max(self._longest_chain_length, num_steps)
+
+    @property
+    def last_chain_length(self) -> int:
+        return self._last_chain_length
+
+    @property
+    def longest_chain_length(self) -> int:
+        return self._longest_chain_length
 
     @property
     def room_id(self) -> int:
@@ -97,8 +200,78 @@ class GameRoom(Generic[S, M, C]):
         )
 
     async def _start_game(self) -> None:
+        seed = random.getrandbits(63)
+        self._logic.reseed(seed)
+        self._seed = seed
+        self._num_inputs = 0
+        await self._event_bus.publish(
+            GameCreated(
+                room_id=self._room_id,
+                game_type=self.game_type,
+                player_ids=tuple(self._players),
+                seed=seed,
+            )
+        )
         await self._set_game_state(self._logic.initial_state(*self._players))
 
+    def _fast_forward(self, state: S) -> S:
+        num_steps = 0
+        while next_state := self._next_automated_state(state):
+            if self._exceeds_step_limit(num_steps):
+                break
+            state = next_state
+            num_steps += 1
+        return state
+
+    def _replay(self, state: S, inputs: Iterable[MoveAccepted]) -> S:
+        for game_input in inputs:
+            move = self._parse_move(game_input.move)
+            state = self._fast_forward(self._logic.make_move(state, move))
+        return state
+
+    async def _resume(self, player_ids: Iterable[str], seed: int, state: S) -> None:
+        if state.is_terminal():
+            return
+        self._players = list(player_ids)
+        self._offline_players = set(self._players)
+        self._game_state = state
+        self._seed = seed
+        await self._event_bus.publish(
+            RoomRestored(room_id=self._room_id, player_ids=tuple(self._players))
+        )
+        await self._notify_room_state_update()
+        await self._publish_derived_events(state)
+
+    async def restore(self, room_log: RoomLog) -> None:
+        self._logic.reseed(room_log.seed)
+        state = self._fast_forward(self._logic.initial_state(*room_log.player_ids))
+        state = self._replay(state, room_log.inputs)
+        self._num_inputs = len(room_log.inputs)
+        await self._resume(room_log.player_ids, room_log.seed, state)
+
+    def snapshot(self) -> Optional[RoomSnapshot]:
+        if self._game_state is None:
+            return None
+        return RoomSnapshot(
+            room_id=self._room_id,
+            game_type=self.game_type,
+            player_ids=tuple(self._players),
+            game_state=self._game_state,
+            seed=self._seed,
+            num_inputs=self._num_inputs,
+            random_state=self._logic.random_state(),
+        )
+
+    async def restore_snapshot(
+        self,
+        snapshot: RoomSnapshot,
+        inputs: tuple[MoveAccepted, ...] = (),
+    ) -> None:
+        self._logic.restore_random_state(snapshot.random_state)
+        state = self._replay(snapshot.game_state, inputs)
+        self._num_inputs = snapshot.num_inputs + len(inputs)
+        await self._resume(snapshot.player_ids, snapshot.seed, state)
+
     def _add_player(self, player_id: str) -> None:
         self._players.append(player_id)
         if player_id in self._spectators:
@@ -119,7 +292,12 @@ class GameRoom(Generic[S, M, C]):
             if self.is_full:
                 await self._start_game()
 
-    async def rejoin(self, player_id: str) -> None:
+    async def rejoin(
+        self,
+        player_id: str,
+        last_seen: Optional[int] = None,
+        buffer_id: Optional[str] = None,
+    ) -> None:
         if player_id not in self._players:
             await self._event_bus.publish(
                 RequestFailed(player_id, "Player not in room")
@@ -130,8 +308,12 @@ class GameRoom(Generic[S, M, C]):
             )
         else:
             self._offline_players.remove(player_id)
-            await self._notify_room_state_update()
-            await self._sync_client_state(player_id)
+            if last_seen is None:
+                await self._notify_room_state_update()
+                await self._sync_client_state(player_id)
+            else:
+                await self._sync_client_state(player_id, last_seen, buffer_id)
+                await self._notify_room_state_update()
 
     async def add_spectator(self, player_id: str) -> None:
         if player_id in self._players:
@@ -144,7 +326,25 @@ class GameRoom(Generic[S, M, C]):
             self._spectators.add(player_id)
             await self._sync_client_state(player_id)
 
-    async def _sync_client_state(self, player_id: str) -> None:
+    async def sync(
+        self,
+        player_id: str,
+        last_seen: Optional[int] = None,
+        buffer_id: Optional[str] = None,
+    ) -> None:
+        if player_id not in self._players and player_id not in self._spectators:
+            await self._event_bus.publish(
+                RequestFailed(player_id, "Player not in room")
+            )
+        else:
+            await self._sync_client_state(player_id, last_seen, buffer_id)
+
+    async def _sync_client_state(
+        self,
+        player_id: str,
+        last_seen: Optional[int] = None,
+        buffer_id: Optional[str] = None,
+    ) -> None:
         await self._event_bus.publish(
             SyncClientState(
                 client_id=player_id,
@@ -159,6 +359,8 @@ class GameRoom(Generic[S, M, C]):
                     if self._game_state
                     else None
                 ),
+                last_seen=last_seen,
+                buffer_id=buffer_id,
             )
         )
 
@@ -187,7 +389,12 @@ class GameRoom(Generic[S, M, C]):
             )
         elif parsed_move := await self._parsed_move(player_id, move):
             if new_state := await self._game_state_after_move(player_id, parsed_move):
-                await self._set_game_state(new_state)
+                await self._accept_move({"player_id": player_id, **move}, new_state)
+
+    async def _accept_move(self, move: dict, new_state: S) -> None:
+        await self._event_bus.publish(MoveAccepted(room_id=self._room_id, move=move))
+        self._num_inputs += 1
+        await self._set_game_state(new_state)
 
     async def handle_player_disconnected(self, player_id: str) -> None:
         if player_id in self._players:
@@ -200,5 +407,9 @@ class GameRoom(Generic[S, M, C]):
             self._spectators.remove(player_id)
 
     async def handle_timeout(self, player_id: str) -> None:
-        if new_state := self._logic.state_after_timeout(self._game_state, player_id):
-            await self._set_game_state(new_state)
+        if (state := self._game_state) is None:
+            return
+        move = await asyncio.to_thread(self._logic.timeout_move, state, player_id)
+        if move and self._game_state is state:
+            new_state = self._logic.make_move(state, move)
+            await self._accept_move(move.model_dump(mode="json"), new_state)
@@ -0,0 +1,34 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from gamehub.core.game_room import GameRoom
+
+
+class MatchmakingIndex:
+    def __init__(self, rooms: Iterable[GameRoom] = ()):
+        self._free_rooms: dict[str, dict[int, dict[int, GameRoom]]] = defaultdict(dict)
+        self._indexed_fill_levels: dict[int, tuple[str, int]] = {}
+        for room in rooms:
+            self.update(room)
+
+    def remove(self, room_id: int) -> None:
+        if indexed := self._indexed_fill_levels.pop(room_id, None):
+            game_type, fill_level = indexed
+            buckets = self._free_rooms[game_type]
+            del buckets[fill_level][room_id]
+            if not buckets[fill_level]:
+                del buckets[fill_level]
+
+    def update(self, room: GameRoom) -> None:
+        fill_level = None if room.is_full else room.num_players
+        if self._indexed_fill_levels.get(room.room_id) == (room.game_type, fill_level):
+            return
+        self.remove(room.room_id)
+        if fill_level is not None:
+            buckets = self._free_rooms[room.game_type]
+            buckets.setdefault(fill_level, {})[room.room_id] = room
+            self._indexed_fill_levels[room.room_id] = (room.game_type, fill_level)
+
+    def most_filled_free_room(self, game_type: str) -> Optional[GameRoom]:
+        if buckets := self._free_rooms.get(game_type):
+            return next(iter(buckets[max(buckets)].values()))
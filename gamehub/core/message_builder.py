@@ -1,20 +1,52 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 from pydantic import BaseModel
 
 from gamehub.core.event_bus import EventBus
 from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import GameStateUpdate
-from gamehub.core.events.outgoing_message import OutgoingMessage
-from gamehub.core.events.request_events import RequestFailed
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
+from gamehub.core.events.request_events import RequestFailed, SetUpdateMode
+from gamehub.core.events.room_lifecycle import RoomRemoved
 from gamehub.core.events.sync_client_state import SyncClientState
 from gamehub.core.events.timer_events import TurnTimerAlert
 from gamehub.core.message import Message, MessageType, error_message
+from gamehub.core.shared_view_delta import SharedViewVersion, shared_view_delta
 
 
 class MessageBuilder:
     def __init__(self, event_bus: EventBus):
         self._event_bus = event_bus
+        self._delta_clients: set[str] = set()
+        self._shared_view_versions: dict[int, SharedViewVersion] = {}
+
+    def set_update_mode(self, update_mode: SetUpdateMode) -> None:
+        if update_mode.delta_updates:
+            self._delta_clients.add(update_mode.player_id)
+        else:
+            self._delta_clients.discard(update_mode.player_id)
+            self._forget_synced_client(update_mode.player_id)
+
+    def forget_client(self, player_disconnected: PlayerDisconnected) -> None:
+        self._delta_clients.discard(player_disconnected.player_id)
+        self._forget_synced_client(player_disconnected.player_id)
+
+    def _forget_synced_client(self, client_id: str) -> None:
+        for room_id, current in self._shared_view_versions.items():
+            if client_id in current.synced_clients:
+                self._shared_view_versions[room_id] = SharedViewVersion(
+                    current.version,
+                    current.shared_view,
+                    current.synced_clients - {client_id},
+                )
+
+    def forget_room(self, room_removed: RoomRemoved) -> None:
+        self._shared_view_versions.pop(room_removed.room_id, None)
 
     async def build_error_message(self, failed_request: RequestFailed) -> None:
         await self._event_bus.publish(
@@ -26,28 +58,40 @@ class MessageBuilder:
 
     async def notify_room_update(self, room_update: GameRoomUpdate) -> None:
         msg = self._room_state_message(room_update.room_state)
-        for recipient in room_update.recipients:
-            await self._event_bus.publish(
-                OutgoingMessage(player_id=recipient, message=msg)
-            )
+        await self._broadcast(room_update.recipients, msg)
 
     async def notify_game_state_update(self, game_update: GameStateUpdate) -> None:
         await self._notify_private_views(game_update)
         await self._broadcast_shared_view(game_update)
 
     async def sync_client_state(self, sync_state: SyncClientState) -> None:
-        msg = self._room_state_message(sync_state.room_state)
-        await self._event_bus.publish(
-            OutgoingMessage(player_id=sync_state.client_id, message=msg)
-        )
+        messages = [self._room_state_message(sync_state.room_state)]
         game_state_msg = self._game_state_message(
             room_id=sync_state.room_state.room_id,
             shared_view=sync_state.shared_view,
             private_view=sync_state.private_view,
         )
+        if sync_state.shared_view and sync_state.client_id in self._delta_clients:
+            game_state_msg.payload["version"] = self._mark_synced(
+                sync_state.room_state.room_id,
+                sync_state.client_id,
+                game_state_msg.payload["shared_view"],
+            )
         if len(game_state_msg.payload) > 1:
+            messages.append(game_state_msg)
+        if sync_state.last_seen is None:
+            for msg in messages:
+                await self._event_bus.publish(
+                    OutgoingMessage(player_id=sync_state.client_id, message=msg)
+                )
+        else:
             await self._event_bus.publish(
-                OutgoingMessage(player_id=sync_state.client_id, message=game_state_msg)
+                OutgoingResume(
+                    player_id=sync_state.client_id,
+                    last_seen=sync_state.last_seen,
+                    fallback=tuple(messages),
+                    buffer_id=sync_state.buffer_id,
+                )
             )
 
     async def notify_turn_timer_alert(self, turn_timer_alert: TurnTimerAlert) -> None:
@@ -61,9 +105,12 @@ class MessageBuilder:
                 ),
             },
         )
-        for recipient in turn_timer_alert.recipients:
+        await self._broadcast(turn_timer_alert.recipients, msg)
+
+    async def _broadcast(self, recipients: Iterable[str], msg: Message) -> None:
+        if recipients := tuple(recipients):
             await self._event_bus.publish(
-                OutgoingMessage(player_id=recipient, message=msg)
+                OutgoingBroadcast(recipients=recipients, message=msg)
             )
 
     @staticmethod
@@ -85,14 +132,75 @@ class MessageBuilder:
             payload["private_view"] = private_view.model_dump(exclude_none=True)
         return Message(message_type=MessageType.GAME_STATE, payload=payload)
 
+    def _mark_synced(self, room_id: int, client_id: str, shared_view: dict) -> int:
+        current = self._shared_view_versions.get(room_id)
+        if current is None or current.shared_view != shared_view:
+            version = current.version + 1 if current else 1
+            current = SharedViewVersion(version, shared_view, frozenset())
+        self._shared_view_versions[room_id] = SharedViewVersion(
+            current.version, shared_view, current.synced_clients | {client_id}
+        )
+        return current.version
+
+    @staticmethod
+    def _delta_message(
+        room_id: int, previous: SharedViewVersion, shared_view: dict
+    ) -> Message:
+        return Message(
+            message_type=MessageType.GAME_STATE_DELTA,
+            payload={
+                "room_id": room_id,
+                "version": previous.version + 1,
+                "base_version": previous.version,
+                "shared_view_delta": shared_view_delta(
+                    previous.shared_view, shared_view
+                ),
+            },
+        )
+
     async def _broadcast_shared_view(self, game_update):
-        shared_view_msg = self._game_state_message(
-            game_update.room_id, shared_view=game_update.shared_view, private_view=None
+        room_id = game_update.room_id
+        shared_view = game_update.shared_view.model_dump(exclude_none=True)
+        recipients = tuple(game_update.recipients)
+        previous = self._shared_view_versions.get(room_id)
+        version = previous.version + 1 if previous else 1
+
+        full_recipients, versioned_recipients, delta_recipients = [], [], []
+        for recipient in recipients:
+            if recipient not in self._delta_clients:
+                full_recipients.append(recipient)
+            elif previous and recipient in previous.synced_clients:
+                delta_recipients.append(recipient)
+            else:
+                versioned_recipients.append(recipient)
+        self._shared_view_versions[room_id] = SharedViewVersion(
+            version, shared_view, frozenset(versioned_recipients + delta_recipients)
         )
-        for recipient in game_update.recipients:
-            await self._event_bus.publish(
-                OutgoingMessage(player_id=recipient, message=shared_view_msg)
-            )
+
+        payload = {"room_id": room_id, "shared_view": shared_view}
+        if game_update.intermediate_shared_views:
+            payload["intermediate_shared_views"] = [
+                view.model_dump(exclude_none=True)
+                for view in game_update.intermediate_shared_views
+            ]
+        await self._broadcast(
+            full_recipients,
+            Message(message_type=MessageType.GAME_STATE, payload=payload),
+        )
+        await self._broadcast(
+            versioned_recipients,
+            Message(
+                message_type=MessageType.GAME_STATE,
+                payload={**payload, "version": version},
+            ),
+        )
+        if delta_recipients:
+            delta_msg = self._delta_message(room_id, previous, shared_view)
+            if "intermediate_shared_views" in payload:
+                delta_msg.payload["intermediate_shared_views"] = payload[
+                    "intermediate_shared_views"
+                ]
+            await self._broadcast(delta_recipients, delta_msg)
 
     async def _notify_private_views(self, game_update):
         for player_id, private_view in game_update.private_views.items():
@@ -1,7 +1,18 @@
 from typing import Protocol
 
-from gamehub.core.events.outgoing_message import OutgoingMessage
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
 
 
 class MessageSender(Protocol):
     async def send(self, message: OutgoingMessage) -> None: ...
+
+    async def broadcast(self, broadcast: OutgoingBroadcast) -> None: ...
+
+    async def resume(self, resume: OutgoingResume) -> None: ...
+
+    def forget_client(self, player_disconnected: PlayerDisconnected) -> None: ...
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import IO, Iterator, Optional
+
+from gamehub.core.events.game_log import GameCreated, GameFinished, MoveAccepted
+
+
+@dataclass(frozen=True)
+class RoomLog:
+    room_id: int
+    game_type: str
+    player_ids: tuple[str, ...]
+    seed: int
+    inputs: tuple[MoveAccepted, ...] = ()
+
+
+_CLOSE = object()
+
+
+def _encode_entry(entry: dict) -> str:
+    return json.dumps(entry, separators=(",", ":")) + "\n"
+
+
+class MoveLog:
+    def __init__(self, directory: str, fsync_interval_seconds: float = 0.05) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._files: dict[int, IO[str]] = {}
+        self._writer = threading.Thread(
+            target=self._write_entries, name="move-log", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _path(self, room_id: int) -> str:
+        return os.path.join(self._directory, f"room-{room_id}.log")
+
+    def set_aside(self, room_id: int) -> None:
+        if os.path.exists(path := self._path(room_id)):
+            os.replace(path, f"{path}.failed")
+            logging.warning(f"Moved unrestorable move log aside: {path}.failed")
+
+    def handle_game_created(self, event: GameCreated) -> None:
+        entry = {
+            "type": "created",
+            "game_type": event.game_type,
+            "player_ids": event.player_ids,
+            "seed": event.seed,
+        }
+        self._queue.put((event.room_id, _encode_entry(entry), True))
+
+    def handle_move_accepted(self, event: MoveAccepted) -> None:
+        entry = {"type": "move", "move": event.move}
+        self._queue.put((event.room_id, _encode_entry(entry), False))
+
+    def handle_game_finished(self, event: GameFinished) -> None:
+        self._queue.put((event.room_id, None, True))
+
+    def close(self) -> None:
+        self._queue.put(_CLOSE)
+        self._writer.join()
+
+    def _append(
+        self, room_id: int, line: Optional[str], truncate: bool
+    ) -> Optional[IO[str]]:
+        if truncate and (file := self._files.pop(room_id, None)):
+            file.close()
+        if line is None:
+            if os.path.exists(path := self._path(room_id)):
+                os.remove(path)
+            return None
+        if (file := self._files.get(room_id)) is None:
+            mode = "w" if truncate else "a"
+            file = self._files[room_id] = open(
+                self._path(room_id), mode, encoding="utf-8"
+            )
+        file.write(line)
+        return file
+
+    def _write_batch(self, batch: list) -> None:
+        touched = {}
+        for room_id, line, truncate in batch:
+            try:
+                if file := self._append(room_id, line, truncate):
+                    touched[room_id] = file
+                else:
+                    touched.pop(room_id, None)
+            except OSError as e:
+                logging.error(f"Unable to write move log of room {room_id}: {e}")
+        for file in touched.values():
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _write_entries(self) -> None:
+        closing = False
+        while not closing:
+            batch = [self._queue.get()]
+            started_at = time.monotonic()
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            closing = batch[-1] is _CLOSE
+            self._write_batch([item for item in batch if item is not _CLOSE])
+            elapsed = time.monotonic() - started_at
+            if not closing and elapsed < self._fsync_interval_seconds:
+                time.sleep(self._fsync_interval_seconds - elapsed)
+        for file in self._files.values():
+            file.close()
+
+
+def _read_entries(path: str) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def _room_log(room_id: int, path: str) -> Optional[RoomLog]:
+    entries = _read_entries(path)
+    created = next(entries, None)
+    if created is None or created["type"] != "created":
+        return None
+    inputs = tuple(
+        MoveAccepted(room_id=room_id, move=entry["move"]) for entry in entries
+    )
+    return RoomLog(
+        room_id=room_id,
+        game_type=created["game_type"],
+        player_ids=tuple(created["player_ids"]),
+        seed=created["seed"],
+        inputs=inputs,
+    )
+
+
+def load_room_logs(directory: str) -> list[RoomLog]:
+    room_logs = []
+    if not os.path.isdir(directory):
+        return room_logs
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.startswith("room-") and file_name.endswith(".log"):
+            room_id = int(file_name.removeprefix("room-").removesuffix(".log"))
+            if room_log := _room_log(room_id, os.path.join(directory, file_name)):
+                room_logs.append(room_log)
+    return room_logs
@@ -10,6 +10,8 @@ from gamehub.core.events.request_events import (
     MakeMove,
     RejoinGame,
     RequestFailed,
+    SetUpdateMode,
+    SyncGame,
     WatchGame,
 )
 
@@ -41,6 +43,8 @@ class RequestParser:
                 RequestType.WATCH_GAME: WatchGame,
                 RequestType.REJOIN_GAME: RejoinGame,
                 RequestType.MAKE_MOVE: MakeMove,
+                RequestType.SYNC_GAME: SyncGame,
+                RequestType.SET_UPDATE_MODE: SetUpdateMode,
             }
             event = event_cls[pre_parsed.request_type].model_validate(payload)
             await self._event_bus.publish(event)
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+RoomJob = Callable[[], Awaitable[None]]
+
+
+class RoomActor:
+    def __init__(self, room_id: int, inbox_size: int) -> None:
+        self._room_id = room_id
+        self._inbox: asyncio.Queue[RoomJob] = asyncio.Queue(maxsize=inbox_size)
+        self._worker: Optional[asyncio.Task] = None
+        self._max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._inbox.qsize()
+
+    @property
+    def max_queue_depth(self) -> int:
+        return self._max_queue_depth
+
+    @property
+    def is_idle(self) -> bool:
+        return self._worker is None
+
+    async def submit(self, job: RoomJob) -> None:
+        await self._inbox.put(job)
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def _process(self, job: RoomJob) -> None:
+        try:
+            await job()
+        except Exception as e:
+            logging.error(
+                f"Room {self._room_id} failed to process job: {e}", exc_info=True
+            )
+
+    async def _run(self) -> None:
+        while not self._inbox.empty():
+            await self._process(self._inbox.get_nowait())
+        self._worker = None
+
+    async def join(self) -> None:
+        while (worker := self._worker) is not None:
+            await worker
+
+    def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
@@ -1,6 +1,12 @@
-from typing import Awaitable, Callable, Iterator, Optional
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+from functools import partial
+from typing import Awaitable, Callable, Iterable, Iterator, Optional
 
 from gamehub.core.event_bus import EventBus
+from gamehub.core.event_scheduler import EventScheduler
 from gamehub.core.events.player_disconnected import PlayerDisconnected
 from gamehub.core.events.request_events import (
     DirectedRequest,
@@ -9,17 +15,83 @@ from gamehub.core.events.request_events import (
     MakeMove,
     RejoinGame,
     RequestFailed,
+    SyncGame,
     WatchGame,
 )
+from gamehub.core.events.room_lifecycle import ReclaimIdleRoom, RoomCreated, RoomRemoved
 from gamehub.core.events.timer_events import TurnTimeout
 from gamehub.core.game_room import GameRoom
+from gamehub.core.matchmaking import MatchmakingIndex
+from gamehub.core.move_log import RoomLog
+from gamehub.core.room_actor import RoomActor, RoomJob
+from gamehub.core.room_pool import RoomPool
+from gamehub.core.room_snapshot import RoomSnapshot
 from gamehub.core.room_state import RoomState
 
 
 class RoomManager:
-    def __init__(self, rooms: list[GameRoom], event_bus: EventBus):
+    def __init__(
+        self,
+        rooms: list[GameRoom],
+        event_bus: EventBus,
+        room_pool: Optional[RoomPool] = None,
+        event_scheduler: Optional[EventScheduler] = None,
+        wait_for_room: bool = False,
+    ):
         self._rooms = {room.room_id: room for room in rooms}
+        self._matchmaking = MatchmakingIndex(rooms)
+        self._wait_for_room = wait_for_room
+        self._waiting_players: dict[str, dict[str, None]] = defaultdict(dict)
+        self._room_members: dict[int, frozenset[str]] = {}
+        self._player_rooms: dict[str, set[int]] = defaultdict(set)
+        self._pending_rooms: dict[str, Counter[int]] = defaultdict(Counter)
+        for room in rooms:
+            self._index_members(room)
         self._event_bus = event_bus
+        self._room_pool = room_pool or RoomPool()
+        self._actors: dict[int, RoomActor] = {}
+        for room in rooms:
+            self._add_actor(room)
+        self._scheduler = event_scheduler
+        self._next_room_id = self._room_pool.next_room_id(max(self._rooms, default=0))
+        self._spawned_rooms_idle_since: dict[int, Optional[float]] = {}
+
+    def _add_actor(self, room: GameRoom) -> None:
+        if self._room_pool.inbox_size is not None:
+            self._actors[room.room_id] = RoomActor(
+                room.room_id, self._room_pool.inbox_size
+            )
+
+    async def _dispatch(self, room: GameRoom, job: RoomJob) -> None:
+        if (actor := self._actors.get(room.room_id)) is None:
+            await job()
+        else:
+            await actor.submit(job)
+
+    async def _dispatch_for_player(
+        self, room: GameRoom, player_id: str, job: RoomJob
+    ) -> None:
+        self._pending_rooms[player_id][room.room_id] += 1
+
+        async def tracked_job():
+            try:
+                await job()
+            finally:
+                pending_rooms = self._pending_rooms[player_id]
+                pending_rooms[room.room_id] -= 1
+                if pending_rooms[room.room_id] == 0:
+                    del pending_rooms[room.room_id]
+                if not pending_rooms:
+                    del self._pending_rooms[player_id]
+
+        await self._dispatch(room, tracked_job)
+
+    def queue_depths(self) -> dict[int, int]:
+        return {room_id: actor.queue_depth for room_id, actor in self._actors.items()}
+
+    async def join(self) -> None:
+        while busy_actors := [a for a in self._actors.values() if not a.is_idle]:
+            await asyncio.gather(*(actor.join() for actor in busy_actors))
 
     async def _raise_error_event(self, player_id: str, payload: str) -> None:
         await self._event_bus.publish(
@@ -36,7 +108,12 @@ class RoomManager:
                 request.player_id, f"Room with id {request.room_id} does not exist"
             )
         else:
-            await handler(room, request.player_id)
+
+            async def job():
+                await handler(room, request.player_id)
+                await self._refresh_room(room)
+
+            await self._dispatch_for_player(room, request.player_id, job)
 
     async def join_game_by_id(self, request: JoinGameById) -> None:
         async def handler(room, player_id):
@@ -46,7 +123,7 @@ class RoomManager:
 
     async def rejoin_game(self, request: RejoinGame) -> None:
         async def handler(room, player_id):
-            await room.rejoin(player_id)
+            await room.rejoin(player_id, request.last_seen, request.buffer_id)
 
         await self._handle_directed_request(request, handler)
 
@@ -56,21 +133,57 @@ class RoomManager:
 
         await self._handle_directed_request(request, handler)
 
+    async def sync_game(self, request: SyncGame) -> None:
+        async def handler(room, player_id):
+            await room.sync(player_id, request.last_seen, request.buffer_id)
+
+        await self._handle_directed_request(request, handler)
+
     def _rooms_by_game_type(self, game_type: str) -> Iterator[GameRoom]:
         for room in self._rooms.values():
             if room.game_type == game_type:
                 yield room
 
+    async def _spawn_room(
+        self, game_type: str, room_id: Optional[int] = None
+    ) -> Optional[GameRoom]:
+        if self._room_pool.can_spawn_room(game_type, num_rooms=len(self._rooms)):
+            room_id = self._next_room_id if room_id is None else room_id
+            room = self._room_pool.room_factories[game_type](room_id)
+            if room.room_id >= self._next_room_id:
+                self._next_room_id = self._room_pool.next_room_id(room.room_id)
+            self._rooms[room.room_id] = room
+            self._add_actor(room)
+            self._spawned_rooms_idle_since[room.room_id] = None
+            self._matchmaking.update(room)
+            await self._event_bus.publish(
+                RoomCreated(room_id=room.room_id, game_type=game_type)
+            )
+            return room
+
+    async def _available_room(self, game_type: str) -> Optional[GameRoom]:
+        if room := self._matchmaking.most_filled_free_room(game_type):
+            return room
+        return await self._spawn_room(game_type)
+
     async def join_game_by_type(self, join_game: JoinGameByType) -> None:
-        for room in self._rooms_by_game_type(join_game.game_type):
-            if not room.is_full:
-                await room.join(join_game.player_id)
-                return
-
-        await self._raise_error_event(
-            join_game.player_id,
-            f"No available room for game type {join_game.game_type}",
-        )
+        if room := await self._available_room(join_game.game_type):
+
+            async def job():
+                if room.is_full:
+                    await self.join_game_by_type(join_game)
+                else:
+                    await room.join(join_game.player_id)
+                    await self._refresh_room(room)
+
+            await self._dispatch_for_player(room, join_game.player_id, job)
+        elif self._wait_for_room:
+            self._waiting_players[join_game.game_type][join_game.player_id] = None
+        else:
+            await self._raise_error_event(
+                join_game.player_id,
+                f"No available room for game type {join_game.game_type}",
+            )
 
     async def make_move(self, make_move: MakeMove) -> None:
         if not (room := self._rooms.get(make_move.room_id)):
@@ -78,13 +191,29 @@ class RoomManager:
                 make_move.player_id, f"Room with id {make_move.room_id} does not exist"
             )
         else:
-            await room.make_move(make_move.player_id, make_move.move)
+
+            async def job():
+                await room.make_move(make_move.player_id, make_move.move)
+                await self._refresh_room(room)
+
+            await self._dispatch(room, job)
 
     async def handle_player_disconnected(
         self, player_disconnected: PlayerDisconnected
     ) -> None:
-        for room in self._rooms.values():
-            await room.handle_player_disconnected(player_disconnected.player_id)
+        for waiting_players in self._waiting_players.values():
+            waiting_players.pop(player_disconnected.player_id, None)
+        player_id = player_disconnected.player_id
+        room_ids = set(self.rooms_of_player(player_id))
+        room_ids.update(self._pending_rooms.get(player_id, ()))
+        for room_id in sorted(room_ids):
+            room = self._rooms[room_id]
+
+            async def job(room=room):
+                await room.handle_player_disconnected(player_id)
+                await self._refresh_room(room)
+
+            await self._dispatch(room, job)
 
     def room_states(self, game_type: Optional[str] = None) -> Iterator[RoomState]:
         if game_type is None:
@@ -96,4 +225,135 @@ class RoomManager:
 
     async def handle_timeout(self, timeout: TurnTimeout) -> None:
         if (room := self._rooms.get(timeout.room_id)) is not None:
-            await room.handle_timeout(timeout.player_id)
+
+            async def job():
+                await room.handle_timeout(timeout.player_id)
+                await self._refresh_room(room)
+
+            await self._dispatch(room, job)
+
+    async def _snapshot_room(self, room: GameRoom) -> Optional[RoomSnapshot]:
+        snapshot = asyncio.get_running_loop().create_future()
+
+        async def job():
+            snapshot.set_result(room.snapshot())
+
+        await self._dispatch(room, job)
+        return await snapshot
+
+    async def snapshot_rooms(self, room_ids: Iterable[int]) -> list[RoomSnapshot]:
+        rooms = [room for room_id in room_ids if (room := self._rooms.get(room_id))]
+        snapshots = await asyncio.gather(*map(self._snapshot_room, rooms))
+        return [snapshot for snapshot in snapshots if snapshot is not None]
+
+    async def _room_to_restore(
+        self, room_id: int, game_type: str
+    ) -> Optional[GameRoom]:
+        room = self._rooms.get(room_id) or await self._spawn_room(game_type, room_id)
+        if room is None or room.game_type != game_type:
+            logging.warning(f"Unable to restore room {room_id}")
+            return None
+        return room
+
+    async def _restore_room(self, room: GameRoom, restore: Awaitable[None]) -> bool:
+        try:
+            await restore
+        except Exception as e:
+            logging.error(f"Unable to restore room {room.room_id}: {e}", exc_info=True)
+            return False
+        finally:
+            await self._refresh_room(room)
+        return True
+
+    async def restore_rooms(
+        self,
+        room_logs: Iterable[RoomLog],
+        snapshots: Iterable[RoomSnapshot] = (),
+    ) -> list[int]:
+        room_logs = {room_log.room_id: room_log for room_log in room_logs}
+        for snapshot in snapshots:
+            room_log = room_logs.get(snapshot.room_id)
+            if room_log is not None and room_log.seed != snapshot.seed:
+                continue
+            if room := await self._room_to_restore(
+                snapshot.room_id, snapshot.game_type
+            ):
+                inputs = room_log.inputs[snapshot.num_inputs :] if room_log else ()
+                if await self._restore_room(
+                    room, room.restore_snapshot(snapshot, inputs)
+                ):
+                    room_logs.pop(snapshot.room_id, None)
+        failed_room_ids = []
+        for room_log in room_logs.values():
+            room = await self._room_to_restore(room_log.room_id, room_log.game_type)
+            if room and not await self._restore_room(room, room.restore(room_log)):
+                failed_room_ids.append(room_log.room_id)
+        return failed_room_ids
+
+    async def _seat_waiting_players(self, room: GameRoom) -> None:
+        waiting_players = self._waiting_players[room.game_type]
+        while waiting_players and not room.is_full:
+            player_id = next(iter(waiting_players))
+            del waiting_players[player_id]
+            await room.join(player_id)
+
+    async def _refresh_room(self, room: GameRoom) -> None:
+        if room.room_id not in self._rooms:
+            return
+        await self._seat_waiting_players(room)
+        self._index_members(room)
+        self._matchmaking.update(room)
+        self._track_idle_room(room)
+
+    def _index_members(self, room: GameRoom) -> None:
+        members = room.members()
+        previous_members = self._room_members.get(room.room_id, frozenset())
+        if members == previous_members:
+            return
+        for player_id in previous_members - members:
+            self._player_rooms[player_id].discard(room.room_id)
+            if not self._player_rooms[player_id]:
+                del self._player_rooms[player_id]
+        for player_id in members - previous_members:
+            self._player_rooms[player_id].add(room.room_id)
+        self._room_members[room.room_id] = members
+
+    def rooms_of_player(self, player_id: str) -> list[int]:
+        return sorted(self._player_rooms.get(player_id, ()))
+
+    def _track_idle_room(self, room: GameRoom) -> None:
+        if room.room_id not in self._spawned_rooms_idle_since:
+            return
+        if not room.is_empty:
+            self._spawned_rooms_idle_since[room.room_id] = None
+        elif self._spawned_rooms_idle_since[room.room_id] is None:
+            self._spawned_rooms_idle_since[room.room_id] = time.monotonic()
+            self._schedule_reclaim(room.room_id, self._room_pool.idle_ttl_seconds)
+
+    def _schedule_reclaim(self, room_id: int, delay_seconds: float) -> None:
+        if self._scheduler is not None:
+            self._scheduler.schedule_event(ReclaimIdleRoom(room_id), delay_seconds)
+
+    async def reclaim_idle_room(self, reclaim: ReclaimIdleRoom) -> None:
+        idle_since = self._spawned_rooms_idle_since.get(reclaim.room_id)
+        if idle_since is None or not self._rooms[reclaim.room_id].is_empty:
+            return
+        if (actor := self._actors.get(reclaim.room_id)) and not actor.is_idle:
+            self._schedule_reclaim(
+                reclaim.room_id, self._room_pool.reclaim_retry_seconds
+            )
+            return
+        if time.monotonic() - idle_since >= self._room_pool.idle_ttl_seconds:
+            del self._rooms[reclaim.room_id]
+            del self._spawned_rooms_idle_since[reclaim.room_id]
+            self._matchmaking.remove(reclaim.room_id)
+            self._room_members.pop(reclaim.room_id, None)
+            if actor := self._actors.pop(reclaim.room_id, None):
+                actor.stop()
+            await self._event_bus.publish(RoomRemoved(room_id=reclaim.room_id))
+            await self._spawn_rooms_for_waiting_players()
+
+    async def _spawn_rooms_for_waiting_players(self) -> None:
+        for game_type, waiting_players in self._waiting_players.items():
+            if waiting_players and (room := await self._spawn_room(game_type)):
+                await self._dispatch(room, partial(self._refresh_room, room))
@@ -0,0 +1,42 @@
+import os
+import resource
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from gamehub.core.game_room import GameRoom
+
+RoomFactory = Callable[[int], GameRoom]
+
+
+def resident_memory_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass(frozen=True)
+class RoomPool:
+    room_factories: dict[str, RoomFactory] = field(default_factory=dict)
+    max_rooms: int = 1000
+    idle_ttl_seconds: float = 300
+    reclaim_retry_seconds: float = 1
+    max_memory_bytes: Optional[int] = None
+    memory_usage: Callable[[], int] = resident_memory_bytes
+    inbox_size: Optional[int] = None
+    room_id_offset: int = 0
+    room_id_stride: int = 1
+
+    def next_room_id(self, after: int) -> int:
+        return after + 1 + (self.room_id_offset - after - 1) % self.room_id_stride
+
+    def can_spawn_room(self, game_type: str, num_rooms: int) -> bool:
+        return (
+            game_type in self.room_factories
+            and num_rooms < self.max_rooms
+            and (
+                self.max_memory_bytes is None
+                or self.memory_usage() < self.max_memory_bytes
+            )
+        )
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class RoomSnapshot:
+    room_id: int
+    game_type: str
+    player_ids: tuple[str, ...]
+    game_state: object
+    seed: int
+    num_inputs: int
+    random_state: object
+    turn_deadlines: Mapping[str, datetime] = field(default_factory=dict)
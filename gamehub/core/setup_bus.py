@@ -1,4 +1,7 @@
+from typing import Optional
+
 from gamehub.core.event_bus import EventBus
+from gamehub.core.events.game_log import GameCreated, GameFinished, MoveAccepted
 from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import (
     GameEnded,
@@ -7,7 +10,11 @@ from gamehub.core.events.game_state_update import (
     TurnEnded,
     TurnStarted,
 )
-from gamehub.core.events.outgoing_message import OutgoingMessage
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
 from gamehub.core.events.player_disconnected import PlayerDisconnected
 from gamehub.core.events.request import Request
 from gamehub.core.events.request_events import (
@@ -16,14 +23,25 @@ from gamehub.core.events.request_events import (
     MakeMove,
     RejoinGame,
     RequestFailed,
+    SetUpdateMode,
+    SyncGame,
     WatchGame,
 )
+from gamehub.core.events.room_lifecycle import (
+    ReclaimIdleRoom,
+    RoomCreated,
+    RoomRemoved,
+    RoomRestored,
+)
 from gamehub.core.events.sync_client_state import SyncClientState
 from gamehub.core.events.timer_events import TurnTimeout, TurnTimerAlert
 from gamehub.core.message_builder import MessageBuilder
 from gamehub.core.message_sender import MessageSender
+from gamehub.core.move_log import MoveLog
 from gamehub.core.request_parser import RequestParser
 from gamehub.core.room_manager import RoomManager
+from gamehub.core.shard_router import ShardRouter
+from gamehub.core.snapshot_store import SnapshotStore
 from gamehub.core.turn_timer import TurnTimerRegistry
 
 
@@ -32,24 +50,60 @@ def setup_event_bus(
     message_sender: MessageSender,
     room_manager: RoomManager,
     timekeeper: TurnTimerRegistry,
+    shard_router: Optional[ShardRouter] = None,
 ) -> None:
     request_parser = RequestParser(event_bus)
     message_builder = MessageBuilder(event_bus)
+    directed_handlers = {
+        JoinGameById: room_manager.join_game_by_id,
+        RejoinGame: room_manager.rejoin_game,
+        WatchGame: room_manager.watch_game,
+        MakeMove: room_manager.make_move,
+        SyncGame: room_manager.sync_game,
+    }
+    event_bus.subscribe(PlayerDisconnected, message_sender.forget_client)
+    if shard_router is not None and shard_router.is_sharded:
+        directed_handlers = shard_router.route(directed_handlers)
+        message_sender = shard_router.route_outgoing(message_sender)
+        event_bus.subscribe(Request, shard_router.track_local_player)
+        event_bus.subscribe(SetUpdateMode, shard_router.forward_to_peers)
+        event_bus.subscribe(PlayerDisconnected, shard_router.forward_to_peers)
     event_bus.subscribe(Request, request_parser.parse_request)
     event_bus.subscribe(RequestFailed, message_builder.build_error_message)
     event_bus.subscribe(GameRoomUpdate, message_builder.notify_room_update)
+    event_bus.subscribe(GameRoomUpdate, timekeeper.handle_room_update)
     event_bus.subscribe(GameStateUpdate, message_builder.notify_game_state_update)
     event_bus.subscribe(SyncClientState, message_builder.sync_client_state)
     event_bus.subscribe(OutgoingMessage, message_sender.send)
-    event_bus.subscribe(JoinGameById, room_manager.join_game_by_id)
-    event_bus.subscribe(RejoinGame, room_manager.rejoin_game)
-    event_bus.subscribe(WatchGame, room_manager.watch_game)
+    event_bus.subscribe(OutgoingBroadcast, message_sender.broadcast)
+    event_bus.subscribe(OutgoingResume, message_sender.resume)
+    for request_type, handler in directed_handlers.items():
+        event_bus.subscribe(request_type, handler)
     event_bus.subscribe(JoinGameByType, room_manager.join_game_by_type)
-    event_bus.subscribe(MakeMove, room_manager.make_move)
     event_bus.subscribe(PlayerDisconnected, room_manager.handle_player_disconnected)
+    event_bus.subscribe(PlayerDisconnected, message_builder.forget_client)
+    event_bus.subscribe(SetUpdateMode, message_builder.set_update_mode)
     event_bus.subscribe(GameStarted, timekeeper.handle_game_start)
     event_bus.subscribe(GameEnded, timekeeper.handle_game_end)
     event_bus.subscribe(TurnStarted, timekeeper.handle_turn_start)
     event_bus.subscribe(TurnEnded, timekeeper.handle_turn_end)
     event_bus.subscribe(TurnTimerAlert, message_builder.notify_turn_timer_alert)
     event_bus.subscribe(TurnTimeout, room_manager.handle_timeout)
+    event_bus.subscribe(RoomCreated, timekeeper.handle_room_created)
+    event_bus.subscribe(RoomRestored, timekeeper.handle_room_restored)
+    event_bus.subscribe(RoomRemoved, timekeeper.handle_room_removed)
+    event_bus.subscribe(RoomRemoved, message_builder.forget_room)
+    event_bus.subscribe(ReclaimIdleRoom, room_manager.reclaim_idle_room)
+
+
+def setup_move_log(event_bus: EventBus, move_log: MoveLog) -> None:
+    event_bus.subscribe(GameCreated, move_log.handle_game_created)
+    event_bus.subscribe(MoveAccepted, move_log.handle_move_accepted)
+    event_bus.subscribe(GameFinished, move_log.handle_game_finished)
+
+
+def setup_snapshot_store(event_bus: EventBus, snapshot_store: SnapshotStore) -> None:
+    event_bus.subscribe(GameRoomUpdate, snapshot_store.handle_room_update)
+    event_bus.subscribe(GameStateUpdate, snapshot_store.handle_room_event)
+    event_bus.subscribe(GameFinished, snapshot_store.handle_room_event)
+    event_bus.subscribe(RoomRemoved, snapshot_store.handle_room_event)
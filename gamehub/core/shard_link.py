@@ -0,0 +1,130 @@
+import asyncio
+import json
+import logging
+import os
+from itertools import count
+from typing import Awaitable, Callable, Optional
+
+from gamehub.core.shard_map import ShardMap
+
+FrameHandler = Callable[[int, dict], Awaitable[Optional[dict]]]
+
+_FRAME_LIMIT = 16 * 1024 * 1024
+
+
+def _encode_frame(frame: dict) -> bytes:
+    return json.dumps(frame, separators=(",", ":")).encode() + b"\n"
+
+
+class ShardLink:
+    def __init__(
+        self,
+        shard_map: ShardMap,
+        handle_frame: FrameHandler,
+        request_timeout_seconds: float = 5,
+    ) -> None:
+        self._shard_map = shard_map
+        self._handle_frame = handle_frame
+        self._request_timeout_seconds = request_timeout_seconds
+        self._server: Optional[asyncio.Server] = None
+        self._peers: dict[int, asyncio.StreamWriter] = {}
+        self._peer_locks: dict[int, asyncio.Lock] = {}
+        self._pending_replies: dict[int, asyncio.Future] = {}
+        self._request_ids = count()
+        self._reader_tasks: set[asyncio.Task] = set()
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        path = self._shard_map.socket_path(self._shard_map.shard_index)
+        if os.path.exists(path):
+            os.unlink(path)
+        self._server = await asyncio.start_unix_server(
+            self._serve, path=path, limit=_FRAME_LIMIT
+        )
+
+    async def close(self) -> None:
+        for writer in (*self._peers.values(), *self._connections):
+            writer.close()
+        self._peers.clear()
+        for task in self._reader_tasks:
+            task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections.add(writer)
+        try:
+            async for line in reader:
+                frame = json.loads(line)
+                reply = await self._handle(frame)
+                if (request_id := frame.get("request_id")) is not None:
+                    writer.write(
+                        _encode_frame({"reply_to": request_id, "payload": reply})
+                    )
+                    await writer.drain()
+        except OSError as e:
+            logging.warning(f"Shard link connection lost: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _handle(self, frame: dict) -> Optional[dict]:
+        try:
+            return await self._handle_frame(frame["origin"], frame["payload"])
+        except Exception as e:
+            logging.error(f"Failed to handle shard frame: {e}", exc_info=True)
+
+    async def _read_replies(self, reader: asyncio.StreamReader) -> None:
+        async for line in reader:
+            reply = json.loads(line)
+            if future := self._pending_replies.pop(reply["reply_to"], None):
+                future.set_result(reply["payload"])
+
+    async def _peer(self, shard_index: int) -> asyncio.StreamWriter:
+        lock = self._peer_locks.setdefault(shard_index, asyncio.Lock())
+        async with lock:
+            writer = self._peers.get(shard_index)
+            if writer is None or writer.is_closing():
+                reader, writer = await asyncio.open_unix_connection(
+                    self._shard_map.socket_path(shard_index), limit=_FRAME_LIMIT
+                )
+                self._peers[shard_index] = writer
+                task = asyncio.create_task(self._read_replies(reader))
+                self._reader_tasks.add(task)
+                task.add_done_callback(self._reader_tasks.discard)
+            return writer
+
+    async def _write(self, shard_index: int, frame: dict) -> None:
+        writer = await self._peer(shard_index)
+        try:
+            writer.write(_encode_frame(frame))
+            await writer.drain()
+        except OSError:
+            self._peers.pop(shard_index, None)
+            raise
+
+    async def send(self, shard_index: int, payload: dict) -> None:
+        frame = {"origin": self._shard_map.shard_index, "payload": payload}
+        try:
+            await self._write(shard_index, frame)
+        except OSError as e:
+            logging.warning(f"Unable to reach shard {shard_index}: {e}")
+
+    async def request(self, shard_index: int, payload: dict) -> Optional[dict]:
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[request_id] = future
+        frame = {
+            "origin": self._shard_map.shard_index,
+            "request_id": request_id,
+            "payload": payload,
+        }
+        try:
+            await self._write(shard_index, frame)
+            return await asyncio.wait_for(future, self._request_timeout_seconds)
+        finally:
+            self._pending_replies.pop(request_id, None)
@@ -0,0 +1,35 @@
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Iterator, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class ShardMap:
+    shard_index: int
+    num_shards: int
+    socket_dir: str = tempfile.gettempdir()
+
+    def owner(self, room_id: int) -> int:
+        return room_id % self.num_shards
+
+    def is_local(self, room_id: int) -> bool:
+        return self.owner(room_id) == self.shard_index
+
+    def peers(self) -> Iterator[int]:
+        for shard_index in range(self.num_shards):
+            if shard_index != self.shard_index:
+                yield shard_index
+
+    def socket_path(self, shard_index: int) -> str:
+        return os.path.join(self.socket_dir, f"gamehub-shard-{shard_index}.sock")
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> Optional["ShardMap"]:
+        if "GAMEHUB_NUM_SHARDS" not in environ:
+            return None
+        return cls(
+            shard_index=int(environ["GAMEHUB_SHARD_INDEX"]),
+            num_shards=int(environ["GAMEHUB_NUM_SHARDS"]),
+            socket_dir=environ.get("GAMEHUB_SHARD_DIR", tempfile.gettempdir()),
+        )
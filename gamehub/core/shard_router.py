@@ -0,0 +1,188 @@
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Optional
+
+from pydantic import TypeAdapter
+
+from gamehub.core.event_bus import EventBus
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
+from gamehub.core.events.request import Request
+from gamehub.core.events.request_events import (
+    DirectedRequest,
+    JoinGameById,
+    MakeMove,
+    RejoinGame,
+    SetUpdateMode,
+    SyncGame,
+    WatchGame,
+)
+from gamehub.core.message_sender import MessageSender
+from gamehub.core.room_manager import RoomManager
+from gamehub.core.room_state import RoomState
+from gamehub.core.shard_link import ShardLink
+from gamehub.core.shard_map import ShardMap
+
+DirectedHandler = Callable[[DirectedRequest], Awaitable[None]]
+
+_EVENT_ADAPTERS = {
+    event_type.__name__: TypeAdapter(event_type)
+    for event_type in (
+        JoinGameById,
+        RejoinGame,
+        WatchGame,
+        SyncGame,
+        MakeMove,
+        SetUpdateMode,
+        PlayerDisconnected,
+        OutgoingMessage,
+        OutgoingBroadcast,
+        OutgoingResume,
+    )
+}
+
+
+def encode_event(event: any) -> dict:
+    event_type = type(event).__name__
+    return {
+        "event_type": event_type,
+        "event": _EVENT_ADAPTERS[event_type].dump_python(event, mode="json"),
+    }
+
+
+def decode_event(payload: dict) -> any:
+    return _EVENT_ADAPTERS[payload["event_type"]].validate_python(payload["event"])
+
+
+class ShardRouter:
+    def __init__(
+        self,
+        room_manager: RoomManager,
+        event_bus: EventBus,
+        shard_map: Optional[ShardMap] = None,
+    ) -> None:
+        self._room_manager = room_manager
+        self._event_bus = event_bus
+        self._shard_map = shard_map
+        self._link = ShardLink(shard_map, self._handle_frame) if shard_map else None
+        self._local_handlers: dict[type, DirectedHandler] = {}
+        self._local_sender: Optional[MessageSender] = None
+        self._player_origins: dict[str, int] = {}
+
+    @property
+    def room_manager(self) -> RoomManager:
+        return self._room_manager
+
+    @property
+    def is_sharded(self) -> bool:
+        return self._shard_map is not None
+
+    async def start(self) -> None:
+        if self._link is not None:
+            await self._link.start()
+
+    async def close(self) -> None:
+        if self._link is not None:
+            await self._link.close()
+
+    def route(
+        self, handlers: dict[type, DirectedHandler]
+    ) -> dict[type, DirectedHandler]:
+        if not self.is_sharded:
+            return handlers
+        self._local_handlers.update(handlers)
+        return {event_type: self._route_directed for event_type in handlers}
+
+    def route_outgoing(self, message_sender: MessageSender) -> MessageSender:
+        if not self.is_sharded:
+            return message_sender
+        self._local_sender = message_sender
+        return self
+
+    async def _forward(self, shard_index: int, event: any) -> None:
+        await self._link.send(shard_index, encode_event(event))
+
+    async def _route_directed(self, request: DirectedRequest) -> None:
+        owner = self._shard_map.owner(request.room_id)
+        if owner == self._shard_map.shard_index:
+            await self._local_handlers[type(request)](request)
+        else:
+            await self._forward(owner, request)
+
+    async def track_local_player(self, request: Request) -> None:
+        self._player_origins.pop(request.player_id, None)
+
+    async def forward_to_peers(self, event: SetUpdateMode | PlayerDisconnected) -> None:
+        if event.player_id in self._player_origins:
+            return
+        for shard_index in self._shard_map.peers():
+            await self._forward(shard_index, event)
+
+    async def send(self, message: OutgoingMessage) -> None:
+        if (origin := self._player_origins.get(message.player_id)) is None:
+            await self._local_sender.send(message)
+        else:
+            await self._forward(origin, message)
+
+    async def resume(self, resume: OutgoingResume) -> None:
+        if (origin := self._player_origins.get(resume.player_id)) is None:
+            await self._local_sender.resume(resume)
+        else:
+            await self._forward(origin, resume)
+
+    async def broadcast(self, broadcast: OutgoingBroadcast) -> None:
+        recipients_by_shard = defaultdict(list)
+        for recipient in broadcast.recipients:
+            shard_index = self._player_origins.get(
+                recipient, self._shard_map.shard_index
+            )
+            recipients_by_shard[shard_index].append(recipient)
+        for shard_index, recipients in recipients_by_shard.items():
+            shard_broadcast = OutgoingBroadcast(tuple(recipients), broadcast.message)
+            if shard_index == self._shard_map.shard_index:
+                await self._local_sender.broadcast(shard_broadcast)
+            else:
+                await self._forward(shard_index, shard_broadcast)
+
+    async def _handle_event(self, origin: int, event: any) -> None:
+        if isinstance(event, OutgoingMessage):
+            await self._local_sender.send(event)
+        elif isinstance(event, OutgoingBroadcast):
+            await self._local_sender.broadcast(event)
+        elif isinstance(event, OutgoingResume):
+            await self._local_sender.resume(event)
+        elif isinstance(event, DirectedRequest):
+            self._player_origins[event.player_id] = origin
+            await self._local_handlers[type(event)](event)
+        else:
+            self._player_origins[event.player_id] = origin
+            await self._event_bus.publish(event)
+            if isinstance(event, PlayerDisconnected):
+                del self._player_origins[event.player_id]
+
+    def _local_room_states(self, game_type: Optional[str]) -> list[RoomState]:
+        return list(self._room_manager.room_states(game_type=game_type))
+
+    async def _handle_frame(self, origin: int, payload: dict) -> Optional[dict]:
+        if payload.get("query") == "room_states":
+            room_states = self._local_room_states(payload["game_type"])
+            return {"rooms": [state.model_dump(mode="json") for state in room_states]}
+        await self._handle_event(origin, decode_event(payload))
+
+    async def room_states(self, game_type: Optional[str] = None) -> list[RoomState]:
+        room_states = self._local_room_states(game_type)
+        if not self.is_sharded:
+            return room_states
+        query = {"query": "room_states", "game_type": game_type}
+        for shard_index in self._shard_map.peers():
+            try:
+                reply = await self._link.request(shard_index, query)
+            except (OSError, TimeoutError) as e:
+                logging.warning(f"Unable to list rooms of shard {shard_index}: {e}")
+                continue
+            room_states.extend(RoomState.model_validate(s) for s in reply["rooms"])
+        return sorted(room_states, key=lambda state: state.room_id)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class SharedViewVersion:
+    version: int
+    shared_view: dict
+    synced_clients: frozenset[str]
+
+
+def _appended_items(previous: object, current: object) -> object:
+    if (
+        isinstance(current, (list, tuple))
+        and type(previous) is type(current)
+        and len(previous) < len(current)
+        and current[: len(previous)] == previous
+    ):
+        return list(current[len(previous) :])
+    return _MISSING
+
+
+def shared_view_delta(previous: dict, current: dict) -> dict:
+    changes, appended = {}, {}
+    for key, value in current.items():
+        previous_value = previous.get(key, _MISSING)
+        if previous_value == value:
+            continue
+        elif (items := _appended_items(previous_value, value)) is not _MISSING:
+            appended[key] = items
+        else:
+            changes[key] = value
+    removed = [key for key in previous if key not in current]
+    delta = {"changes": changes, "appended": appended, "removed": removed}
+    return {section: content for section, content in delta.items() if content}
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import os
+import pickle
+import struct
+from dataclasses import replace
+from typing import Iterable, Iterator, Optional
+
+from gamehub.core.events.game_log import GameFinished
+from gamehub.core.events.game_room_update import GameRoomUpdate
+from gamehub.core.events.game_state_update import GameStateUpdate
+from gamehub.core.events.room_lifecycle import RoomRemoved
+from gamehub.core.move_log import RoomLog
+from gamehub.core.room_manager import RoomManager
+from gamehub.core.room_snapshot import RoomSnapshot
+from gamehub.core.turn_timer import TurnTimerRegistry
+
+_MAGIC = b"GHSNAP\n"
+_SCHEMA_VERSION = 1
+_VERSION_HEADER = struct.Struct(">H")
+_RECORD_HEADER = struct.Struct(">I")
+
+
+def _encode_snapshots(snapshots: Iterable[RoomSnapshot]) -> dict[int, bytes]:
+    return {
+        snapshot.room_id: pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        for snapshot in snapshots
+    }
+
+
+def _write_snapshot_file(path: str, records: list[bytes]) -> None:
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(_VERSION_HEADER.pack(_SCHEMA_VERSION))
+        for record in records:
+            file.write(_RECORD_HEADER.pack(len(record)))
+            file.write(record)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+def _records(data: bytes, offset: int) -> Iterator[bytes]:
+    while offset < len(data):
+        (length,) = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        if offset + length > len(data):
+            raise ValueError("Snapshot record is truncated")
+        yield data[offset : offset + length]
+        offset += length
+
+
+def _decode_snapshot(record: bytes, path: str) -> Optional[RoomSnapshot]:
+    try:
+        snapshot = pickle.loads(record)
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable room snapshot in {path}: {e}")
+        return None
+    if not isinstance(snapshot, RoomSnapshot):
+        logging.warning(f"Ignoring unexpected room snapshot record in {path}")
+        return None
+    return snapshot
+
+
+def load_room_snapshots(path: str) -> list[RoomSnapshot]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as file:
+        data = file.read()
+    header_size = len(_MAGIC) + _VERSION_HEADER.size
+    if not data.startswith(_MAGIC) or len(data) < header_size:
+        logging.warning(f"Ignoring room snapshots in unknown format: {path}")
+        return []
+    (version,) = _VERSION_HEADER.unpack_from(data, len(_MAGIC))
+    if version != _SCHEMA_VERSION:
+        logging.warning(f"Ignoring room snapshots of schema version {version}: {path}")
+        return []
+    snapshots = []
+    try:
+        for record in _records(data, header_size):
+            if snapshot := _decode_snapshot(record, path):
+                snapshots.append(snapshot)
+    except (struct.error, ValueError) as e:
+        logging.warning(f"Ignoring rest of room snapshots in {path}: {e}")
+    return snapshots
+
+
+class SnapshotStore:
+    def __init__(
+        self,
+        path: str,
+        room_manager: RoomManager,
+        timekeeper: TurnTimerRegistry,
+        interval_seconds: float = 5,
+    ) -> None:
+        self._path = path
+        self._room_manager = room_manager
+        self._timekeeper = timekeeper
+        self._interval_seconds = interval_seconds
+        self._records: dict[int, bytes] = {}
+        self._dirty_rooms: set[int] = set()
+        self._lock = asyncio.Lock()
+        self._closing = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def dirty_rooms(self) -> frozenset[int]:
+        return frozenset(self._dirty_rooms)
+
+    def handle_room_update(self, event: GameRoomUpdate) -> None:
+        self._dirty_rooms.add(event.room_state.room_id)
+
+    def handle_room_event(
+        self, event: GameStateUpdate | GameFinished | RoomRemoved
+    ) -> None:
+        self._dirty_rooms.add(event.room_id)
+
+    async def _capture(self, room_ids: set[int]) -> list[RoomSnapshot]:
+        snapshots = await self._room_manager.snapshot_rooms(room_ids)
+        return [
+            replace(
+                snapshot,
+                turn_deadlines=self._timekeeper.turn_deadlines(snapshot.room_id),
+            )
+            for snapshot in snapshots
+        ]
+
+    async def save(self) -> None:
+        async with self._lock:
+            room_ids, self._dirty_rooms = self._dirty_rooms, set()
+            if not room_ids:
+                return
+            try:
+                snapshots = await self._capture(room_ids)
+                records = await asyncio.to_thread(_encode_snapshots, snapshots)
+                for room_id in room_ids:
+                    self._records.pop(room_id, None)
+                self._records.update(records)
+                await asyncio.to_thread(
+                    _write_snapshot_file, self._path, list(self._records.values())
+                )
+            except BaseException:
+                self._dirty_rooms |= room_ids
+                raise
+
+    async def restore(
+        self, snapshots: list[RoomSnapshot], room_logs: Iterable[RoomLog] = ()
+    ) -> list[int]:
+        for snapshot in snapshots:
+            self._timekeeper.resume_turns(snapshot.room_id, snapshot.turn_deadlines)
+        failed_room_ids = await self._room_manager.restore_rooms(room_logs, snapshots)
+        for snapshot in snapshots:
+            self._timekeeper.resume_turns(snapshot.room_id, {})
+        return failed_room_ids
+
+    async def _wait_for_interval(self) -> bool:
+        try:
+            await asyncio.wait_for(self._closing.wait(), self._interval_seconds)
+        except TimeoutError:
+            return True
+        return False
+
+    async def _run(self) -> None:
+        keep_running = True
+        while keep_running:
+            keep_running = await self._wait_for_interval()
+            try:
+                await self.save()
+            except Exception as e:
+                logging.error(f"Unable to save room snapshots: {e}", exc_info=True)
+
+    def start(self) -> None:
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._runner is None:
+            await self.save()
+        else:
+            await self._runner
+            self._runner = None
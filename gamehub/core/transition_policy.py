@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TransitionPolicy:
+    coalesce_updates: bool = False
+    include_intermediate_views: bool = False
+    max_automated_steps: int = 1000
+    yield_every_steps: Optional[int] = None
@@ -1,14 +1,16 @@
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Mapping, Optional
 
 from gamehub.core.event_scheduler import EventScheduler
+from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import (
     GameEnded,
     GameStarted,
     TurnEnded,
     TurnStarted,
 )
+from gamehub.core.events.room_lifecycle import RoomCreated, RoomRemoved, RoomRestored
 from gamehub.core.events.timer_events import TurnTimeout, TurnTimerAlert
 
 
@@ -19,12 +21,17 @@ class TurnTimer:
         room_id: int,
         timeout_seconds: int,
         reminders_at_seconds_remaining: Iterable[int],
+        offline_grace_seconds: int = 0,
     ) -> None:
         self._scheduler = event_scheduler
         self._room_id = room_id
         self._timeout_seconds = timeout_seconds
         self._reminders_at_seconds_remaining = set(reminders_at_seconds_remaining)
+        self._offline_grace_seconds = offline_grace_seconds
         self._scheduled_tasks = defaultdict(list)
+        self._active_turns: dict[str, Iterable[str]] = {}
+        self._deadlines: dict[str, datetime] = {}
+        self._turn_deadlines: dict[str, datetime] = {}
 
     @property
     def room_id(self) -> int:
@@ -34,20 +41,29 @@ class TurnTimer:
         for player_id in self._scheduled_tasks:
             self.cancel(player_id)
         self._scheduled_tasks.clear()
+        self._active_turns.clear()
 
     def _schedule_event(self, event: any, delay_seconds: int) -> None:
         task = self._scheduler.schedule_event(event, delay_seconds)
         self._scheduled_tasks[event.player_id].append(task)
 
-    def start(self, player_id: str, recipients: Iterable[str]) -> None:
-        self.cancel(player_id)
+    @property
+    def deadlines(self) -> dict[str, datetime]:
+        return dict(self._deadlines)
+
+    def _start(
+        self, player_id: str, recipients: Iterable[str], timeout_seconds: float
+    ) -> None:
+        self._cancel_events(player_id)
+        self._active_turns[player_id] = recipients
         timeout_event = TurnTimeout(
             room_id=self._room_id, player_id=player_id, recipients=recipients
         )
-        self._schedule_event(timeout_event, self._timeout_seconds)
+        self._schedule_event(timeout_event, timeout_seconds)
         turn_expires_at = datetime.now(timezone.utc) + timedelta(
-            seconds=self._timeout_seconds
+            seconds=timeout_seconds
         )
+        self._deadlines[player_id] = turn_expires_at
         alert_event = TurnTimerAlert(
             room_id=self._room_id,
             player_id=player_id,
@@ -55,34 +71,133 @@ class TurnTimer:
             recipients=recipients,
         )
         for seconds_remaining in self._reminders_at_seconds_remaining:
-            delay = self._timeout_seconds - seconds_remaining
-            self._schedule_event(alert_event, delay)
+            if seconds_remaining < timeout_seconds:
+                delay = timeout_seconds - seconds_remaining
+                self._schedule_event(alert_event, delay)
 
-    def cancel(self, player_id: str) -> None:
+    def start(self, player_id: str, recipients: Iterable[str]) -> None:
+        self._start(player_id, recipients, self._timeout_seconds)
+        self._turn_deadlines[player_id] = self._deadlines[player_id]
+
+    def start_offline(self, player_id: str, recipients: Iterable[str]) -> None:
+        self._start(player_id, recipients, self._offline_grace_seconds)
+
+    def resume(
+        self, player_id: str, recipients: Iterable[str], expires_at: datetime
+    ) -> None:
+        seconds_left = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        self._start(player_id, recipients, max(seconds_left, 0))
+        self._turn_deadlines[player_id] = expires_at
+
+    def handle_player_offline(self, player_id: str) -> None:
+        if (recipients := self._active_turns.get(player_id)) is not None:
+            self.start_offline(player_id, recipients)
+
+    def handle_player_online(self, player_id: str) -> None:
+        if (recipients := self._active_turns.get(player_id)) is None:
+            return
+        if (expires_at := self._turn_deadlines.get(player_id)) is None:
+            self.start(player_id, recipients)
+        else:
+            self.resume(player_id, recipients, expires_at)
+
+    def _cancel_events(self, player_id: str) -> None:
         for task in self._scheduled_tasks[player_id]:
             self._scheduler.cancel_event(task)
         self._scheduled_tasks[player_id].clear()
 
+    def cancel(self, player_id: str) -> None:
+        self._cancel_events(player_id)
+        self._active_turns.pop(player_id, None)
+        self._deadlines.pop(player_id, None)
+        self._turn_deadlines.pop(player_id, None)
+
 
 class TurnTimerRegistry:
-    def __init__(self, turn_timers: Iterable[TurnTimer]) -> None:
+    def __init__(
+        self,
+        turn_timers: Iterable[TurnTimer],
+        turn_timer_factories: Optional[dict[str, Callable[[int], TurnTimer]]] = None,
+    ) -> None:
         self._turn_timers = {t.room_id: t for t in turn_timers}
+        self._turn_timer_factories = turn_timer_factories or {}
+        self._offline_players: dict[int, frozenset[str]] = {}
+        self._resumed_deadlines: dict[int, dict[str, datetime]] = {}
+        self._restored_players: dict[int, set[str]] = {}
 
     def _turn_timer(self, room_id: int) -> Optional[TurnTimer]:
         return self._turn_timers.get(room_id)
 
+    def turn_deadlines(self, room_id: int) -> dict[str, datetime]:
+        if timer := self._turn_timer(room_id):
+            return timer.deadlines
+        return {}
+
+    def resume_turns(self, room_id: int, deadlines: Mapping[str, datetime]) -> None:
+        if deadlines:
+            self._resumed_deadlines[room_id] = dict(deadlines)
+        else:
+            self._resumed_deadlines.pop(room_id, None)
+
+    def _is_disconnected(self, room_id: int, player_id: str) -> bool:
+        offline_players = self._offline_players.get(room_id, frozenset())
+        restored_players = self._restored_players.get(room_id, set())
+        return player_id in offline_players - restored_players
+
+    def handle_room_restored(self, room_restored_event: RoomRestored):
+        self._restored_players[room_restored_event.room_id] = set(
+            room_restored_event.player_ids
+        )
+
     def handle_game_start(self, game_start_event: GameStarted):
         if timer := self._turn_timer(game_start_event.room_id):
             timer.reset()
 
     def handle_game_end(self, game_end_event: GameEnded):
+        self._offline_players.pop(game_end_event.room_id, None)
+        self._resumed_deadlines.pop(game_end_event.room_id, None)
+        self._restored_players.pop(game_end_event.room_id, None)
         if timer := self._turn_timer(game_end_event.room_id):
             timer.reset()
 
     def handle_turn_start(self, turn_start_event: TurnStarted):
-        if timer := self._turn_timer(turn_start_event.room_id):
-            timer.start(turn_start_event.player_id, turn_start_event.recipients)
+        room_id, player_id = turn_start_event.room_id, turn_start_event.player_id
+        if not (timer := self._turn_timer(room_id)):
+            return
+        resumed_deadlines = self._resumed_deadlines.get(room_id, {})
+        if expires_at := resumed_deadlines.pop(player_id, None):
+            timer.resume(player_id, turn_start_event.recipients, expires_at)
+        elif self._is_disconnected(room_id, player_id):
+            timer.start_offline(player_id, turn_start_event.recipients)
+        else:
+            timer.start(player_id, turn_start_event.recipients)
+
+    def handle_room_update(self, room_update_event: GameRoomUpdate):
+        room_id = room_update_event.room_state.room_id
+        if not (timer := self._turn_timer(room_id)):
+            return
+        offline_players = frozenset(room_update_event.room_state.offline_players)
+        previously_offline = self._offline_players.get(room_id, frozenset())
+        self._offline_players[room_id] = offline_players
+        restored_players = self._restored_players.get(room_id, set())
+        for player_id in offline_players - previously_offline - restored_players:
+            timer.handle_player_offline(player_id)
+        for player_id in previously_offline - offline_players:
+            restored_players.discard(player_id)
+            timer.handle_player_online(player_id)
 
     def handle_turn_end(self, turn_end_event: TurnEnded):
         if timer := self._turn_timer(turn_end_event.room_id):
             timer.cancel(turn_end_event.player_id)
+
+    def handle_room_created(self, room_created_event: RoomCreated):
+        if factory := self._turn_timer_factories.get(room_created_event.game_type):
+            timer = factory(room_created_event.room_id)
+            self._turn_timers[timer.room_id] = timer
+
+    def handle_room_removed(self, room_removed_event: RoomRemoved):
+        self._offline_players.pop(room_removed_event.room_id, None)
+        self._resumed_deadlines.pop(room_removed_event.room_id, None)
+        self._restored_players.pop(room_removed_event.room_id, None)
+        if timer := self._turn_timers.pop(room_removed_event.room_id, None):
+            timer.reset()
@@ -0,0 +1,145 @@
+from collections import defaultdict
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from itertools import islice
+from random import Random
+from typing import Optional, Protocol
+
+from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
+from gamehub.games.chinese_poker.game_state import ChinesePokerState
+from gamehub.games.chinese_poker.hand import to_card_set
+from gamehub.games.chinese_poker.hand.card_value import RANKS_BY_VALUE
+from gamehub.games.chinese_poker.move import ChinesePokerMove
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
+from gamehub.games.chinese_poker.transitions import (
+    legal_moves,
+    next_automated_state,
+    state_after_move,
+)
+
+
+class BotStrategy(Protocol):
+    def choose_move(
+        self, state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    ) -> ChinesePokerMove: ...
+
+
+class PassingStrategy:
+    @staticmethod
+    def choose_move(
+        state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    ) -> ChinesePokerMove:
+        player = state.current_player()
+        cards = () if state.move_history else (player.smallest_card(),)
+        return ChinesePokerMove(player_id=player.player_id, cards=cards)
+
+
+class GreedyStrategy:
+    @staticmethod
+    def choose_move(
+        state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    ) -> ChinesePokerMove:
+        return next(legal_moves(state, configuration))
+
+
+def _uses_top_rank(move: ChinesePokerMove) -> bool:
+    return any(card.rank == RANKS_BY_VALUE[-1] for card in move.cards)
+
+
+@dataclass(frozen=True)
+class HeuristicStrategy:
+    endgame_num_cards: int = 4
+
+    def _is_endgame(self, state: ChinesePokerState) -> bool:
+        return any(p.num_cards <= self.endgame_num_cards for p in state.players)
+
+    def choose_move(
+        self, state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    ) -> ChinesePokerMove:
+        moves = list(legal_moves(state, configuration))
+        plays = [move for move in moves if not move.is_pass]
+        if moves[-1].is_pass and not self._is_endgame(state):
+            plays = [move for move in plays if not _uses_top_rank(move)]
+        if not plays:
+            return moves[-1]
+        return max(plays, key=lambda move: len(move.cards))
+
+
+def _determinized(state: ChinesePokerState, rng: Random) -> ChinesePokerState:
+    bot_idx = state.current_player_idx
+    hidden_cards = [
+        card
+        for idx, player in enumerate(state.players)
+        if idx != bot_idx
+        for card in player.cards
+    ]
+    rng.shuffle(hidden_cards)
+    redealt = iter(hidden_cards)
+    players = tuple(
+        player
+        if idx == bot_idx
+        else replace(player, card_set=to_card_set(islice(redealt, player.num_cards)))
+        for idx, player in enumerate(state.players)
+    )
+    return replace(state, players=players)
+
+
+def rollout_cards_left(
+    state: ChinesePokerState,
+    configuration: ChinesePokerConfiguration,
+    move: ChinesePokerMove,
+    seed: int,
+) -> int:
+    rng = Random(seed)
+    bot_idx = state.current_player_idx
+    state = state_after_move(_determinized(state, rng), move, configuration)
+    while state.status != ChinesePokerStatus.END_MATCH:
+        if state.status == ChinesePokerStatus.AWAIT_PLAYER_ACTION:
+            move = GreedyStrategy.choose_move(state, configuration)
+            state = state_after_move(state, move, configuration)
+        else:
+            state = next_automated_state(state, configuration, rng)
+    return state.players[bot_idx].num_cards
+
+
+@dataclass(frozen=True)
+class MonteCarloStrategy:
+    executor: Executor
+    num_rollouts: int = 32
+    max_candidates: int = 8
+    seed: Optional[int] = None
+
+    def _candidates(
+        self, state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    ) -> list[ChinesePokerMove]:
+        moves = legal_moves(state, configuration)
+        candidates = list(islice(moves, self.max_candidates))
+        if state.move_history and not candidates[-1].is_pass:
+            player_id = state.current_player_id()
+            candidates.append(ChinesePokerMove(player_id=player_id, cards=()))
+        return candidates
+
+    def choose_move(
+        self, state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    ) -> ChinesePokerMove:
+        candidates = self._candidates(state, configuration)
+        if len(candidates) == 1:
+            return candidates[0]
+        rng = Random(self.seed)
+        jobs = [
+            (idx, candidate, rng.getrandbits(32))
+            for idx, candidate in enumerate(candidates)
+            for _ in range(self.num_rollouts)
+        ]
+        cards_left = self.executor.map(
+            rollout_cards_left,
+            [state] * len(jobs),
+            [configuration] * len(jobs),
+            [candidate for _, candidate, _ in jobs],
+            [seed for _, _, seed in jobs],
+            chunksize=self.num_rollouts,
+        )
+        total_cards_left = defaultdict(int)
+        for (idx, _, _), num_cards in zip(jobs, cards_left):
+            total_cards_left[idx] += num_cards
+        return candidates[min(total_cards_left, key=total_cards_left.get)]
@@ -1,3 +1,4 @@
+from random import Random
 from typing import Iterable, Iterator, Optional
 
 from gamehub.core.events.game_state_update import (
@@ -6,21 +7,29 @@ from gamehub.core.events.game_state_update import (
     TurnEnded,
     TurnStarted,
 )
+from gamehub.games.chinese_poker.bots import BotStrategy, PassingStrategy
 from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
 from gamehub.games.chinese_poker.game_state import ChinesePokerState
 from gamehub.games.chinese_poker.move import ChinesePokerMove
 from gamehub.games.chinese_poker.player import player_initial_state
 from gamehub.games.chinese_poker.status import ChinesePokerStatus
 from gamehub.games.chinese_poker.transitions import (
+    legal_moves,
     next_automated_state,
     state_after_move,
 )
-from gamehub.games.playing_cards import PlayingCard
 
 
 class ChinesePokerGameLogic:
-    def __init__(self, configuration: ChinesePokerConfiguration):
+    def __init__(
+        self,
+        configuration: ChinesePokerConfiguration,
+        rng: Optional[Random] = None,
+        bot_strategy: Optional[BotStrategy] = None,
+    ):
         self._configuration = configuration
+        self._rng = rng or Random()
+        self._bot_strategy = bot_strategy or PassingStrategy()
 
     @property
     def game_type(self) -> str:
@@ -34,6 +43,15 @@ class ChinesePokerGameLogic:
     def num_players(self) -> int:
         return self._configuration.num_players
 
+    def reseed(self, seed: int) -> None:
+        self._rng.seed(seed)
+
+    def random_state(self) -> object:
+        return self._rng.getstate()
+
+    def restore_random_state(self, state: object) -> None:
+        self._rng.setstate(state)
+
     @staticmethod
     def initial_state(*player_ids: str) -> ChinesePokerState:
         return ChinesePokerState(
@@ -46,10 +64,13 @@ class ChinesePokerGameLogic:
     ) -> ChinesePokerState:
         return state_after_move(state, move, self._configuration)
 
+    def legal_moves(self, state: ChinesePokerState) -> Iterator[ChinesePokerMove]:
+        return legal_moves(state, self._configuration)
+
     def next_automated_state(
         self, state: ChinesePokerState
     ) -> Optional[ChinesePokerState]:
-        return next_automated_state(state, self._configuration)
+        return next_automated_state(state, self._configuration, self._rng)
 
     @staticmethod
     def derived_events(
@@ -68,21 +89,11 @@ class ChinesePokerGameLogic:
         elif state.status == ChinesePokerStatus.END_TURN:
             yield TurnEnded(room_id=room_id, player_id=state.current_player_id())
 
-    @staticmethod
-    def _automatic_move_cards(state: ChinesePokerState) -> tuple[PlayingCard]:
-        if state.move_history:
-            return tuple()
-        else:
-            return (state.current_player().smallest_card(),)
-
-    def state_after_timeout(
+    def timeout_move(
         self, state: ChinesePokerState, timed_out_player_id: str
-    ) -> Optional[ChinesePokerState]:
+    ) -> Optional[ChinesePokerMove]:
         if (state.status == ChinesePokerStatus.AWAIT_PLAYER_ACTION) and (
             state.current_player_id() == timed_out_player_id
         ):
-            cards = self._automatic_move_cards(state)
-            move = ChinesePokerMove(
-                player_id=timed_out_player_id, cards=cards, is_bot_move=True
-            )
-            return self.make_move(state, move)
+            move = self._bot_strategy.choose_move(state, self._configuration)
+            return move.model_copy(update={"is_bot_move": True})
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Iterator, Optional
 
 from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
-from gamehub.games.chinese_poker.hand import card_value
+from gamehub.games.chinese_poker.hand import card_set as cs
 from gamehub.games.chinese_poker.move import ChinesePokerMove
 from gamehub.games.chinese_poker.player import ChinesePokerPlayer, players_shared_views
 from gamehub.games.chinese_poker.status import ChinesePokerStatus
@@ -31,15 +31,17 @@ class ChinesePokerState:
         return all(move.is_pass for move in self.move_history[-num_passes_to_check:])
 
     def next_player_has_zero_cards(self) -> bool:
-        return len(self.players[self.next_player_idx()].cards) == 0
+        return self.players[self.next_player_idx()].num_cards == 0
 
     def some_player_has_zero_cards(self) -> bool:
-        return any(len(player.cards) == 0 for player in self.players)
+        return any(player.num_cards == 0 for player in self.players)
 
     def idx_of_player_with_smallest_card(self) -> int:
-        return min(
-            range(len(self.players)),
-            key=lambda idx: card_value(self.players[idx].smallest_card()),
+        smallest_card_bit = self.smallest_card_bit()
+        return next(
+            idx
+            for idx, player in enumerate(self.players)
+            if player.card_set & smallest_card_bit
         )
 
     def current_player(self) -> Optional[ChinesePokerPlayer]:
@@ -88,10 +90,19 @@ class ChinesePokerState:
         return self.status == ChinesePokerStatus.END_GAME
 
     def is_first_turn_of_match(self, num_cards_per_player) -> bool:
-        return all(len(player.cards) == num_cards_per_player for player in self.players)
+        return all(player.num_cards == num_cards_per_player for player in self.players)
+
+    def all_cards(self) -> cs.CardSet:
+        card_set = cs.EMPTY_CARD_SET
+        for player in self.players:
+            card_set |= player.card_set
+        return card_set
+
+    def smallest_card_bit(self) -> cs.CardSet:
+        return cs.lowest_card_bit(self.all_cards())
 
     def smallest_card(self) -> PlayingCard:
-        return min((player.smallest_card() for player in self.players), key=card_value)
+        return cs.lowest_card(self.all_cards())
 
     def hand_to_beat(self) -> Optional[ChinesePokerMove]:
         for move in reversed(self.move_history):
@@ -1,4 +1,13 @@
+from gamehub.games.chinese_poker.hand.card_set import CardSet, to_card_set, to_cards
 from gamehub.games.chinese_poker.hand.card_value import card_value
-from gamehub.games.chinese_poker.hand.hand_value import hand_value
+from gamehub.games.chinese_poker.hand.hand_value import HandRank, hand_rank, hand_value
 
-__all__ = ["card_value", "hand_value"]
+__all__ = [
+    "CardSet",
+    "HandRank",
+    "card_value",
+    "hand_rank",
+    "hand_value",
+    "to_card_set",
+    "to_cards",
+]
@@ -0,0 +1,63 @@
+from typing import Iterable
+
+from gamehub.games.chinese_poker.hand.card_value import (
+    RANKS_BY_VALUE,
+    SUITS_BY_VALUE,
+    card_value,
+)
+from gamehub.games.playing_cards import PlayingCard
+
+CardSet = int
+
+EMPTY_CARD_SET: CardSet = 0
+
+CARDS_BY_BIT: tuple[PlayingCard, ...] = tuple(
+    PlayingCard(rank=rank, suit=suit)
+    for rank in RANKS_BY_VALUE
+    for suit in SUITS_BY_VALUE
+)
+
+_LOWEST_CARD_VALUE = card_value(CARDS_BY_BIT[0])
+
+_CARD_BITS = {
+    (card.rank, card.suit): 1 << (card_value(card) - _LOWEST_CARD_VALUE)
+    for card in CARDS_BY_BIT
+}
+
+
+def card_bit(card: PlayingCard) -> CardSet:
+    return _CARD_BITS[card.rank, card.suit]
+
+
+def to_card_set(cards: Iterable[PlayingCard]) -> CardSet:
+    card_set = EMPTY_CARD_SET
+    for card in cards:
+        card_set |= _CARD_BITS[card.rank, card.suit]
+    return card_set
+
+
+def to_cards(card_set: CardSet) -> tuple[PlayingCard, ...]:
+    cards = []
+    while card_set:
+        lowest_bit = card_set & -card_set
+        cards.append(CARDS_BY_BIT[lowest_bit.bit_length() - 1])
+        card_set ^= lowest_bit
+    return tuple(cards)
+
+
+def num_cards(card_set: CardSet) -> int:
+    return card_set.bit_count()
+
+
+def lowest_card_bit(card_set: CardSet) -> CardSet:
+    return card_set & -card_set
+
+
+def lowest_card(card_set: CardSet) -> PlayingCard:
+    if not card_set:
+        raise ValueError("Empty card set")
+    return CARDS_BY_BIT[lowest_card_bit(card_set).bit_length() - 1]
+
+
+def contains_all(card_set: CardSet, cards: CardSet) -> bool:
+    return cards & ~card_set == EMPTY_CARD_SET
@@ -1,14 +1,24 @@
 from gamehub.games.playing_cards import PlayingCard, Suits
 
+RANKS_BY_VALUE = "3456789TJQKA2"
+SUITS_BY_VALUE = (Suits.DIAMONDS, Suits.HEARTS, Suits.SPADES, Suits.CLUBS)
+
+_RANK_VALUES = {rank: value for value, rank in enumerate(RANKS_BY_VALUE, start=3)}
+_SUIT_VALUES = {suit: value for value, suit in enumerate(SUITS_BY_VALUE)}
+_CARD_VALUES = {
+    (rank, suit): 4 * _RANK_VALUES[rank] + _SUIT_VALUES[suit]
+    for rank in RANKS_BY_VALUE
+    for suit in SUITS_BY_VALUE
+}
+
 
 def rank_value(rank: chr) -> int:
-    special_ranks = {"T": 10, "J": 11, "Q": 12, "K": 13, "A": 14, "2": 15}
-    return special_ranks[rank] if rank in special_ranks else int(rank)
+    return _RANK_VALUES[rank]
 
 
 def suit_value(suit: Suits) -> int:
-    return [Suits.DIAMONDS, Suits.HEARTS, Suits.SPADES, Suits.CLUBS].index(suit)
+    return _SUIT_VALUES[suit]
 
 
 def card_value(card: PlayingCard) -> int:
-    return 4 * rank_value(card.rank) + suit_value(card.suit)
+    return _CARD_VALUES[card.rank, card.suit]
@@ -1,8 +1,17 @@
+from bisect import bisect_right
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Optional
-
+from functools import cache
+from itertools import combinations, product
+from typing import Iterator, Optional
+
+from gamehub.games.chinese_poker.hand.card_set import (
+    CARDS_BY_BIT,
+    CardSet,
+    to_card_set,
+)
 from gamehub.games.chinese_poker.hand.card_value import (
+    RANKS_BY_VALUE,
     card_value,
     rank_value,
     suit_value,
@@ -10,12 +19,30 @@ from gamehub.games.chinese_poker.hand.card_value import (
 from gamehub.games.chinese_poker.hand.hand_type import HandType
 from gamehub.games.playing_cards import PlayingCard
 
+HandRank = int
+
+VALID_HAND_SIZES = (1, 2, 3, 5)
+
+_MAX_LEXICOGRAPHIC_VALUES = 6
+_BITS_PER_VALUE = 6
+
+_STRAIGHT_RANKS = tuple(
+    RANKS_BY_VALUE[i : i + 5] for i in range(len(RANKS_BY_VALUE) - 5)
+) + ("3456" + "2", "345" + "A2")
+
 
 @dataclass(frozen=True, order=True)
 class _HandValue:
     hand_type: HandType
     lexicographic_values: tuple[int, ...]
 
+    def rank(self) -> HandRank:
+        padding = (0,) * (_MAX_LEXICOGRAPHIC_VALUES - len(self.lexicographic_values))
+        rank = self.hand_type.value
+        for value in self.lexicographic_values + padding:
+            rank = rank << _BITS_PER_VALUE | value
+        return rank
+
 
 def _last_card_in_straight(cards: set[PlayingCard]) -> Optional[PlayingCard]:
     sorted_cards = sorted(cards, key=lambda card: rank_value(card.rank))
@@ -80,11 +107,65 @@ def _five_card_hand_value(cards: set[PlayingCard]) -> _HandValue:
         raise ValueError("Invalid hand")
 
 
-def hand_value(hand: tuple[PlayingCard, ...]) -> _HandValue:
-    cards = set(hand)
+def _evaluate(cards: set[PlayingCard]) -> _HandValue:
     if 1 <= len(cards) <= 3:
         return _high_card_to_three_of_a_kink_value(cards)
     elif len(cards) == 5:
         return _five_card_hand_value(cards)
     else:
         raise ValueError("Invalid hand")
+
+
+def _candidate_hands() -> Iterator[tuple[PlayingCard, ...]]:
+    cards_by_rank = defaultdict(list)
+    cards_by_suit = defaultdict(list)
+    for card in CARDS_BY_BIT:
+        cards_by_rank[card.rank].append(card)
+        cards_by_suit[card.suit].append(card)
+
+    for same_rank in cards_by_rank.values():
+        for size in (1, 2, 3):
+            yield from combinations(same_rank, size)
+    for rank_a, rank_b in combinations(RANKS_BY_VALUE, 2):
+        for size_a in (1, 2, 3, 4):
+            for cards_a in combinations(cards_by_rank[rank_a], size_a):
+                for cards_b in combinations(cards_by_rank[rank_b], 5 - size_a):
+                    yield cards_a + cards_b
+    for ranks in _STRAIGHT_RANKS:
+        yield from product(*(cards_by_rank[rank] for rank in ranks))
+    for same_suit in cards_by_suit.values():
+        yield from combinations(same_suit, 5)
+
+
+@cache
+def _hand_ranks() -> dict[CardSet, HandRank]:
+    return {
+        to_card_set(hand): _evaluate(set(hand)).rank() for hand in _candidate_hands()
+    }
+
+
+@cache
+def _hands_by_size() -> dict[int, tuple[tuple[HandRank, CardSet], ...]]:
+    hands_by_size = defaultdict(list)
+    for card_set, rank in _hand_ranks().items():
+        hands_by_size[card_set.bit_count()].append((rank, card_set))
+    return {size: tuple(sorted(hands)) for size, hands in hands_by_size.items()}
+
+
+def hand_rank(card_set: CardSet) -> HandRank:
+    if (rank := _hand_ranks().get(card_set)) is None:
+        raise ValueError("Invalid hand")
+    return rank
+
+
+def hand_value(hand: tuple[PlayingCard, ...]) -> HandRank:
+    return hand_rank(to_card_set(hand))
+
+
+def hands_ranked_above(
+    size: int, rank: Optional[HandRank] = None
+) -> Iterator[tuple[HandRank, CardSet]]:
+    hands = _hands_by_size().get(size, ())
+    start = 0 if rank is None else bisect_right(hands, (rank, 1 << len(CARDS_BY_BIT)))
+    for idx in range(start, len(hands)):
+        yield hands[idx]
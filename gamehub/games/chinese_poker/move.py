@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 
+from gamehub.games.chinese_poker.hand import CardSet, to_card_set
 from gamehub.games.playing_cards import PlayingCard
 
 
@@ -11,3 +12,7 @@ class ChinesePokerMove(BaseModel):
     @property
     def is_pass(self) -> bool:
         return not self.cards
+
+    @property
+    def card_set(self) -> CardSet:
+        return to_card_set(self.cards)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Iterable, Iterator
 
 from gamehub.games.chinese_poker.credits import calculate_credits
-from gamehub.games.chinese_poker.hand import card_value
+from gamehub.games.chinese_poker.hand import card_set as cs
 from gamehub.games.chinese_poker.views import ChinesePokerPlayerSharedView
 from gamehub.games.playing_cards import PlayingCard
 
@@ -11,38 +11,45 @@ from gamehub.games.playing_cards import PlayingCard
 class ChinesePokerPlayer:
     player_id: str
     num_points: int
-    cards: tuple[PlayingCard, ...]
+    card_set: cs.CardSet = cs.EMPTY_CARD_SET
+
+    @property
+    def cards(self) -> tuple[PlayingCard, ...]:
+        return cs.to_cards(self.card_set)
+
+    @property
+    def num_cards(self) -> int:
+        return cs.num_cards(self.card_set)
 
     def deal_cards(self, cards: tuple[PlayingCard, ...]) -> "ChinesePokerPlayer":
         return ChinesePokerPlayer(
             player_id=self.player_id,
             num_points=self.num_points,
-            cards=cards,
+            card_set=cs.to_card_set(cards),
         )
 
-    def remove_cards(self, cards: tuple[PlayingCard, ...]) -> "ChinesePokerPlayer":
+    def remove_cards(self, card_set: cs.CardSet) -> "ChinesePokerPlayer":
         return ChinesePokerPlayer(
             player_id=self.player_id,
             num_points=self.num_points,
-            cards=tuple(card for card in self.cards if card not in cards),
+            card_set=self.card_set & ~card_set,
         )
 
     def increment_points(self) -> "ChinesePokerPlayer":
         return ChinesePokerPlayer(
             player_id=self.player_id,
-            num_points=self.num_points + len(self.cards),
-            cards=tuple(),
+            num_points=self.num_points + self.num_cards,
         )
 
     def smallest_card(self) -> PlayingCard:
-        return min(self.cards, key=card_value)
+        return cs.lowest_card(self.card_set)
 
-    def has_cards(self, cards: tuple[PlayingCard, ...]) -> bool:
-        return all(card in self.cards for card in cards)
+    def has_cards(self, card_set: cs.CardSet) -> bool:
+        return cs.contains_all(self.card_set, card_set)
 
 
 def player_initial_state(player_id: str) -> ChinesePokerPlayer:
-    return ChinesePokerPlayer(player_id=player_id, num_points=0, cards=tuple())
+    return ChinesePokerPlayer(player_id=player_id, num_points=0)
 
 
 def players_shared_views(
@@ -54,7 +61,7 @@ def players_shared_views(
         ChinesePokerPlayerSharedView(
             player_id=p.player_id,
             num_points=p.num_points,
-            num_cards=len(p.cards),
+            num_cards=p.num_cards,
             partial_credits=partial_credits[p.player_id],
         )
         for p in players
@@ -0,0 +1,99 @@
+import argparse
+import csv
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from random import Random
+from typing import Iterable, Optional, TextIO
+
+from gamehub.games.chinese_poker.bots import BotStrategy, GreedyStrategy
+from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
+from gamehub.games.chinese_poker.credits import calculate_credits
+from gamehub.games.chinese_poker.game_logic import ChinesePokerGameLogic
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
+
+
+@dataclass(frozen=True)
+class GameResult:
+    seed: int
+    num_matches: int
+    num_moves: int
+    points: tuple[int, ...]
+    credits: tuple[int, ...]
+
+    def to_row(self) -> tuple[int, ...]:
+        return (
+            (self.seed, self.num_matches, self.num_moves) + self.points + self.credits
+        )
+
+
+def simulate_game(
+    configuration: ChinesePokerConfiguration,
+    seed: int,
+    strategy: BotStrategy = GreedyStrategy(),
+) -> GameResult:
+    game_logic = ChinesePokerGameLogic(configuration, Random(seed))
+    player_ids = [f"player_{idx}" for idx in range(configuration.num_players)]
+    state = game_logic.initial_state(*player_ids)
+    num_matches = num_moves = 0
+    while not state.is_terminal():
+        if state.status == ChinesePokerStatus.AWAIT_PLAYER_ACTION:
+            state = game_logic.make_move(
+                state, strategy.choose_move(state, configuration)
+            )
+            num_moves += 1
+        else:
+            state = game_logic.next_automated_state(state)
+            num_matches += state.status == ChinesePokerStatus.DEAL_CARDS
+    points = {player.player_id: player.num_points for player in state.players}
+    credits = calculate_credits(points, configuration.credits_per_point)
+    return GameResult(
+        seed=seed,
+        num_matches=num_matches,
+        num_moves=num_moves,
+        points=tuple(points.values()),
+        credits=tuple(credits[player_id] for player_id in points),
+    )
+
+
+def run_simulations(
+    configuration: ChinesePokerConfiguration,
+    seeds: Iterable[int],
+    output: TextIO,
+    strategy: BotStrategy = GreedyStrategy(),
+    max_workers: Optional[int] = None,
+) -> int:
+    writer = csv.writer(output)
+    num_games = 0
+    simulate = partial(simulate_game, configuration, strategy=strategy)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(simulate, seeds, chunksize=64):
+            writer.writerow(result.to_row())
+            num_games += 1
+    return num_games
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run headless Chinese poker games")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--num-players", type=int, default=4)
+    parser.add_argument("--cards-per-player", type=int, default=13)
+    parser.add_argument("--point-threshold", type=int, default=25)
+    parser.add_argument("--credits-per-point", type=int, default=100)
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    args = parser.parse_args(argv)
+    configuration = ChinesePokerConfiguration(
+        num_players=args.num_players,
+        cards_per_player=args.cards_per_player,
+        game_over_point_threshold=args.point_threshold,
+        credits_per_point=args.credits_per_point,
+    )
+    seeds = range(args.seed, args.seed + args.games)
+    run_simulations(configuration, seeds, args.output, max_workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
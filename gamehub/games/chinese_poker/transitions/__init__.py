@@ -1,6 +1,7 @@
 from gamehub.games.chinese_poker.transitions.automated_transitions import (
     next_automated_state,
 )
+from gamehub.games.chinese_poker.transitions.legal_moves import legal_moves
 from gamehub.games.chinese_poker.transitions.move_transitions import state_after_move
 
-__all__ = ["next_automated_state", "state_after_move"]
+__all__ = ["legal_moves", "next_automated_state", "state_after_move"]
@@ -1,4 +1,4 @@
-from functools import partial
+from random import Random
 from typing import Optional
 
 from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
@@ -15,11 +15,14 @@ def _from_start_game(state: ChinesePokerState) -> ChinesePokerState:
 
 
 def _from_start_match(
-    state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    state: ChinesePokerState,
+    configuration: ChinesePokerConfiguration,
+    rng: Optional[Random],
 ) -> ChinesePokerState:
     hands = deal_hands(
         num_hands=configuration.num_players,
         hand_size=configuration.cards_per_player,
+        rng=rng,
     )
     return ChinesePokerState(
         status=ChinesePokerStatus.DEAL_CARDS,
@@ -104,23 +107,25 @@ def _from_update_points(
         )
 
 
+_TRANSITIONS = {
+    ChinesePokerStatus.START_GAME: _from_start_game,
+    ChinesePokerStatus.DEAL_CARDS: _from_deal_cards,
+    ChinesePokerStatus.START_ROUND: _from_start_round,
+    ChinesePokerStatus.START_TURN: _from_start_turn,
+    ChinesePokerStatus.END_TURN: _from_end_turn,
+    ChinesePokerStatus.END_ROUND: _from_end_round,
+    ChinesePokerStatus.END_MATCH: _from_end_match,
+}
+
+
 def next_automated_state(
-    state: ChinesePokerState, configuration: ChinesePokerConfiguration
+    state: ChinesePokerState,
+    configuration: ChinesePokerConfiguration,
+    rng: Optional[Random] = None,
 ) -> Optional[ChinesePokerState]:
-    transitions = {
-        ChinesePokerStatus.START_GAME: _from_start_game,
-        ChinesePokerStatus.START_MATCH: partial(
-            _from_start_match, configuration=configuration
-        ),
-        ChinesePokerStatus.DEAL_CARDS: _from_deal_cards,
-        ChinesePokerStatus.START_ROUND: _from_start_round,
-        ChinesePokerStatus.START_TURN: _from_start_turn,
-        ChinesePokerStatus.END_TURN: _from_end_turn,
-        ChinesePokerStatus.END_ROUND: _from_end_round,
-        ChinesePokerStatus.END_MATCH: _from_end_match,
-        ChinesePokerStatus.UPDATE_POINTS: partial(
-            _from_update_points, configuration=configuration
-        ),
-    }
-    if state.status in transitions:
-        return transitions[state.status](state)
+    if transition := _TRANSITIONS.get(state.status):
+        return transition(state)
+    elif state.status == ChinesePokerStatus.START_MATCH:
+        return _from_start_match(state, configuration, rng)
+    elif state.status == ChinesePokerStatus.UPDATE_POINTS:
+        return _from_update_points(state, configuration)
@@ -0,0 +1,45 @@
+from heapq import merge
+from typing import Iterator
+
+from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
+from gamehub.games.chinese_poker.game_state import ChinesePokerState
+from gamehub.games.chinese_poker.hand import CardSet, hand_rank, to_cards
+from gamehub.games.chinese_poker.hand.hand_value import (
+    VALID_HAND_SIZES,
+    hands_ranked_above,
+)
+from gamehub.games.chinese_poker.move import ChinesePokerMove
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
+
+
+def _playable_card_sets(
+    state: ChinesePokerState, configuration: ChinesePokerConfiguration
+) -> Iterator[CardSet]:
+    if hand_to_beat := state.hand_to_beat():
+        ranked_hands = hands_ranked_above(
+            len(hand_to_beat.cards), hand_rank(hand_to_beat.card_set)
+        )
+    else:
+        ranked_hands = merge(*(hands_ranked_above(size) for size in VALID_HAND_SIZES))
+
+    owned_cards = state.current_player().card_set
+    required_cards = (
+        state.smallest_card_bit()
+        if state.is_first_turn_of_match(configuration.cards_per_player)
+        else 0
+    )
+    for _, card_set in ranked_hands:
+        if card_set & ~owned_cards == 0 and card_set & required_cards == required_cards:
+            yield card_set
+
+
+def legal_moves(
+    state: ChinesePokerState, configuration: ChinesePokerConfiguration
+) -> Iterator[ChinesePokerMove]:
+    if state.status != ChinesePokerStatus.AWAIT_PLAYER_ACTION:
+        return
+    player_id = state.current_player_id()
+    for card_set in _playable_card_sets(state, configuration):
+        yield ChinesePokerMove(player_id=player_id, cards=to_cards(card_set))
+    if state.move_history:
+        yield ChinesePokerMove(player_id=player_id, cards=())
@@ -11,7 +11,7 @@ from gamehub.games.chinese_poker.transitions.move_validator import (
 def _players_after_move(state: ChinesePokerState, move: ChinesePokerMove):
     for player in state.players:
         if player.player_id == move.player_id:
-            yield player.remove_cards(move.cards)
+            yield player.remove_cards(move.card_set)
         else:
             yield player
 
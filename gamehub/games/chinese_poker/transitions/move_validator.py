@@ -4,7 +4,7 @@ from typing import Optional
 from gamehub.core.exceptions import InvalidMoveError
 from gamehub.games.chinese_poker.configuration import ChinesePokerConfiguration
 from gamehub.games.chinese_poker.game_state import ChinesePokerState
-from gamehub.games.chinese_poker.hand import hand_value
+from gamehub.games.chinese_poker.hand import hand_rank
 from gamehub.games.chinese_poker.move import ChinesePokerMove
 from gamehub.games.chinese_poker.status import ChinesePokerStatus
 
@@ -27,7 +27,7 @@ def _turn_checker(ctx: MoveContext) -> Optional[str]:
 
 
 def _own_cards_checker(ctx: MoveContext) -> Optional[str]:
-    if not ctx.state.current_player().has_cards(ctx.move.cards):
+    if not ctx.state.current_player().has_cards(ctx.move.card_set):
         return "You do not have those cards"
 
 
@@ -39,7 +39,7 @@ def _pass_checker(ctx: MoveContext) -> Optional[str]:
 def _smallest_card_checker(ctx: MoveContext) -> Optional[str]:
     if (
         ctx.state.is_first_turn_of_match(ctx.configuration.cards_per_player)
-        and ctx.state.smallest_card() not in ctx.move.cards
+        and not ctx.state.smallest_card_bit() & ctx.move.card_set
     ):
         return "First player of the match must use smallest card"
 
@@ -47,14 +47,14 @@ def _smallest_card_checker(ctx: MoveContext) -> Optional[str]:
 def _hand_checker(ctx: MoveContext) -> Optional[str]:
     if not ctx.move.is_pass:
         try:
-            move_value = hand_value(ctx.move.cards)
+            move_value = hand_rank(ctx.move.card_set)
         except ValueError as e:
             return str(e)
 
         if hand_to_beat := ctx.state.hand_to_beat():
             if len(ctx.move.cards) != len(hand_to_beat.cards):
                 return "Must use the same number of cards as the hand to beat"
-            elif move_value <= hand_value(hand_to_beat.cards):
+            elif move_value <= hand_rank(hand_to_beat.card_set):
                 return "Hand does not beat previous hand"
 
 
@@ -1,5 +1,5 @@
-from gamehub.games.playing_cards.deal_hands import deal_hands
+from gamehub.games.playing_cards.deal_hands import STANDARD_DECK, deal_hands
 from gamehub.games.playing_cards.playing_card import PlayingCard
 from gamehub.games.playing_cards.suits import Suits
 
-__all__ = ["deal_hands", "PlayingCard", "Suits"]
+__all__ = ["deal_hands", "PlayingCard", "STANDARD_DECK", "Suits"]
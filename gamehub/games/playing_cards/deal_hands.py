@@ -1,15 +1,21 @@
-from random import shuffle
-from typing import Iterator
+import random
+from typing import Iterator, Optional
 
 from gamehub.games.playing_cards.playing_card import PlayingCard
 from gamehub.games.playing_cards.suits import Suits
 
+STANDARD_DECK: tuple[PlayingCard, ...] = tuple(
+    PlayingCard(rank=rank, suit=suit) for rank in "23456789TJQKA" for suit in Suits
+)
 
-def deal_hands(num_hands: int, hand_size: int) -> Iterator[tuple[PlayingCard, ...]]:
-    if num_hands * hand_size > 52:
+
+def deal_hands(
+    num_hands: int, hand_size: int, rng: Optional[random.Random] = None
+) -> Iterator[tuple[PlayingCard, ...]]:
+    num_cards = num_hands * hand_size
+    if num_cards > len(STANDARD_DECK):
         raise ValueError("Cannot deal more than 52 cards")
-    ranks = "23456789TJQKA"
-    deck = [PlayingCard(rank=rank, suit=suit) for rank in ranks for suit in Suits]
-    shuffle(deck)
+    sample = rng.sample if rng is not None else random.sample
+    dealt_cards = sample(STANDARD_DECK, num_cards)
     for i in range(num_hands):
-        yield tuple(deck[i * hand_size : (i + 1) * hand_size])
+        yield tuple(dealt_cards[i * hand_size : (i + 1) * hand_size])
@@ -17,6 +17,18 @@ class RPSGameLogic:
     def configuration(self):
         return None
 
+    @staticmethod
+    def reseed(seed: int) -> None:
+        pass
+
+    @staticmethod
+    def random_state() -> object:
+        return None
+
+    @staticmethod
+    def restore_random_state(state: object) -> None:
+        pass
+
     @staticmethod
     def initial_state(*player_ids: str) -> RPSGameState:
         return RPSGameState(
@@ -47,7 +59,7 @@ class RPSGameLogic:
         return iter([])
 
     @staticmethod
-    def state_after_timeout(
+    def timeout_move(
         state: RPSGameState, timed_out_player_id: str
-    ) -> Optional[RPSGameState]:
+    ) -> Optional[RPSMove]:
         return None
@@ -19,6 +19,18 @@ class TicTacToeGameLogic:
     def configuration(self):
         return None
 
+    @staticmethod
+    def reseed(seed: int) -> None:
+        pass
+
+    @staticmethod
+    def random_state() -> object:
+        return None
+
+    @staticmethod
+    def restore_random_state(state: object) -> None:
+        pass
+
     @staticmethod
     def initial_state(*player_ids: str) -> TicTacToeState:
         return TicTacToeState(
@@ -55,7 +67,7 @@ class TicTacToeGameLogic:
         return iter([])
 
     @staticmethod
-    def state_after_timeout(
+    def timeout_move(
         state: TicTacToeState, timed_out_player_id: str
-    ) -> Optional[TicTacToeState]:
+    ) -> Optional[TicTacToeMove]:
         return None
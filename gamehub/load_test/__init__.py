@@ -0,0 +1,5 @@
+from gamehub.load_test.report import LoadReport
+from gamehub.load_test.runner import run_scenario
+from gamehub.load_test.scenario import Scenario, load_scenario
+
+__all__ = ["LoadReport", "Scenario", "load_scenario", "run_scenario"]
@@ -0,0 +1,3 @@
+from gamehub.load_test.cli import main
+
+main()
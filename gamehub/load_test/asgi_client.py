@@ -0,0 +1,99 @@
+import asyncio
+from contextlib import asynccontextmanager
+from itertools import count
+from typing import AsyncIterator, Optional
+from urllib.parse import urlencode
+
+from starlette.types import ASGIApp, Message
+
+_client_ports = count(10_000)
+
+
+@asynccontextmanager
+async def asgi_lifespan(app: ASGIApp) -> AsyncIterator[None]:
+    incoming: asyncio.Queue[Message] = asyncio.Queue()
+    outgoing: asyncio.Queue[Message] = asyncio.Queue()
+    scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+    task = asyncio.create_task(app(scope, incoming.get, outgoing.put))
+    await incoming.put({"type": "lifespan.startup"})
+    started = await outgoing.get()
+    if started["type"] != "lifespan.startup.complete":
+        await task
+        raise RuntimeError(f"Application failed to start: {started.get('message')}")
+    try:
+        yield
+    finally:
+        await incoming.put({"type": "lifespan.shutdown"})
+        await outgoing.get()
+        await task
+
+
+class AsgiWebSocket:
+    def __init__(self, app: ASGIApp, path: str, query_params: dict[str, str]):
+        self._app = app
+        self._scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "scheme": "ws",
+            "server": ("testserver", 80),
+            "client": ("127.0.0.1", next(_client_ports)),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(query_params).encode(),
+            "headers": [(b"host", b"testserver")],
+            "subprotocols": [],
+        }
+        self._incoming: asyncio.Queue[Message] = asyncio.Queue()
+        self._frames: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._handshake: Optional[asyncio.Future[bool]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._is_closed = False
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    async def connect(self) -> None:
+        self._handshake = asyncio.get_running_loop().create_future()
+        self._incoming.put_nowait({"type": "websocket.connect"})
+        self._task = asyncio.create_task(self._run())
+        if not await self._handshake:
+            raise ConnectionError(f"Websocket rejected: {self._scope['path']}")
+
+    async def _run(self) -> None:
+        try:
+            await self._app(self._scope, self._incoming.get, self._send)
+        finally:
+            self._mark_closed()
+
+    def _mark_closed(self) -> None:
+        if not self._handshake.done():
+            self._handshake.set_result(False)
+        if not self._is_closed:
+            self._is_closed = True
+            self._frames.put_nowait(None)
+
+    async def _send(self, message: Message) -> None:
+        if message["type"] == "websocket.accept":
+            if not self._handshake.done():
+                self._handshake.set_result(True)
+        elif message["type"] == "websocket.send":
+            self._frames.put_nowait(message.get("text") or message["bytes"].decode())
+        elif message["type"] == "websocket.close":
+            self._mark_closed()
+
+    def send_text(self, text: str) -> None:
+        self._incoming.put_nowait({"type": "websocket.receive", "text": text})
+
+    async def receive_text(self) -> Optional[str]:
+        frame = await self._frames.get()
+        if frame is None:
+            self._frames.put_nowait(None)
+        return frame
+
+    async def close(self) -> None:
+        self._incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+        if self._task is not None:
+            await asyncio.shield(self._task)
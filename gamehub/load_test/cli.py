@@ -0,0 +1,35 @@
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+from dataclasses import asdict, replace
+from typing import Optional
+
+from gamehub.load_test.runner import run_scenario
+from gamehub.load_test.scenario import load_scenario
+
+
+def _import_app(app_path: str):
+    module_name, _, attribute = app_path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive the server in-process with simulated websocket clients"
+    )
+    parser.add_argument("scenario", help="Path to a JSON scenario file")
+    parser.add_argument("--app", default="gamehub.server:app")
+    parser.add_argument("--duration", type=float, default=None)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.ERROR)
+    scenario = load_scenario(args.scenario)
+    if args.duration is not None:
+        scenario = replace(scenario, duration_seconds=args.duration)
+    report = asyncio.run(run_scenario(_import_app(args.app), scenario))
+    if args.json:
+        print(json.dumps(asdict(report)))
+    else:
+        print("\n".join(report.lines()))
@@ -0,0 +1,132 @@
+from random import Random
+from typing import Optional, Protocol
+
+from gamehub.games.chinese_poker.hand import card_value
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
+from gamehub.games.playing_cards import PlayingCard
+from gamehub.games.rock_paper_scissors.selection import RPSSelection
+
+
+class GamePolicy(Protocol):
+    @property
+    def num_players(self) -> int: ...
+
+    @staticmethod
+    def is_over(shared_view: dict) -> bool: ...
+
+    @staticmethod
+    def is_turn(player_id: str, shared_view: dict) -> bool: ...
+
+    @staticmethod
+    def move_applied(player_id: str, shared_view: dict) -> bool: ...
+
+    # Candidates are tried in order until one is accepted, so the last one must
+    # always be legal. Without a random generator the policy is scripted.
+    @staticmethod
+    def candidate_moves(
+        player_id: str,
+        shared_view: dict,
+        private_view: Optional[dict],
+        rng: Optional[Random],
+    ) -> list[dict]: ...
+
+
+class ChinesePokerPolicy:
+    num_players = 4
+
+    @staticmethod
+    def is_over(shared_view: dict) -> bool:
+        return shared_view["status"] == ChinesePokerStatus.END_GAME.value
+
+    @staticmethod
+    def is_turn(player_id: str, shared_view: dict) -> bool:
+        return (
+            shared_view["status"] == ChinesePokerStatus.AWAIT_PLAYER_ACTION.value
+            and shared_view.get("current_player_id") == player_id
+        )
+
+    @staticmethod
+    def move_applied(player_id: str, shared_view: dict) -> bool:
+        return True
+
+    @staticmethod
+    def candidate_moves(
+        player_id: str,
+        shared_view: dict,
+        private_view: Optional[dict],
+        rng: Optional[Random],
+    ) -> list[dict]:
+        cards = private_view["cards"] if private_view else []
+        smallest = min(cards, key=lambda c: card_value(PlayingCard(**c)), default=None)
+        is_leading = not shared_view["move_history"]
+        if is_leading:
+            moves = [{"cards": [smallest]}]
+        else:
+            moves = [{"cards": []}]
+        if rng is not None and cards and (is_leading or rng.random() < 0.5):
+            moves.insert(0, {"cards": [rng.choice(cards)]})
+        return moves
+
+
+class TicTacToePolicy:
+    num_players = 2
+
+    @staticmethod
+    def is_over(shared_view: dict) -> bool:
+        return shared_view["is_over"]
+
+    @staticmethod
+    def is_turn(player_id: str, shared_view: dict) -> bool:
+        return shared_view.get("current_player") == player_id
+
+    @staticmethod
+    def move_applied(player_id: str, shared_view: dict) -> bool:
+        return True
+
+    @staticmethod
+    def candidate_moves(
+        player_id: str,
+        shared_view: dict,
+        private_view: Optional[dict],
+        rng: Optional[Random],
+    ) -> list[dict]:
+        taken = {cell for p in shared_view["players"] for cell in p["selections"]}
+        free_cells = [cell for cell in range(9) if cell not in taken]
+        cell = free_cells[0] if rng is None else rng.choice(free_cells)
+        return [{"cell_index": cell}]
+
+
+class RockPaperScissorsPolicy:
+    num_players = 2
+
+    @staticmethod
+    def is_over(shared_view: dict) -> bool:
+        return shared_view.get("result") is not None
+
+    @staticmethod
+    def is_turn(player_id: str, shared_view: dict) -> bool:
+        return any(
+            player["player_id"] == player_id and not player["selected"]
+            for player in shared_view["players"]
+        )
+
+    @staticmethod
+    def move_applied(player_id: str, shared_view: dict) -> bool:
+        return not RockPaperScissorsPolicy.is_turn(player_id, shared_view)
+
+    @staticmethod
+    def candidate_moves(
+        player_id: str,
+        shared_view: dict,
+        private_view: Optional[dict],
+        rng: Optional[Random],
+    ) -> list[dict]:
+        selection = RPSSelection.ROCK if rng is None else rng.choice(list(RPSSelection))
+        return [{"selection": selection.value}]
+
+
+GAME_POLICIES: dict[str, GamePolicy] = {
+    "chinese_poker": ChinesePokerPolicy(),
+    "tic_tac_toe": TicTacToePolicy(),
+    "rock_paper_scissors": RockPaperScissorsPolicy(),
+}
@@ -0,0 +1,91 @@
+import math
+import resource
+from dataclasses import dataclass
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def peak_memory_bytes() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    scenario: str
+    num_clients: int
+    elapsed_seconds: float
+    moves: int
+    moves_per_second: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    messages_per_move: float
+    bytes_per_move: float
+    rejected_moves: int
+    disconnects: int
+    games_finished: int
+    peak_memory_bytes: int
+
+    def lines(self) -> list[str]:
+        return [
+            f"scenario            {self.scenario}",
+            f"clients             {self.num_clients}",
+            f"elapsed             {self.elapsed_seconds:.2f} s",
+            f"moves               {self.moves} ({self.moves_per_second:.1f}/s)",
+            f"latency p50/p95/p99 {self.latency_p50_ms:.2f} / "
+            f"{self.latency_p95_ms:.2f} / {self.latency_p99_ms:.2f} ms",
+            f"messages per move   {self.messages_per_move:.2f}",
+            f"bytes per move      {self.bytes_per_move:.0f}",
+            f"rejected moves      {self.rejected_moves}",
+            f"disconnects         {self.disconnects}",
+            f"games finished      {self.games_finished}",
+            f"peak memory         {self.peak_memory_bytes / 2**20:.1f} MiB",
+        ]
+
+
+class LoadMetrics:
+    def __init__(self):
+        self._latencies: list[float] = []
+        self._num_messages = 0
+        self._num_bytes = 0
+        self.rejected_moves = 0
+        self.disconnects = 0
+        self.games_finished = 0
+
+    @property
+    def num_moves(self) -> int:
+        return len(self._latencies)
+
+    def record_frame(self, frame: str) -> None:
+        self._num_messages += 1
+        self._num_bytes += len(frame.encode())
+
+    def record_move(self, latency_seconds: float) -> None:
+        self._latencies.append(latency_seconds)
+
+    def report(
+        self, scenario: str, num_clients: int, elapsed_seconds: float
+    ) -> LoadReport:
+        latencies_ms = sorted(latency * 1000 for latency in self._latencies)
+        num_moves = max(self.num_moves, 1)
+        return LoadReport(
+            scenario=scenario,
+            num_clients=num_clients,
+            elapsed_seconds=elapsed_seconds,
+            moves=self.num_moves,
+            moves_per_second=self.num_moves / elapsed_seconds,
+            latency_p50_ms=percentile(latencies_ms, 0.5),
+            latency_p95_ms=percentile(latencies_ms, 0.95),
+            latency_p99_ms=percentile(latencies_ms, 0.99),
+            messages_per_move=self._num_messages / num_moves,
+            bytes_per_move=self._num_bytes / num_moves,
+            rejected_moves=self.rejected_moves,
+            disconnects=self.disconnects,
+            games_finished=self.games_finished,
+            peak_memory_bytes=peak_memory_bytes(),
+        )
@@ -0,0 +1,232 @@
+import asyncio
+import json
+import time
+from random import Random
+from typing import Optional
+
+from starlette.types import ASGIApp
+
+from gamehub.core.events.request import RequestType
+from gamehub.core.message import MessageType
+from gamehub.load_test.asgi_client import AsgiWebSocket, asgi_lifespan
+from gamehub.load_test.policies import GAME_POLICIES
+from gamehub.load_test.report import LoadMetrics, LoadReport
+from gamehub.load_test.scenario import Scenario
+
+
+class SimulatedClient:
+    def __init__(self, app: ASGIApp, player_id: str, metrics: LoadMetrics):
+        self._app = app
+        self._player_id = player_id
+        self._metrics = metrics
+        self._socket: Optional[AsgiWebSocket] = None
+        self._last_seen: Optional[int] = None
+        self._buffer_id: Optional[str] = None
+        self.private_view: Optional[dict] = None
+        self.move_sent_at: Optional[float] = None
+        self.pending_moves: list[dict] = []
+        self.is_rejoining = False
+
+    @property
+    def player_id(self) -> str:
+        return self._player_id
+
+    async def connect(self) -> None:
+        self._socket = AsgiWebSocket(self._app, "/ws", {"player_id": self._player_id})
+        await self._socket.connect()
+
+    async def close(self) -> None:
+        if self._socket is not None:
+            await self._socket.close()
+
+    def send(self, request_type: RequestType, payload: dict) -> None:
+        self._socket.send_text(
+            json.dumps({"request_type": request_type.value, "payload": payload})
+        )
+
+    async def receive(self) -> Optional[dict]:
+        if (frame := await self._socket.receive_text()) is None:
+            return None
+        self._metrics.record_frame(frame)
+        message = json.loads(frame)
+        self._last_seen = message.get("sequence", self._last_seen)
+        self._buffer_id = message.get("buffer_id", self._buffer_id)
+        return message
+
+    async def wait_for_room(self) -> Optional[int]:
+        while message := await self.receive():
+            if message["message_type"] == MessageType.ERROR.value:
+                return None
+            elif message["message_type"] == MessageType.GAME_ROOM_UPDATE.value:
+                return message["payload"]["room_id"]
+
+    def send_move(self, room_id: int, move: dict) -> None:
+        self.move_sent_at = time.perf_counter()
+        self.send(RequestType.MAKE_MOVE, {"room_id": room_id, "move": move})
+
+    async def reconnect(self, room_id: int) -> None:
+        await self.close()
+        await self.connect()
+        self.is_rejoining = True
+        self.send(
+            RequestType.REJOIN_GAME,
+            {
+                "room_id": room_id,
+                "last_seen": self._last_seen,
+                "buffer_id": self._buffer_id,
+            },
+        )
+
+
+class SimulatedPlayer:
+    def __init__(
+        self,
+        client: SimulatedClient,
+        game_type: str,
+        scenario: Scenario,
+        metrics: LoadMetrics,
+    ):
+        self._client = client
+        self._game_type = game_type
+        self._policy = GAME_POLICIES[game_type]
+        self._scenario = scenario
+        self._metrics = metrics
+        self._rng = Random(f"{scenario.seed}:{client.player_id}")
+        self._move_rng = self._rng if scenario.policy == "random" else None
+        self.spectators: list[SimulatedClient] = []
+
+    @property
+    def clients(self) -> list[SimulatedClient]:
+        return [self._client, *self.spectators]
+
+    async def run(self) -> None:
+        while room_id := await self._join():
+            await asyncio.gather(
+                self._play(room_id),
+                *(self._watch(spectator, room_id) for spectator in self.spectators),
+            )
+
+    async def _join(self) -> Optional[int]:
+        player = self._client
+        player.send(RequestType.JOIN_GAME_BY_TYPE, {"game_type": self._game_type})
+        if (room_id := await player.wait_for_room()) is not None:
+            for spectator in self.spectators:
+                spectator.send(RequestType.WATCH_GAME, {"room_id": room_id})
+        return room_id
+
+    async def _make_move(self, room_id: int) -> None:
+        player = self._client
+        if self._scenario.think_time_seconds:
+            await asyncio.sleep(self._scenario.think_time_seconds)
+        player.send_move(room_id, player.pending_moves.pop(0))
+
+    def _record_game_over(self, shared_view: dict) -> None:
+        if shared_view["players"][0]["player_id"] == self._client.player_id:
+            self._metrics.games_finished += 1
+
+    async def _handle_game_state(self, room_id: int, payload: dict) -> bool:
+        player = self._client
+        player.private_view = payload.get("private_view", player.private_view)
+        if (shared_view := payload.get("shared_view")) is None:
+            return False
+        move_applied = False
+        if player.move_sent_at is not None and self._policy.move_applied(
+            player.player_id, shared_view
+        ):
+            self._metrics.record_move(time.perf_counter() - player.move_sent_at)
+            player.move_sent_at = None
+            move_applied = True
+        if self._policy.is_over(shared_view):
+            self._record_game_over(shared_view)
+            return True
+        if move_applied and self._rng.random() < self._scenario.disconnect_rate:
+            self._metrics.disconnects += 1
+            await player.reconnect(room_id)
+            return False
+        if player.move_sent_at is None and self._policy.is_turn(
+            player.player_id, shared_view
+        ):
+            player.pending_moves = self._policy.candidate_moves(
+                player.player_id, shared_view, player.private_view, self._move_rng
+            )
+            await self._make_move(room_id)
+        return False
+
+    async def _play(self, room_id: int) -> None:
+        player = self._client
+        player.private_view = None
+        while message := await player.receive():
+            message_type, payload = message["message_type"], message["payload"]
+            if message_type == MessageType.ERROR.value:
+                if player.is_rejoining:
+                    return
+                self._metrics.rejected_moves += 1
+                player.move_sent_at = None
+                if player.pending_moves:
+                    await self._make_move(room_id)
+                continue
+            player.is_rejoining = False
+            if (
+                message_type == MessageType.GAME_STATE.value
+                and payload["room_id"] == room_id
+                and await self._handle_game_state(room_id, payload)
+            ):
+                return
+
+    async def _watch(self, spectator: SimulatedClient, room_id: int) -> None:
+        while message := await spectator.receive():
+            payload = message["payload"]
+            if (
+                message["message_type"] == MessageType.GAME_STATE.value
+                and payload["room_id"] == room_id
+                and "shared_view" in payload
+                and self._policy.is_over(payload["shared_view"])
+            ):
+                return
+
+
+def _simulated_players(
+    app: ASGIApp, scenario: Scenario, metrics: LoadMetrics
+) -> list[SimulatedPlayer]:
+    players = []
+    for game_type in scenario.tables:
+        num_players = scenario.num_players(game_type)
+        players_of_type = [
+            SimulatedPlayer(
+                SimulatedClient(app, f"{game_type}-player-{idx}", metrics),
+                game_type,
+                scenario,
+                metrics,
+            )
+            for idx in range(num_players)
+        ]
+        for idx in range(scenario.num_spectators(game_type)):
+            spectator = SimulatedClient(app, f"{game_type}-spectator-{idx}", metrics)
+            players_of_type[idx % num_players].spectators.append(spectator)
+        players.extend(players_of_type)
+    return players
+
+
+async def _play(players: list[SimulatedPlayer], duration_seconds: float) -> None:
+    tasks = [asyncio.create_task(player.run()) for player in players]
+    done, pending = await asyncio.wait(tasks, timeout=duration_seconds)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        task.result()
+
+
+async def run_scenario(app: ASGIApp, scenario: Scenario) -> LoadReport:
+    metrics = LoadMetrics()
+    players = _simulated_players(app, scenario, metrics)
+    clients = [client for player in players for client in player.clients]
+    async with asgi_lifespan(app):
+        await asyncio.gather(*(client.connect() for client in clients))
+        started_at = time.perf_counter()
+        try:
+            await _play(players, scenario.duration_seconds)
+        finally:
+            elapsed_seconds = time.perf_counter() - started_at
+            await asyncio.gather(*(client.close() for client in clients))
+    return metrics.report(scenario.name, len(clients), elapsed_seconds)
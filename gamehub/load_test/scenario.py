@@ -0,0 +1,45 @@
+import json
+from dataclasses import dataclass
+from typing import Mapping
+
+from gamehub.load_test.policies import GAME_POLICIES
+
+POLICY_KINDS = ("scripted", "random")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    tables: Mapping[str, int]
+    duration_seconds: float = 10
+    spectator_ratio: float = 0
+    disconnect_rate: float = 0
+    think_time_seconds: float = 0
+    policy: str = "scripted"
+    seed: int = 0
+    description: str = ""
+
+    def __post_init__(self) -> None:
+        if unknown := set(self.tables) - set(GAME_POLICIES):
+            raise ValueError(f"Unknown game types: {', '.join(sorted(unknown))}")
+        if any(num_tables < 0 for num_tables in self.tables.values()):
+            raise ValueError("Number of tables cannot be negative")
+        if self.policy not in POLICY_KINDS:
+            raise ValueError(f"Policy must be one of {', '.join(POLICY_KINDS)}")
+        if self.duration_seconds <= 0:
+            raise ValueError("Duration must be positive")
+        if self.spectator_ratio < 0 or self.think_time_seconds < 0:
+            raise ValueError("Spectator ratio and think time cannot be negative")
+        if not 0 <= self.disconnect_rate <= 1:
+            raise ValueError("Disconnect rate must be between 0 and 1")
+
+    def num_players(self, game_type: str) -> int:
+        return self.tables[game_type] * GAME_POLICIES[game_type].num_players
+
+    def num_spectators(self, game_type: str) -> int:
+        return round(self.spectator_ratio * self.num_players(game_type))
+
+
+def load_scenario(path: str) -> Scenario:
+    with open(path, encoding="utf-8") as file:
+        return Scenario(**json.load(file))
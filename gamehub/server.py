@@ -1,11 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from gamehub.api.lifespan import lifespan
 from gamehub.api.routes.game_room import rooms_router
 from gamehub.api.routes.healthcheck import healthcheck_router
 from gamehub.api.routes.socket import socket_router
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
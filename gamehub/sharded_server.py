@@ -0,0 +1,57 @@
+import argparse
+import multiprocessing
+import os
+import socket
+import tempfile
+from typing import Optional
+
+import uvicorn
+
+
+def _serve_shard(
+    shard_index: int, num_shards: int, socket_dir: str, listener: socket.socket
+) -> None:
+    os.environ["GAMEHUB_SHARD_INDEX"] = str(shard_index)
+    os.environ["GAMEHUB_NUM_SHARDS"] = str(num_shards)
+    os.environ["GAMEHUB_SHARD_DIR"] = socket_dir
+    server = uvicorn.Server(uvicorn.Config("gamehub.server:app"))
+    server.run(sockets=[listener])
+
+
+def _listener(host: str, port: int) -> socket.socket:
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen()
+    listener.set_inheritable(True)
+    return listener
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve gamehub from sharded workers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--shards", type=int, default=os.cpu_count())
+    parser.add_argument("--socket-dir", default=tempfile.gettempdir())
+    args = parser.parse_args(argv)
+    listener = _listener(args.host, args.port)
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(
+            target=_serve_shard,
+            args=(shard_index, args.shards, args.socket_dir, listener),
+        )
+        for shard_index in range(args.shards)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from gamehub.api.socket_server.client_connection import (
+    ClientConnection,
+    OverflowPolicy,
+)
+
+
+def _sent_frames(client: AsyncMock) -> list[str]:
+    return [call.args[0] for call in client.send_text.call_args_list]
+
+
+@pytest.fixture
+def blocked_client():
+    client = AsyncMock()
+    release = asyncio.Event()
+
+    async def _send_text(_):
+        await release.wait()
+
+    client.send_text.side_effect = _send_text
+    client.release = release
+    return client
+
+
+@pytest.mark.asyncio
+async def test_connection_sends_frames_in_order():
+    client = AsyncMock()
+    connection = ClientConnection(client, 10, OverflowPolicy.DROP_SUPERSEDED)
+    for frame in ("a", "b", "c"):
+        connection.enqueue(frame)
+    await connection.flush()
+    assert _sent_frames(client) == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_enqueueing_frame_does_not_wait_for_slow_client(blocked_client):
+    connection = ClientConnection(blocked_client, 10, OverflowPolicy.DROP_SUPERSEDED)
+    connection.enqueue("a")
+    connection.enqueue("b")
+    await asyncio.sleep(0)
+    assert connection.queue_size == 1
+    blocked_client.release.set()
+    await connection.flush()
+    assert _sent_frames(blocked_client) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_connection_drops_oldest_superseded_frame_on_overflow(blocked_client):
+    connection = ClientConnection(blocked_client, 2, OverflowPolicy.DROP_SUPERSEDED)
+    connection.enqueue("a")
+    await asyncio.sleep(0)
+    connection.enqueue("room 1", coalesce_key="room")
+    connection.enqueue("state 1", coalesce_key="state")
+    connection.enqueue("state 2", coalesce_key="state")
+    blocked_client.release.set()
+    await connection.flush()
+    assert _sent_frames(blocked_client) == ["a", "room 1", "state 2"]
+
+
+@pytest.mark.parametrize(
+    "overflow_policy", [OverflowPolicy.DROP_SUPERSEDED, OverflowPolicy.COALESCE]
+)
+@pytest.mark.asyncio
+async def test_connection_disconnects_when_no_frame_is_superseded(
+    blocked_client, overflow_policy
+):
+    connection = ClientConnection(blocked_client, 2, overflow_policy)
+    connection.enqueue("a")
+    await asyncio.sleep(0)
+    connection.enqueue("error")
+    connection.enqueue("state 1", coalesce_key="state")
+    connection.enqueue("private view")
+    await connection.flush()
+    assert _sent_frames(blocked_client) == ["a"]
+    blocked_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_connection_coalesces_superseded_frames_on_overflow(blocked_client):
+    connection = ClientConnection(blocked_client, 3, OverflowPolicy.COALESCE)
+    connection.enqueue("a")
+    await asyncio.sleep(0)
+    connection.enqueue("state 1", coalesce_key="state")
+    connection.enqueue("error")
+    connection.enqueue("state 2", coalesce_key="state")
+    connection.enqueue("state 3", coalesce_key="state")
+    blocked_client.release.set()
+    await connection.flush()
+    assert _sent_frames(blocked_client) == ["a", "error", "state 3"]
+
+
+@pytest.mark.asyncio
+async def test_connection_drops_oldest_superseded_frame_if_nothing_to_coalesce(
+    blocked_client,
+):
+    connection = ClientConnection(blocked_client, 2, OverflowPolicy.COALESCE)
+    connection.enqueue("a")
+    await asyncio.sleep(0)
+    connection.enqueue("state 1", coalesce_key="state")
+    connection.enqueue("state 2", coalesce_key="state")
+    connection.enqueue("room 1", coalesce_key="room")
+    blocked_client.release.set()
+    await connection.flush()
+    assert _sent_frames(blocked_client) == ["a", "state 2", "room 1"]
+
+
+@pytest.mark.asyncio
+async def test_connection_disconnects_client_on_overflow(blocked_client):
+    connection = ClientConnection(blocked_client, 1, OverflowPolicy.DISCONNECT)
+    connection.enqueue("a")
+    await asyncio.sleep(0)
+    connection.enqueue("b")
+    connection.enqueue("c")
+    await connection.flush()
+    assert _sent_frames(blocked_client) == ["a"]
+    blocked_client.close.assert_called_once()
+    connection.enqueue("d")
+    assert connection.queue_size == 0
+
+
+@pytest.mark.asyncio
+async def test_connection_stops_sending_after_client_error():
+    client = AsyncMock()
+    client.send_text.side_effect = RuntimeError("connection lost")
+    connection = ClientConnection(client, 10, OverflowPolicy.DROP_SUPERSEDED)
+    connection.enqueue("a")
+    await connection.flush()
+    connection.enqueue("b")
+    await connection.flush()
+    assert _sent_frames(client) == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_closed_connection_discards_pending_frames(blocked_client):
+    connection = ClientConnection(blocked_client, 10, OverflowPolicy.DROP_SUPERSEDED)
+    connection.enqueue("a")
+    connection.enqueue("b")
+    await asyncio.sleep(0)
+    connection.close()
+    await connection.flush()
+    assert connection.queue_size == 0
@@ -0,0 +1,56 @@
+from gamehub.api.socket_server.replay_buffer import ReplayBuffer, stamp_frame
+
+
+def test_stamping_frame_prepends_buffer_id_and_sequence_number():
+    assert stamp_frame("b1", 7, '{"a":1}') == '{"buffer_id":"b1","sequence":7,"a":1}'
+
+
+def test_replay_buffer_numbers_frames_consecutively():
+    replay_buffer = ReplayBuffer(capacity=2, buffer_id="b1")
+    assert [replay_buffer.append("{}") for _ in range(3)] == [
+        '{"buffer_id":"b1","sequence":1,}',
+        '{"buffer_id":"b1","sequence":2,}',
+        '{"buffer_id":"b1","sequence":3,}',
+    ]
+    assert replay_buffer.last_sequence == 3
+
+
+def test_replay_buffers_get_distinct_ids():
+    assert ReplayBuffer(capacity=1).buffer_id != ReplayBuffer(capacity=1).buffer_id
+
+
+def test_replay_buffer_returns_frames_after_last_seen():
+    replay_buffer = ReplayBuffer(capacity=3, buffer_id="b1")
+    for value in range(4):
+        replay_buffer.append(f'{{"v":{value}}}')
+    assert replay_buffer.frames_after("b1", 2) == [
+        '{"buffer_id":"b1","sequence":3,"v":2}',
+        '{"buffer_id":"b1","sequence":4,"v":3}',
+    ]
+    assert replay_buffer.frames_after("b1", 1) == [
+        '{"buffer_id":"b1","sequence":2,"v":1}',
+        '{"buffer_id":"b1","sequence":3,"v":2}',
+        '{"buffer_id":"b1","sequence":4,"v":3}',
+    ]
+    assert replay_buffer.frames_after("b1", 4) == []
+
+
+def test_replay_buffer_cannot_replay_frames_that_rolled_over():
+    replay_buffer = ReplayBuffer(capacity=3, buffer_id="b1")
+    for _ in range(5):
+        replay_buffer.append("{}")
+    assert replay_buffer.frames_after("b1", 1) is None
+
+
+def test_replay_buffer_cannot_replay_from_unknown_sequence_number():
+    replay_buffer = ReplayBuffer(capacity=3, buffer_id="b1")
+    replay_buffer.append("{}")
+    assert replay_buffer.frames_after("b1", 5) is None
+
+
+def test_replay_buffer_cannot_replay_frames_of_another_buffer():
+    replay_buffer = ReplayBuffer(capacity=64, buffer_id="b2")
+    for _ in range(40):
+        replay_buffer.append("{}")
+    assert replay_buffer.frames_after("b1", 30) is None
+    assert replay_buffer.frames_after(None, 30) is None
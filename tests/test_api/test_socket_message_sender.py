@@ -1,12 +1,29 @@
-from unittest.mock import AsyncMock
+from itertools import count
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from gamehub.api.socket_server import ClientManager, SocketMessageSender
-from gamehub.core.events.outgoing_message import OutgoingMessage
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
 from gamehub.core.message import Message, MessageType
 
 
+@pytest.fixture(autouse=True)
+def buffer_ids():
+    buffer_numbers = count(1)
+    with patch(
+        "gamehub.api.socket_server.replay_buffer.uuid4",
+        side_effect=lambda: SimpleNamespace(hex=f"b{next(buffer_numbers)}"),
+    ):
+        yield
+
+
 @pytest.mark.asyncio
 async def test_message_sender_does_not_send_message_if_client_not_found():
     client_manager = ClientManager()
@@ -29,6 +46,209 @@ async def test_message_sender_sends_message_if_client_found():
         message=Message(message_type=MessageType.GAME_STATE, payload={"key": "value"}),
     )
     await message_sender.send(msg)
+    await client_manager.get_connection("Alice").flush()
     client.send_text.assert_called_once_with(
-        '{"message_type":"GAME_STATE","payload":{"key":"value"}}'
+        '{"buffer_id":"b1","sequence":1,"message_type":"GAME_STATE","payload":{"key":"value"}}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_sender_broadcasts_message_to_connected_recipients():
+    client_manager = ClientManager()
+    alice, bob = AsyncMock(), AsyncMock()
+    client_manager.associate_player_id("Alice", alice)
+    client_manager.associate_player_id("Bob", bob)
+    message_sender = SocketMessageSender(client_manager)
+    broadcast = OutgoingBroadcast(
+        recipients=("Alice", "Bob", "Charlie"),
+        message=Message(message_type=MessageType.GAME_STATE, payload={"key": "value"}),
+    )
+    await message_sender.broadcast(broadcast)
+    await client_manager.get_connection("Alice").flush()
+    await client_manager.get_connection("Bob").flush()
+    alice.send_text.assert_called_once_with(
+        '{"buffer_id":"b1","sequence":1,"message_type":"GAME_STATE","payload":{"key":"value"}}'
+    )
+    bob.send_text.assert_called_once_with(
+        '{"buffer_id":"b2","sequence":1,"message_type":"GAME_STATE","payload":{"key":"value"}}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_sender_serializes_broadcast_only_once():
+    client_manager = ClientManager()
+    for player_id in ("Alice", "Bob", "Charlie"):
+        client_manager.associate_player_id(player_id, AsyncMock())
+    message_sender = SocketMessageSender(client_manager)
+    broadcast = OutgoingBroadcast(
+        recipients=("Alice", "Bob", "Charlie"),
+        message=Message(message_type=MessageType.GAME_STATE, payload={"key": "value"}),
+    )
+    with patch.object(
+        Message, "model_dump_json", autospec=True, return_value="{}"
+    ) as dump_json:
+        await message_sender.broadcast(broadcast)
+    dump_json.assert_called_once()
+
+
+def _game_state(value: int) -> Message:
+    return Message(message_type=MessageType.GAME_STATE, payload={"value": value})
+
+
+def _sent_frames(client) -> list[str]:
+    return [call.args[0] for call in client.send_text.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_message_sender_numbers_frames_per_client():
+    client_manager = ClientManager()
+    alice, bob = AsyncMock(), AsyncMock()
+    client_manager.associate_player_id("Alice", alice)
+    client_manager.associate_player_id("Bob", bob)
+    message_sender = SocketMessageSender(client_manager)
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    await message_sender.broadcast(OutgoingBroadcast(("Alice", "Bob"), _game_state(2)))
+    await client_manager.get_connection("Alice").flush()
+    await client_manager.get_connection("Bob").flush()
+    assert _sent_frames(alice) == [
+        '{"buffer_id":"b1","sequence":1,"message_type":"GAME_STATE","payload":{"value":1}}',
+        '{"buffer_id":"b1","sequence":2,"message_type":"GAME_STATE","payload":{"value":2}}',
+    ]
+    assert _sent_frames(bob) == [
+        '{"buffer_id":"b2","sequence":1,"message_type":"GAME_STATE","payload":{"value":2}}'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_message_sender_replays_frames_missed_while_disconnected():
+    client_manager = ClientManager()
+    message_sender = SocketMessageSender(client_manager)
+    old_client, new_client = AsyncMock(), AsyncMock()
+    client_manager.associate_player_id("Alice", old_client)
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    client_manager.remove(old_client)
+    await message_sender.send(OutgoingMessage("Alice", _game_state(2)))
+    await message_sender.broadcast(OutgoingBroadcast(("Alice",), _game_state(3)))
+
+    client_manager.associate_player_id("Alice", new_client)
+    await message_sender.resume(
+        OutgoingResume("Alice", last_seen=1, fallback=(_game_state(0),), buffer_id="b1")
+    )
+    await client_manager.get_connection("Alice").flush()
+    assert _sent_frames(new_client) == [
+        '{"buffer_id":"b1","sequence":2,"message_type":"GAME_STATE","payload":{"value":2}}',
+        '{"buffer_id":"b1","sequence":3,"message_type":"GAME_STATE","payload":{"value":3}}',
+    ]
+
+
+def _connect(client_manager: ClientManager, player_id: str) -> AsyncMock:
+    client = AsyncMock()
+    client_manager.associate_player_id(player_id, client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_message_sender_falls_back_to_full_sync_when_buffer_rolled_over():
+    client_manager = ClientManager()
+    message_sender = SocketMessageSender(client_manager, replay_buffer_size=2)
+    client_manager.remove(_connect(client_manager, "Alice"))
+    await message_sender.send(OutgoingMessage("Alice", _game_state(0)))
+    old_client = _connect(client_manager, "Alice")
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    client_manager.remove(old_client)
+    for value in range(2, 5):
+        await message_sender.send(OutgoingMessage("Alice", _game_state(value)))
+    client = _connect(client_manager, "Alice")
+    await message_sender.resume(
+        OutgoingResume("Alice", last_seen=1, fallback=(_game_state(0),), buffer_id="b1")
+    )
+    await client_manager.get_connection("Alice").flush()
+    assert _sent_frames(client) == [
+        '{"buffer_id":"b1","sequence":5,"message_type":"GAME_STATE","payload":{"value":0}}'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_message_sender_keeps_no_frames_for_clients_never_connected():
+    client_manager = ClientManager()
+    message_sender = SocketMessageSender(client_manager)
+    await message_sender.broadcast(OutgoingBroadcast(("Alice",), _game_state(1)))
+    assert message_sender.replay_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_message_sender_caps_total_bytes_of_replay_buffers():
+    client_manager = ClientManager()
+    frame_size = len(_game_state(1).model_dump_json())
+    message_sender = SocketMessageSender(
+        client_manager, max_replay_bytes=int(frame_size * 1.5)
     )
+    _connect(client_manager, "Bob")
+    alice = _connect(client_manager, "Alice")
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    await message_sender.send(OutgoingMessage("Bob", _game_state(1)))
+    assert message_sender.replay_bytes == frame_size
+
+    client_manager.remove(alice)
+    client = _connect(client_manager, "Alice")
+    await message_sender.resume(
+        OutgoingResume("Alice", last_seen=0, fallback=(_game_state(0),), buffer_id="b1")
+    )
+    await client_manager.get_connection("Alice").flush()
+    assert _sent_frames(client) == [
+        '{"buffer_id":"b3","sequence":1,"message_type":"GAME_STATE","payload":{"value":0}}'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_message_sender_forgets_replay_buffer_after_disconnect_ttl():
+    client_manager = ClientManager()
+    message_sender = SocketMessageSender(client_manager, replay_ttl_seconds=0)
+    alice = _connect(client_manager, "Alice")
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    client_manager.remove(alice)
+    message_sender.forget_client(PlayerDisconnected("Alice"))
+    await message_sender.send(OutgoingMessage("Alice", _game_state(2)))
+    assert message_sender.replay_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_message_sender_falls_back_to_full_sync_for_frames_of_another_buffer():
+    client_manager = ClientManager()
+    frame_size = len(_game_state(1).model_dump_json())
+    message_sender = SocketMessageSender(
+        client_manager, max_replay_bytes=int(frame_size * 3.5)
+    )
+    _connect(client_manager, "Bob")
+    alice = _connect(client_manager, "Alice")
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    await message_sender.send(OutgoingMessage("Bob", _game_state(1)))
+    await message_sender.send(OutgoingMessage("Bob", _game_state(2)))
+    await message_sender.send(OutgoingMessage("Bob", _game_state(3)))
+    for value in range(2, 5):
+        await message_sender.send(OutgoingMessage("Alice", _game_state(value)))
+    client_manager.remove(alice)
+    client = _connect(client_manager, "Alice")
+    await message_sender.resume(
+        OutgoingResume("Alice", last_seen=1, fallback=(_game_state(0),), buffer_id="b1")
+    )
+    await client_manager.get_connection("Alice").flush()
+    assert _sent_frames(client) == [
+        '{"buffer_id":"b3","sequence":4,"message_type":"GAME_STATE","payload":{"value":0}}'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_message_sender_only_lets_shared_state_broadcasts_be_superseded():
+    client_manager = ClientManager(max_queue_size=2)
+    client = AsyncMock()
+    client_manager.associate_player_id("Alice", client)
+    message_sender = SocketMessageSender(client_manager)
+    await message_sender.send(OutgoingMessage("Alice", _game_state(1)))
+    await message_sender.broadcast(OutgoingBroadcast(("Alice",), _game_state(2)))
+    await message_sender.broadcast(OutgoingBroadcast(("Alice",), _game_state(3)))
+    await client_manager.get_connection("Alice").flush()
+    assert _sent_frames(client) == [
+        '{"buffer_id":"b1","sequence":1,"message_type":"GAME_STATE","payload":{"value":1}}',
+        '{"buffer_id":"b1","sequence":3,"message_type":"GAME_STATE","payload":{"value":3}}',
+    ]
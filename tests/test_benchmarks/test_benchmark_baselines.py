@@ -0,0 +1,68 @@
+import pytest
+
+from gamehub.benchmarks.baselines import (
+    compare_runs,
+    git_revision,
+    load_run,
+    save_run,
+)
+from gamehub.benchmarks.cli import main
+from gamehub.benchmarks.runner import BenchmarkResult, BenchmarkRun
+
+
+def _run(revision: str, **best_seconds: float) -> BenchmarkRun:
+    return BenchmarkRun(
+        revision=revision,
+        created_at="2025-01-01T00:00:00+00:00",
+        python_version="3.13.0",
+        results=tuple(
+            BenchmarkResult(
+                name=name,
+                best_seconds=seconds,
+                median_seconds=seconds,
+                calls_per_repeat=10,
+            )
+            for name, seconds in best_seconds.items()
+        ),
+    )
+
+
+def test_baselines_are_stored_by_revision(tmp_path):
+    run = _run("abc123", hand_value=1e-6)
+    path = save_run(run, str(tmp_path))
+    assert path == str(tmp_path / "abc123.json")
+    assert load_run("abc123", str(tmp_path)) == run
+    assert load_run(path, "elsewhere") == run
+
+
+def test_git_revision_is_unknown_outside_a_repository(tmp_path):
+    assert git_revision(str(tmp_path)) == "unknown"
+
+
+def test_only_slowdowns_beyond_threshold_are_regressions():
+    baseline = _run("old", hand_value=1.0, deal_hands=1.0, removed=1.0)
+    current = _run("new", hand_value=1.05, deal_hands=1.2, added=1.0)
+    comparisons = compare_runs(baseline, current, threshold=0.1)
+    assert [(c.name, c.is_regression) for c in comparisons] == [
+        ("hand_value", False),
+        ("deal_hands", True),
+    ]
+    assert comparisons[1].change == pytest.approx(0.2)
+
+
+def test_compare_command_fails_on_regressions(tmp_path, capsys):
+    save_run(_run("old", hand_value=1.0, deal_hands=1.0), str(tmp_path))
+    save_run(_run("new", hand_value=0.9, deal_hands=1.5), str(tmp_path))
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--directory", str(tmp_path), "compare", "old", "new"])
+    assert exit_info.value.code == 1
+    output = capsys.readouterr().out
+    assert "deal_hands" in output
+    assert "+50.0% REGRESSION" in output
+
+
+def test_compare_command_passes_without_regressions(tmp_path, capsys):
+    save_run(_run("old", hand_value=1.0), str(tmp_path))
+    save_run(_run("new", hand_value=1.1), str(tmp_path))
+    main(["--directory", str(tmp_path), "compare", "old", "new", "--threshold", "0.2"])
+    assert "REGRESSION" not in capsys.readouterr().out
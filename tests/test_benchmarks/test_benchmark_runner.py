@@ -0,0 +1,24 @@
+import pytest
+
+from gamehub.benchmarks.cases import BENCHMARKS
+from gamehub.benchmarks.runner import BenchmarkRun, measure, run_benchmarks
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark_cases_run(name):
+    benchmark = BENCHMARKS[name]()
+    benchmark()
+
+
+def test_measure_reports_time_per_call():
+    result = measure("noop", lambda: None, repeat=2)
+    assert result.name == "noop"
+    assert result.calls_per_repeat > 1
+    assert 0 < result.best_seconds <= result.median_seconds
+
+
+def test_benchmark_run_round_trips_through_dict():
+    run = run_benchmarks("abc123", ["calculate_credits"], repeat=1)
+    assert run.revision == "abc123"
+    assert [result.name for result in run.results] == ["calculate_credits"]
+    assert BenchmarkRun.from_dict(run.to_dict()) == run
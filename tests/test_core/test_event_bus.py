@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 
 import pytest
 
-from gamehub.core.event_bus import EventBus
+from gamehub.core.event_bus import DispatchPolicy, EventBus
 
 
 @dataclass(frozen=True)
@@ -16,6 +16,10 @@ class _OrderCancelled:
     order_id: int
 
 
+@dataclass(frozen=True)
+class _ExpressOrderPlaced(_OrderPlaced): ...
+
+
 @dataclass
 class _HandlerSpy:
     received_events: list = field(default_factory=list)
@@ -90,3 +94,200 @@ async def test_event_bus_can_have_async_handlers():
     bus.subscribe(_OrderPlaced, spy.handle_async)
     await bus.publish(event)
     assert spy.received_events == [event]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_publishes_event_to_handlers_of_base_classes():
+    bus = EventBus()
+    spy = _HandlerSpy()
+    bus.subscribe(_OrderPlaced, spy.handle_sync)
+    bus.subscribe(_OrderPlaced, spy.handle_async)
+    event = _ExpressOrderPlaced(order_id=1)
+    await bus.publish(event)
+    assert spy.received_events == [event, event]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_does_not_publish_base_class_event_to_subclass_handlers():
+    bus = EventBus()
+    spy = _HandlerSpy()
+    bus.subscribe(_ExpressOrderPlaced, spy.handle_sync)
+    await bus.publish(_OrderPlaced(order_id=1))
+    assert spy.received_events == []
+
+
+@pytest.mark.asyncio
+async def test_event_bus_calls_most_specific_handlers_first():
+    bus = EventBus()
+    received = []
+    bus.subscribe(_OrderPlaced, lambda _: received.append("base"))
+    bus.subscribe(_ExpressOrderPlaced, lambda _: received.append("express"))
+    await bus.publish(_ExpressOrderPlaced(order_id=1))
+    assert received == ["express", "base"]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_includes_handlers_subscribed_after_first_publish():
+    bus = EventBus()
+    spy_a = _HandlerSpy()
+    spy_b = _HandlerSpy()
+    bus.subscribe(_OrderPlaced, spy_a.handle_sync)
+    await bus.publish(_ExpressOrderPlaced(order_id=1))
+    bus.subscribe(_OrderPlaced, spy_b.handle_sync)
+    event = _ExpressOrderPlaced(order_id=2)
+    await bus.publish(event)
+    assert spy_b.received_events == [event]
+    assert len(spy_a.received_events) == 2
+
+
+@pytest.fixture
+def execution_log():
+    return []
+
+
+@pytest.fixture
+def slow_handler(execution_log):
+    def _slow_handler(name: str, delay: float):
+        async def _handle(event):
+            execution_log.append(f"{name} started")
+            await asyncio.sleep(delay)
+            execution_log.append(f"{name} finished")
+
+        return _handle
+
+    return _slow_handler
+
+
+@pytest.fixture
+def handshake_handlers(execution_log):
+    b_finished = asyncio.Event()
+
+    async def _handle_a(event):
+        execution_log.append("a started")
+        await b_finished.wait()
+        execution_log.append("a finished")
+
+    async def _handle_b(event):
+        execution_log.append("b started")
+        execution_log.append("b finished")
+        b_finished.set()
+
+    return _handle_a, _handle_b
+
+
+@pytest.fixture
+def failing_handler():
+    async def _handle(event):
+        await asyncio.sleep(0)
+        raise RuntimeError(f"failed handling {event.order_id}")
+
+    return _handle
+
+
+@pytest.mark.asyncio
+async def test_event_bus_runs_async_handlers_sequentially_by_default(
+    slow_handler, execution_log
+):
+    bus = EventBus()
+    bus.subscribe(_OrderPlaced, slow_handler("a", 0.002))
+    bus.subscribe(_OrderPlaced, slow_handler("b", 0.001))
+    await bus.publish(_OrderPlaced(order_id=1))
+    assert execution_log == ["a started", "a finished", "b started", "b finished"]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_starts_concurrent_handlers_in_subscription_order(
+    handshake_handlers, execution_log
+):
+    bus = EventBus()
+    bus.set_dispatch_policy(_OrderPlaced, DispatchPolicy.CONCURRENT)
+    for handler in handshake_handlers:
+        bus.subscribe(_OrderPlaced, handler)
+    await bus.publish(_OrderPlaced(order_id=1))
+    assert execution_log == ["a started", "b started", "b finished", "a finished"]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_propagates_errors_of_concurrent_handlers(failing_handler):
+    bus = EventBus()
+    bus.set_dispatch_policy(_OrderPlaced, DispatchPolicy.CONCURRENT)
+    bus.subscribe(_OrderPlaced, failing_handler)
+    with pytest.raises(RuntimeError, match="failed handling 1"):
+        await bus.publish(_OrderPlaced(order_id=1))
+
+
+@pytest.mark.asyncio
+async def test_event_bus_does_not_wait_for_fire_and_forget_handlers(
+    handshake_handlers, execution_log
+):
+    bus = EventBus()
+    bus.set_dispatch_policy(_OrderPlaced, DispatchPolicy.FIRE_AND_FORGET)
+    for handler in handshake_handlers:
+        bus.subscribe(_OrderPlaced, handler)
+    await bus.publish(_OrderPlaced(order_id=1))
+    assert execution_log == []
+    await bus.join()
+    assert execution_log == ["a started", "b started", "b finished", "a finished"]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_collects_errors_of_fire_and_forget_handlers(
+    failing_handler,
+):
+    bus = EventBus()
+    bus.set_dispatch_policy(_OrderPlaced, DispatchPolicy.FIRE_AND_FORGET)
+    bus.subscribe(_OrderPlaced, failing_handler)
+    await bus.publish(_OrderPlaced(order_id=1))
+    await bus.publish(_OrderPlaced(order_id=2))
+    await bus.join()
+    assert [str(e) for e in bus.errors] == ["failed handling 1", "failed handling 2"]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_keeps_only_latest_errors(failing_handler):
+    bus = EventBus(max_errors=2)
+    bus.set_dispatch_policy(_OrderPlaced, DispatchPolicy.FIRE_AND_FORGET)
+    bus.subscribe(_OrderPlaced, failing_handler)
+    for order_id in range(1, 4):
+        await bus.publish(_OrderPlaced(order_id=order_id))
+        await bus.join()
+    assert [str(e) for e in bus.errors] == ["failed handling 2", "failed handling 3"]
+
+
+@pytest.mark.asyncio
+async def test_event_bus_runs_sync_handlers_before_async_ones_for_every_policy(
+    slow_handler, execution_log
+):
+    for policy in DispatchPolicy:
+        execution_log.clear()
+        bus = EventBus()
+        bus.set_dispatch_policy(_OrderPlaced, policy)
+        bus.subscribe(_OrderPlaced, slow_handler("async", 0))
+        bus.subscribe(_OrderPlaced, lambda _: execution_log.append("sync"))
+        await bus.publish(_OrderPlaced(order_id=1))
+        await bus.join()
+        assert execution_log == ["sync", "async started", "async finished"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_policy_only_applies_to_given_event_type(
+    slow_handler, execution_log
+):
+    bus = EventBus()
+    bus.set_dispatch_policy(_OrderCancelled, DispatchPolicy.CONCURRENT)
+    bus.subscribe(_OrderPlaced, slow_handler("a", 0.002))
+    bus.subscribe(_OrderPlaced, slow_handler("b", 0.001))
+    await bus.publish(_OrderPlaced(order_id=1))
+    assert execution_log == ["a started", "a finished", "b started", "b finished"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_policy_is_inherited_by_subclass_events(
+    handshake_handlers, execution_log
+):
+    bus = EventBus()
+    bus.set_dispatch_policy(_OrderPlaced, DispatchPolicy.CONCURRENT)
+    for handler in handshake_handlers:
+        bus.subscribe(_ExpressOrderPlaced, handler)
+    await bus.publish(_ExpressOrderPlaced(order_id=1))
+    assert execution_log == ["a started", "b started", "b finished", "a finished"]
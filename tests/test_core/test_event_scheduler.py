@@ -35,3 +35,130 @@ async def test_event_scheduler_allows_cancellation(event_bus, mock_event_spy):
     scheduler.cancel_event(task)
     await asyncio.sleep(delay_seconds + 0.1)
     assert mock_event_spy == []
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_publishes_events_in_order_of_due_time(
+    event_bus, mock_event_spy
+):
+    scheduler = EventScheduler(event_bus)
+    late = EventStub(event_id="late")
+    early = EventStub(event_id="early")
+    scheduler.schedule_event(late, 0.05)
+    scheduler.schedule_event(early, 0.01)
+    await asyncio.sleep(0.1)
+    assert mock_event_spy == [early, late]
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_publishes_simultaneous_events_in_scheduling_order(
+    event_bus, mock_event_spy
+):
+    scheduler = EventScheduler(event_bus)
+    events = [EventStub(event_id=str(i)) for i in range(5)]
+    for event in events:
+        scheduler.schedule_event(event, 0)
+    await asyncio.sleep(0.05)
+    assert mock_event_spy == events
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_keeps_other_events_after_cancellation(
+    event_bus, mock_event_spy
+):
+    scheduler = EventScheduler(event_bus)
+    cancelled = scheduler.schedule_event(EventStub(event_id="cancelled"), 0.01)
+    kept = EventStub(event_id="kept")
+    scheduler.schedule_event(kept, 0.02)
+    scheduler.cancel_event(cancelled)
+    await asyncio.sleep(0.05)
+    assert mock_event_spy == [kept]
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_uses_single_task_for_all_events(event_bus):
+    scheduler = EventScheduler(event_bus)
+    tasks_before = len(asyncio.all_tasks())
+    for i in range(100):
+        scheduler.schedule_event(EventStub(event_id=str(i)), 60)
+    assert len(asyncio.all_tasks()) == tasks_before + 1
+    assert scheduler.num_pending_events == 100
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_counts_pending_events(event_bus, mock_event_spy):
+    scheduler = EventScheduler(event_bus)
+    published = scheduler.schedule_event(EventStub(event_id="published"), 0)
+    cancelled = scheduler.schedule_event(EventStub(event_id="cancelled"), 60)
+    scheduler.schedule_event(EventStub(event_id="pending"), 60)
+    await asyncio.sleep(0.02)
+    scheduler.cancel_event(cancelled)
+    scheduler.cancel_event(cancelled)
+    scheduler.cancel_event(published)
+    assert scheduler.num_pending_events == 1
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_compacts_queue_full_of_cancelled_events(
+    event_bus, mock_event_spy
+):
+    scheduler = EventScheduler(event_bus)
+    scheduled = [scheduler.schedule_event(EventStub(str(i)), 0.01) for i in range(10)]
+    for cancelled in scheduled[:5]:
+        scheduler.cancel_event(cancelled)
+    assert scheduler.queue_size == 10
+    scheduler.cancel_event(scheduled[5])
+    assert scheduler.queue_size == 4
+    assert scheduler.num_pending_events == 4
+    await asyncio.sleep(0.05)
+    assert mock_event_spy == [EventStub(str(i)) for i in range(6, 10)]
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_survives_failing_handlers(event_bus, mock_event_spy):
+    def _failing_handler(event):
+        if event.event_id == "bad":
+            raise RuntimeError("handler failed")
+
+    event_bus.subscribe(EventStub, _failing_handler)
+    scheduler = EventScheduler(event_bus)
+    scheduler.schedule_event(EventStub(event_id="bad"), 0)
+    good = EventStub(event_id="good")
+    scheduler.schedule_event(good, 0.01)
+    await asyncio.sleep(0.05)
+    assert mock_event_spy[-1] == good
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_restarts_after_running_out_of_events(
+    event_bus, mock_event_spy
+):
+    scheduler = EventScheduler(event_bus)
+    first = EventStub(event_id="first")
+    scheduler.schedule_event(first, 0)
+    await asyncio.sleep(0.02)
+    second = EventStub(event_id="second")
+    scheduler.schedule_event(second, 0)
+    await asyncio.sleep(0.02)
+    assert mock_event_spy == [first, second]
+
+
+@pytest.mark.asyncio
+async def test_event_scheduler_does_not_wait_for_slow_handlers(
+    event_bus, mock_event_spy
+):
+    release = asyncio.Event()
+
+    async def _slow_handler(event):
+        if event.event_id == "slow":
+            await release.wait()
+
+    event_bus.subscribe(EventStub, _slow_handler)
+    scheduler = EventScheduler(event_bus)
+    scheduler.schedule_event(EventStub(event_id="slow"), 0)
+    fast = EventStub(event_id="fast")
+    scheduler.schedule_event(fast, 0.01)
+    await asyncio.sleep(0.05)
+    assert mock_event_spy[-1] == fast
+    release.set()
+    await scheduler.join()
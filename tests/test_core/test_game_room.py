@@ -1,20 +1,31 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import pytest
 from pydantic import BaseModel
 
+from gamehub.core.event_bus import EventBus
+from gamehub.core.events.game_log import GameCreated, GameFinished, MoveAccepted
 from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import GameStateUpdate
 from gamehub.core.events.outgoing_message import OutgoingMessage
 from gamehub.core.events.request_events import RequestFailed
+from gamehub.core.events.room_lifecycle import RoomRestored
 from gamehub.core.events.sync_client_state import SyncClientState
 from gamehub.core.game_room import GameRoom
+from gamehub.core.move_log import RoomLog
 from gamehub.core.room_state import RoomState
+from gamehub.core.transition_policy import TransitionPolicy
 from gamehub.games.chinese_poker import (
     ChinesePokerConfiguration,
     ChinesePokerGameLogic,
     ChinesePokerMove,
 )
+from gamehub.games.chinese_poker.bots import MonteCarloStrategy
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
 from gamehub.games.rock_paper_scissors import RPSGameLogic, RPSMove
 from gamehub.games.rock_paper_scissors.views import (
     RPSPrivateView,
@@ -69,8 +80,7 @@ def rps_room(event_bus):
     )
 
 
-@pytest.fixture
-def chinese_poker_room(event_bus):
+def _chinese_poker_room(event_bus, bot_strategy=None):
     config = ChinesePokerConfiguration(
         num_players=4,
         cards_per_player=13,
@@ -79,12 +89,17 @@ def chinese_poker_room(event_bus):
     )
     return GameRoom(
         room_id=1,
-        game_logic=ChinesePokerGameLogic(config),
+        game_logic=ChinesePokerGameLogic(config, bot_strategy=bot_strategy),
         move_parser=ChinesePokerMove.model_validate,
         event_bus=event_bus,
     )
 
 
+@pytest.fixture
+def chinese_poker_room(event_bus):
+    return _chinese_poker_room(event_bus)
+
+
 class _MockState(BaseModel):
     status: str
 
@@ -105,6 +120,10 @@ def automated_transition_logic():
         def num_players(self):
             return 2
 
+        @property
+        def game_type(self):
+            return "mock"
+
         def derived_events(self, state, room_id, recipients):
             yield EventStub(status=state.status, room_id=room_id)
 
@@ -112,11 +131,14 @@ def automated_transition_logic():
         def configuration(self):
             return None
 
+        def reseed(self, seed):
+            pass
+
         def initial_state(self, *_, **__):
             return _MockState(status="START")
 
-        def make_move(self, *_, **__):
-            return _MockState(status="MOVE")
+        def make_move(self, state, move):
+            return _MockState(status=getattr(move, "status", "MOVE"))
 
         def next_automated_state(self, state, *_, **__):
             if "_" not in state.status:
@@ -124,7 +146,7 @@ def automated_transition_logic():
             elif state.status.endswith("_A"):
                 return _MockState(status=state.status.replace("_A", "_B"))
 
-        def state_after_timeout(self, *_, **__):
+        def timeout_move(self, *_, **__):
             return _MockState(status="STATE_AFTER_TIMEOUT")
 
     return MockLogic()
@@ -297,6 +319,30 @@ async def test_players_get_notified_of_player_rejoining(rps_room, room_updates_s
     )
 
 
+@pytest.mark.asyncio
+async def test_room_members_can_request_full_game_state_sync(
+    rps_room, sync_client_state_spy
+):
+    await rps_room.join("Alice")
+    await rps_room.add_spectator("Charlie")
+    await rps_room.sync("Alice")
+    await rps_room.sync("Charlie")
+    assert [sync.client_id for sync in sync_client_state_spy] == [
+        "Charlie",
+        "Alice",
+        "Charlie",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_non_members_cannot_request_game_state_sync(
+    rps_room, failed_requests_spy, sync_client_state_spy
+):
+    await rps_room.sync("Alice")
+    assert failed_requests_spy == [RequestFailed("Alice", "Player not in room")]
+    assert sync_client_state_spy == []
+
+
 @pytest.mark.asyncio
 async def test_players_get_notified_of_full_game_state_when_rejoining(
     rps_room, sync_client_state_spy
@@ -327,6 +373,21 @@ async def test_players_get_notified_of_full_game_state_when_rejoining(
     )
 
 
+@pytest.mark.asyncio
+async def test_players_resuming_from_last_seen_frame_sync_before_room_update(
+    rps_room, event_spy
+):
+    await rps_room.join("Alice")
+    await rps_room.join("Bob")
+    await rps_room.handle_player_disconnected("Alice")
+    events = event_spy(GameRoomUpdate, SyncClientState)
+    await rps_room.rejoin("Alice", last_seen=12, buffer_id="b1")
+
+    assert [type(event) for event in events] == [SyncClientState, GameRoomUpdate]
+    assert (events[0].buffer_id, events[0].last_seen) == ("b1", 12)
+    assert events[0].room_state.offline_players == []
+
+
 @pytest.mark.asyncio
 async def test_player_cannot_make_move_before_game_start(rps_room, failed_requests_spy):
     await rps_room.join("Alice")
@@ -576,6 +637,72 @@ async def test_events_derived_from_game_state_are_raised(
     ]
 
 
+@pytest.fixture
+def coalescing_room(event_bus, automated_transition_logic):
+    return GameRoom(
+        room_id=0,
+        game_logic=automated_transition_logic,
+        move_parser=lambda _: {"a": 1},
+        event_bus=event_bus,
+        transition_policy=TransitionPolicy(
+            coalesce_updates=True, include_intermediate_views=True
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_coalescing_room_sends_single_update_for_automated_transitions(
+    coalescing_room, game_state_updates_spy, event_stub_spy
+):
+    await coalescing_room.join("Alice")
+    await coalescing_room.join("Bob")
+
+    assert game_state_updates_spy == [
+        GameStateUpdate(
+            room_id=0,
+            shared_view=_MockState(status="AUTO_START_B"),
+            private_views={},
+            recipients=["Alice", "Bob"],
+            intermediate_shared_views=(
+                _MockState(status="START"),
+                _MockState(status="AUTO_START_A"),
+            ),
+        )
+    ]
+    assert event_stub_spy == [
+        EventStub(status=status, room_id=0)
+        for status in ("START", "AUTO_START_A", "AUTO_START_B")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_room_keeps_private_views_of_intermediate_states(
+    event_bus, game_state_updates_spy
+):
+    config = ChinesePokerConfiguration(
+        num_players=4,
+        cards_per_player=13,
+        game_over_point_threshold=10,
+        credits_per_point=100,
+    )
+    room = GameRoom(
+        room_id=1,
+        game_logic=ChinesePokerGameLogic(config),
+        move_parser=ChinesePokerMove.model_validate,
+        event_bus=event_bus,
+        transition_policy=TransitionPolicy(coalesce_updates=True),
+    )
+    for player_id in ("Alice", "Bob", "Charlie", "Diana"):
+        await room.join(player_id)
+
+    assert len(game_state_updates_spy) == 1
+    update = game_state_updates_spy[0]
+    assert update.shared_view.status == ChinesePokerStatus.AWAIT_PLAYER_ACTION
+    assert update.intermediate_shared_views == ()
+    assert set(update.private_views) == {"Alice", "Bob", "Charlie", "Diana"}
+    assert all(len(view.cards) == 13 for view in update.private_views.values())
+
+
 @pytest.mark.asyncio
 async def test_player_timeout_is_ignored_if_no_new_state_generated(
     rps_room, game_state_updates_spy
@@ -600,3 +727,311 @@ async def test_player_timeout_has_new_state_broadcasted(
         private_views={},
         recipients=["Alice", "Bob"],
     )
+
+
+@pytest.mark.asyncio
+async def test_player_timeout_is_ignored_before_game_starts(
+    automated_transition_room, game_state_updates_spy
+):
+    await automated_transition_room.join("Alice")
+    await automated_transition_room.handle_timeout("Alice")
+    assert game_state_updates_spy == []
+
+
+@pytest.mark.asyncio
+async def test_player_timeout_is_discarded_if_state_changed_while_computing_it(
+    automated_transition_room, automated_transition_logic, game_state_updates_spy
+):
+    await automated_transition_room.join("Alice")
+    await automated_transition_room.join("Bob")
+
+    def timeout_move(*_, **__):
+        automated_transition_room._game_state = _MockState(status="MOVED_MEANWHILE")
+        return _MockState(status="STATE_AFTER_TIMEOUT")
+
+    automated_transition_logic.timeout_move = timeout_move
+    num_updates = len(game_state_updates_spy)
+    await automated_transition_room.handle_timeout("Alice")
+    assert len(game_state_updates_spy) == num_updates
+
+
+@pytest.fixture
+def endless_chain_logic(automated_transition_logic):
+    def next_automated_state(state, *_, **__):
+        return _MockState(status=str(int(state.status) + 1))
+
+    automated_transition_logic.initial_state = lambda *_, **__: _MockState(status="0")
+    automated_transition_logic.next_automated_state = next_automated_state
+    return automated_transition_logic
+
+
+def _room_with_policy(event_bus, game_logic, **policy):
+    return GameRoom(
+        room_id=0,
+        game_logic=game_logic,
+        move_parser=lambda _: {"a": 1},
+        event_bus=event_bus,
+        transition_policy=TransitionPolicy(**policy),
+    )
+
+
+@pytest.mark.asyncio
+async def test_room_tracks_length_of_automated_transition_chains(
+    automated_transition_room,
+):
+    await automated_transition_room.join("Alice")
+    await automated_transition_room.join("Bob")
+    assert automated_transition_room.last_chain_length == 2
+    assert automated_transition_room.longest_chain_length == 2
+
+    await automated_transition_room.make_move("Alice", {})
+    assert automated_transition_room.last_chain_length == 2
+    assert automated_transition_room.longest_chain_length == 2
+
+
+@pytest.mark.asyncio
+async def test_room_stops_automated_transitions_at_step_limit(
+    event_bus, endless_chain_logic, game_state_updates_spy, caplog
+):
+    room = _room_with_policy(event_bus, endless_chain_logic, max_automated_steps=5000)
+    await room.join("Alice")
+    await room.join("Bob")
+
+    assert room.last_chain_length == 5000
+    assert len(game_state_updates_spy) == 5001
+    assert game_state_updates_spy[-1].shared_view == _MockState(status="5000")
+    assert "Room 0 exceeded 5000 automated transitions" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_room_abandons_game_stuck_at_step_limit(
+    event_bus, endless_chain_logic, event_spy, room_updates_spy
+):
+    room = _room_with_policy(event_bus, endless_chain_logic, max_automated_steps=10)
+    failures = event_spy(RequestFailed)
+    finished = event_spy(GameFinished)
+    await room.join("Alice")
+    await room.join("Bob")
+
+    assert [failure.player_id for failure in failures] == ["Alice", "Bob"]
+    assert finished == [GameFinished(room_id=0)]
+    assert room_updates_spy[-1].room_state.player_ids == []
+    assert room_updates_spy[-1].recipients == ["Alice", "Bob"]
+    assert room.is_empty
+
+
+@pytest.mark.asyncio
+async def test_room_yields_to_event_loop_during_long_chains(
+    event_bus, endless_chain_logic
+):
+    room = _room_with_policy(
+        event_bus, endless_chain_logic, max_automated_steps=100, yield_every_steps=10
+    )
+    num_ticks = 0
+
+    async def ticker():
+        nonlocal num_ticks
+        while True:
+            num_ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    await room.join("Alice")
+    await room.join("Bob")
+    task.cancel()
+    assert num_ticks == 10
+
+
+@pytest.mark.asyncio
+async def test_room_abandons_chain_if_state_changed_while_yielding(
+    event_bus, endless_chain_logic, game_state_updates_spy
+):
+    room = _room_with_policy(
+        event_bus, endless_chain_logic, max_automated_steps=100, yield_every_steps=1
+    )
+    await room.join("Alice")
+    join_task = asyncio.create_task(room.join("Bob"))
+    await asyncio.sleep(0)
+    room._game_state = _MockState(status="MOVED_MEANWHILE")
+    await join_task
+
+    assert room.last_chain_length == 1
+    assert [update.shared_view.status for update in game_state_updates_spy] == ["0"]
+
+
+@pytest.mark.asyncio
+async def test_room_publishes_inputs_of_each_game(rps_room, event_spy):
+    log_events = event_spy(GameCreated, MoveAccepted, GameFinished)
+    await rps_room.join("Alice")
+    await rps_room.join("Bob")
+    await rps_room.make_move("Alice", {"selection": "ROCK"})
+    await rps_room.handle_timeout("Bob")
+    await rps_room.make_move("Bob", {"selection": "PAPER"})
+    assert log_events[1:] == [
+        MoveAccepted(room_id=0, move={"player_id": "Alice", "selection": "ROCK"}),
+        MoveAccepted(room_id=0, move={"player_id": "Bob", "selection": "PAPER"}),
+        GameFinished(room_id=0),
+    ]
+    assert log_events[0].player_ids == ("Alice", "Bob")
+
+
+@pytest.mark.asyncio
+async def test_room_logs_bot_move_played_for_timed_out_player(
+    chinese_poker_room, event_spy, game_state_updates_spy
+):
+    moves = event_spy(MoveAccepted)
+    for player_id in ("Alice", "Bob", "Charlie", "Diana"):
+        await chinese_poker_room.join(player_id)
+    current_player_id = game_state_updates_spy[-1].shared_view.current_player_id
+    await chinese_poker_room.handle_timeout(current_player_id)
+
+    bot_move = ChinesePokerMove.model_validate(moves[-1].move)
+    assert bot_move.player_id == current_player_id
+    assert bot_move.is_bot_move
+
+
+@pytest.mark.asyncio
+async def test_room_keeps_event_loop_responsive_during_bot_search(
+    event_bus, game_state_updates_spy
+):
+    mp_context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=2, mp_context=mp_context) as executor:
+        strategy = MonteCarloStrategy(executor, num_rollouts=16, seed=0)
+        room = _chinese_poker_room(event_bus, bot_strategy=strategy)
+        for player_id in ("Alice", "Bob", "Charlie", "Diana"):
+            await room.join(player_id)
+        await room.handle_timeout(
+            game_state_updates_spy[-1].shared_view.current_player_id
+        )
+        tick_gaps = []
+
+        async def ticker():
+            last_tick = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.001)
+                tick_gaps.append(time.perf_counter() - last_tick)
+                last_tick = time.perf_counter()
+
+        task = asyncio.create_task(ticker())
+        await room.handle_timeout(
+            game_state_updates_spy[-1].shared_view.current_player_id
+        )
+        task.cancel()
+    assert len(tick_gaps) > 10
+    assert max(tick_gaps) < 0.1
+
+
+class _UnusedStrategy:
+    @staticmethod
+    def choose_move(*_):
+        raise AssertionError("Restored rooms must replay logged bot moves")
+
+
+def _room_log(log_events: list) -> RoomLog:
+    created, *inputs = log_events
+    return RoomLog(
+        room_id=created.room_id,
+        game_type=created.game_type,
+        player_ids=created.player_ids,
+        seed=created.seed,
+        inputs=tuple(inputs),
+    )
+
+
+@pytest.mark.asyncio
+async def test_restored_room_replays_dealt_cards_and_moves(
+    chinese_poker_room, event_spy, game_state_updates_spy, sync_client_state_spy
+):
+    log_events = event_spy(GameCreated, MoveAccepted)
+    for player_id in ("Alice", "Bob", "Charlie", "Diana"):
+        await chinese_poker_room.join(player_id)
+    for _ in range(2):
+        current_player_id = game_state_updates_spy[-1].shared_view.current_player_id
+        await chinese_poker_room.handle_timeout(current_player_id)
+    await chinese_poker_room.sync("Alice")
+
+    restored_bus = EventBus()
+    restored_syncs = []
+    restored_bus.subscribe(SyncClientState, restored_syncs.append)
+    restored_room = _chinese_poker_room(restored_bus, bot_strategy=_UnusedStrategy())
+    await restored_room.restore(_room_log(log_events))
+    await restored_room.rejoin("Alice")
+
+    expected = sync_client_state_spy[-1]
+    assert restored_syncs[-1].shared_view == expected.shared_view
+    assert restored_syncs[-1].private_view == expected.private_view
+    assert sorted(restored_syncs[-1].room_state.offline_players) == [
+        "Bob",
+        "Charlie",
+        "Diana",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_restored_players_start_offline(rps_room, room_updates_spy, event_spy):
+    restored = event_spy(RoomRestored)
+    room_log = RoomLog(
+        room_id=0,
+        game_type="rock_paper_scissors",
+        player_ids=("Alice", "Bob"),
+        seed=0,
+        inputs=(
+            MoveAccepted(room_id=0, move={"player_id": "Alice", "selection": "ROCK"}),
+        ),
+    )
+    await rps_room.restore(room_log)
+    assert restored == [RoomRestored(room_id=0, player_ids=("Alice", "Bob"))]
+    assert sorted(room_updates_spy[-1].room_state.offline_players) == ["Alice", "Bob"]
+    assert rps_room.is_full
+
+
+@pytest.mark.asyncio
+async def test_room_is_not_restored_from_finished_game(rps_room, room_updates_spy):
+    room_log = RoomLog(
+        room_id=0,
+        game_type="rock_paper_scissors",
+        player_ids=("Alice", "Bob"),
+        seed=0,
+        inputs=(
+            MoveAccepted(room_id=0, move={"player_id": "Alice", "selection": "ROCK"}),
+            MoveAccepted(room_id=0, move={"player_id": "Bob", "selection": "ROCK"}),
+        ),
+    )
+    await rps_room.restore(room_log)
+    assert room_updates_spy == []
+    assert rps_room.is_empty
+
+
+@pytest.mark.asyncio
+async def test_room_without_game_in_progress_has_no_snapshot(rps_room):
+    await rps_room.join("Alice")
+    assert rps_room.snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_room_restored_from_snapshot_replays_inputs_logged_after_it(
+    chinese_poker_room, event_spy, game_state_updates_spy, sync_client_state_spy
+):
+    log_events = event_spy(GameCreated, MoveAccepted)
+    for player_id in ("Alice", "Bob", "Charlie", "Diana"):
+        await chinese_poker_room.join(player_id)
+    snapshots = []
+    for _ in range(3):
+        snapshots.append(chinese_poker_room.snapshot())
+        current_player_id = game_state_updates_spy[-1].shared_view.current_player_id
+        await chinese_poker_room.handle_timeout(current_player_id)
+    await chinese_poker_room.sync("Alice")
+
+    snapshot = snapshots[1]
+    restored_bus = EventBus()
+    restored_syncs = []
+    restored_bus.subscribe(SyncClientState, restored_syncs.append)
+    restored_room = _chinese_poker_room(restored_bus)
+    inputs = tuple(log_events[1:])
+    await restored_room.restore_snapshot(snapshot, inputs[snapshot.num_inputs :])
+    await restored_room.rejoin("Alice")
+
+    assert snapshot.num_inputs == 1
+    assert restored_room.snapshot().num_inputs == 3
+    assert restored_syncs[-1].shared_view == sync_client_state_spy[-1].shared_view
+    assert restored_syncs[-1].private_view == sync_client_state_spy[-1].private_view
@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+import pytest
+
+from gamehub.core.game_room import GameRoom
+from gamehub.core.matchmaking import MatchmakingIndex
+
+
+@pytest.fixture
+def spy_room():
+    def _spy_room(room_id: int, num_players: int, is_full: bool = False):
+        room = Mock(spec=GameRoom)
+        room.room_id = room_id
+        room.game_type = "tic-tac-toe"
+        room.num_players = num_players
+        room.is_full = is_full
+        return room
+
+    return _spy_room
+
+
+def test_matchmaking_index_has_no_room_for_unknown_game_type():
+    assert MatchmakingIndex().most_filled_free_room("tic-tac-toe") is None
+
+
+def test_matchmaking_index_ignores_full_rooms(spy_room):
+    index = MatchmakingIndex([spy_room(1, num_players=2, is_full=True)])
+    assert index.most_filled_free_room("tic-tac-toe") is None
+
+
+def test_matchmaking_index_returns_most_filled_free_room(spy_room):
+    rooms = [spy_room(1, num_players=0), spy_room(2, num_players=1)]
+    index = MatchmakingIndex(rooms)
+    assert index.most_filled_free_room("tic-tac-toe") is rooms[1]
+
+
+def test_matchmaking_index_tracks_changes_in_room_occupancy(spy_room):
+    rooms = [spy_room(1, num_players=0), spy_room(2, num_players=1)]
+    index = MatchmakingIndex(rooms)
+    rooms[1].is_full = True
+    index.update(rooms[1])
+    assert index.most_filled_free_room("tic-tac-toe") is rooms[0]
+
+
+def test_matchmaking_index_forgets_removed_rooms(spy_room):
+    index = MatchmakingIndex([spy_room(1, num_players=0)])
+    index.remove(1)
+    assert index.most_filled_free_room("tic-tac-toe") is None
@@ -5,8 +5,13 @@ from pydantic import BaseModel
 
 from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import GameStateUpdate
-from gamehub.core.events.outgoing_message import OutgoingMessage
-from gamehub.core.events.request_events import RequestFailed
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
+from gamehub.core.events.request_events import RequestFailed, SetUpdateMode
 from gamehub.core.events.sync_client_state import SyncClientState
 from gamehub.core.events.timer_events import TurnTimerAlert
 from gamehub.core.message import MessageType
@@ -17,7 +22,7 @@ from tests.utils import ExpectedBroadcast, check_messages
 
 @pytest.fixture
 def messages_spy(event_spy):
-    return event_spy(OutgoingMessage)
+    return event_spy(OutgoingMessage, OutgoingBroadcast)
 
 
 @pytest.mark.asyncio
@@ -84,6 +89,33 @@ async def test_message_builder_broadcasts_game_state_updates_to_players_and_spec
     check_messages(messages_spy, expected)
 
 
+@pytest.mark.asyncio
+async def test_message_builder_includes_intermediate_shared_views(
+    event_bus, messages_spy
+):
+    msg_builder = MessageBuilder(event_bus)
+    game_update = GameStateUpdate(
+        room_id=123,
+        shared_view=_MockView(field="last"),
+        private_views=dict(),
+        recipients=["Alice"],
+        intermediate_shared_views=(_MockView(field="first"),),
+    )
+    await msg_builder.notify_game_state_update(game_update)
+    expected = [
+        ExpectedBroadcast(
+            ["Alice"],
+            MessageType.GAME_STATE,
+            {
+                "room_id": 123,
+                "shared_view": {"field": "last"},
+                "intermediate_shared_views": [{"field": "first"}],
+            },
+        )
+    ]
+    check_messages(messages_spy, expected)
+
+
 @pytest.mark.asyncio
 async def test_message_builder_sends_private_game_states_to_players(
     event_bus, messages_spy
@@ -147,6 +179,39 @@ async def test_message_builder_sends_full_state_for_reconnecting_client_to_sync(
     }
 
 
+@pytest.mark.asyncio
+async def test_message_builder_asks_to_resume_client_that_saw_earlier_frames(
+    event_bus, messages_spy, event_spy
+):
+    resumes = event_spy(OutgoingResume)
+    msg_builder = MessageBuilder(event_bus)
+    room_state = RoomState(
+        room_id=123,
+        capacity=4,
+        player_ids=["Alice", "Bob"],
+        offline_players=[],
+        is_full=False,
+        configuration=None,
+    )
+    await msg_builder.sync_client_state(
+        SyncClientState(
+            client_id="Alice",
+            room_state=room_state,
+            shared_view=_MockView(field="shared"),
+            last_seen=41,
+            buffer_id="b1",
+        )
+    )
+    assert messages_spy == []
+    assert len(resumes) == 1
+    assert resumes[0].player_id == "Alice"
+    assert (resumes[0].buffer_id, resumes[0].last_seen) == ("b1", 41)
+    assert [msg.message_type for msg in resumes[0].fallback] == [
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_STATE,
+    ]
+
+
 @pytest.mark.asyncio
 async def test_message_builder_broadcasts_timer_alerts_to_players_and_spectators(
     event_bus, messages_spy
@@ -171,3 +236,189 @@ async def test_message_builder_broadcasts_timer_alerts_to_players_and_spectators
         )
     ]
     check_messages(messages_spy, expected)
+
+
+@pytest.mark.asyncio
+async def test_message_builder_publishes_single_broadcast_for_shared_view(
+    event_bus, messages_spy
+):
+    msg_builder = MessageBuilder(event_bus)
+    game_update = GameStateUpdate(
+        room_id=123,
+        shared_view=_MockView(field="value"),
+        private_views=dict(),
+        recipients=["Alice", "Bob", "Charlie"],
+    )
+    await msg_builder.notify_game_state_update(game_update)
+    assert len(messages_spy) == 1
+    assert messages_spy[0].recipients == ("Alice", "Bob", "Charlie")
+
+
+@pytest.mark.asyncio
+async def test_message_builder_does_not_broadcast_to_empty_recipient_list(
+    event_bus, messages_spy
+):
+    msg_builder = MessageBuilder(event_bus)
+    game_update = GameStateUpdate(
+        room_id=123,
+        shared_view=_MockView(field="value"),
+        private_views=dict(),
+        recipients=[],
+    )
+    await msg_builder.notify_game_state_update(game_update)
+    assert messages_spy == []
+
+
+class _MockHistoryView(BaseModel):
+    status: str
+    history: tuple[str, ...]
+
+
+def _history_update(status, history, recipients=("Alice", "Bob")):
+    return GameStateUpdate(
+        room_id=123,
+        shared_view=_MockHistoryView(status=status, history=history),
+        private_views={},
+        recipients=list(recipients),
+    )
+
+
+@pytest.fixture
+def delta_builder(event_bus):
+    msg_builder = MessageBuilder(event_bus)
+    msg_builder.set_update_mode(SetUpdateMode(player_id="Alice", delta_updates=True))
+    return msg_builder
+
+
+@pytest.mark.asyncio
+async def test_message_builder_sends_versioned_snapshot_before_first_delta(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", ("m1",)))
+    expected = [
+        ExpectedBroadcast(
+            ["Bob"],
+            MessageType.GAME_STATE,
+            {"room_id": 123, "shared_view": {"status": "A", "history": ("m1",)}},
+        ),
+        ExpectedBroadcast(
+            ["Alice"],
+            MessageType.GAME_STATE,
+            {
+                "room_id": 123,
+                "shared_view": {"status": "A", "history": ("m1",)},
+                "version": 1,
+            },
+        ),
+    ]
+    check_messages(messages_spy, expected)
+
+
+@pytest.mark.asyncio
+async def test_message_builder_sends_deltas_to_clients_in_delta_mode(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", ("m1",)))
+    messages_spy.clear()
+    await delta_builder.notify_game_state_update(_history_update("B", ("m1", "m2")))
+    expected = [
+        ExpectedBroadcast(
+            ["Bob"],
+            MessageType.GAME_STATE,
+            {"room_id": 123, "shared_view": {"status": "B", "history": ("m1", "m2")}},
+        ),
+        ExpectedBroadcast(
+            ["Alice"],
+            MessageType.GAME_STATE_DELTA,
+            {
+                "room_id": 123,
+                "version": 2,
+                "base_version": 1,
+                "shared_view_delta": {
+                    "changes": {"status": "B"},
+                    "appended": {"history": ["m2"]},
+                },
+            },
+        ),
+    ]
+    check_messages(messages_spy, expected)
+
+
+@pytest.mark.asyncio
+async def test_message_builder_sends_snapshot_to_delta_client_new_to_the_room(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", (), ["Bob"]))
+    messages_spy.clear()
+    await delta_builder.notify_game_state_update(_history_update("B", ()))
+    alice_msg = next(
+        msg for msg in messages_spy if "Alice" in getattr(msg, "recipients", ())
+    )
+    assert alice_msg.message.message_type == MessageType.GAME_STATE
+    assert alice_msg.message.payload["version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_message_builder_sends_deltas_after_versioned_sync(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", (), ["Bob"]))
+    await delta_builder.sync_client_state(
+        SyncClientState(
+            client_id="Alice",
+            shared_view=_MockHistoryView(status="A", history=()),
+            room_state=RoomState(
+                room_id=123,
+                capacity=2,
+                player_ids=["Bob"],
+                offline_players=[],
+                is_full=False,
+            ),
+        )
+    )
+    assert messages_spy[-1].message.payload["version"] == 1
+    messages_spy.clear()
+    await delta_builder.notify_game_state_update(_history_update("B", ()))
+    assert messages_spy[-1].recipients == ("Alice",)
+    assert messages_spy[-1].message.message_type == MessageType.GAME_STATE_DELTA
+
+
+@pytest.mark.asyncio
+async def test_message_builder_forgets_delta_mode_of_disconnected_client(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", ()))
+    delta_builder.forget_client(PlayerDisconnected(player_id="Alice"))
+    messages_spy.clear()
+    await delta_builder.notify_game_state_update(_history_update("B", ()))
+    assert [msg.message.message_type for msg in messages_spy] == [
+        MessageType.GAME_STATE
+    ]
+    assert messages_spy[0].recipients == ("Alice", "Bob")
+
+
+@pytest.mark.asyncio
+async def test_message_builder_sends_snapshot_to_client_switching_to_delta_mode(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", ()))
+    delta_builder.set_update_mode(SetUpdateMode(player_id="Bob", delta_updates=True))
+    messages_spy.clear()
+    await delta_builder.notify_game_state_update(_history_update("B", ()))
+    bob_msg = next(msg for msg in messages_spy if "Bob" in msg.recipients)
+    assert bob_msg.message.message_type == MessageType.GAME_STATE
+    assert bob_msg.message.payload["version"] == 2
+
+
+@pytest.mark.asyncio
+async def test_message_builder_sends_snapshot_to_delta_client_after_reconnect(
+    delta_builder, messages_spy
+):
+    await delta_builder.notify_game_state_update(_history_update("A", ()))
+    delta_builder.forget_client(PlayerDisconnected(player_id="Alice"))
+    delta_builder.set_update_mode(SetUpdateMode(player_id="Alice", delta_updates=True))
+    messages_spy.clear()
+    await delta_builder.notify_game_state_update(_history_update("B", ()))
+    alice_msg = next(msg for msg in messages_spy if "Alice" in msg.recipients)
+    assert alice_msg.message.message_type == MessageType.GAME_STATE
+    assert alice_msg.message.payload["version"] == 2
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+from gamehub.core.events.game_log import GameCreated, GameFinished, MoveAccepted
+from gamehub.core.move_log import MoveLog, RoomLog, load_room_logs
+
+
+@pytest.fixture
+def move_log(tmp_path):
+    log = MoveLog(str(tmp_path), fsync_interval_seconds=0)
+    yield log
+    log.close()
+
+
+def _created(room_id: int = 1, seed: int = 123) -> GameCreated:
+    return GameCreated(
+        room_id=room_id,
+        game_type="rock_paper_scissors",
+        player_ids=("Ana", "Bob"),
+        seed=seed,
+    )
+
+
+def test_move_log_records_inputs_of_each_room(tmp_path, move_log):
+    move_log.handle_game_created(_created())
+    move_log.handle_move_accepted(
+        MoveAccepted(room_id=1, move={"player_id": "Ana", "selection": "ROCK"})
+    )
+    move_log.handle_move_accepted(
+        MoveAccepted(
+            room_id=1,
+            move={"player_id": "Bob", "selection": "PAPER", "is_bot_move": True},
+        )
+    )
+    move_log.close()
+    assert load_room_logs(str(tmp_path)) == [
+        RoomLog(
+            room_id=1,
+            game_type="rock_paper_scissors",
+            player_ids=("Ana", "Bob"),
+            seed=123,
+            inputs=(
+                MoveAccepted(room_id=1, move={"player_id": "Ana", "selection": "ROCK"}),
+                MoveAccepted(
+                    room_id=1,
+                    move={
+                        "player_id": "Bob",
+                        "selection": "PAPER",
+                        "is_bot_move": True,
+                    },
+                ),
+            ),
+        )
+    ]
+
+
+def test_move_log_starts_over_when_room_starts_new_game(tmp_path, move_log):
+    move_log.handle_game_created(_created(seed=1))
+    move_log.handle_move_accepted(
+        MoveAccepted(room_id=1, move={"player_id": "Bob", "selection": "PAPER"})
+    )
+    move_log.handle_game_created(_created(seed=2))
+    move_log.close()
+    assert load_room_logs(str(tmp_path)) == [
+        RoomLog(
+            room_id=1,
+            game_type="rock_paper_scissors",
+            player_ids=("Ana", "Bob"),
+            seed=2,
+        )
+    ]
+
+
+def test_move_log_deletes_log_of_finished_game(tmp_path, move_log):
+    move_log.handle_game_created(_created(room_id=1))
+    move_log.handle_game_created(_created(room_id=2))
+    move_log.handle_game_finished(GameFinished(room_id=1))
+    move_log.close()
+    assert os.listdir(tmp_path) == ["room-2.log"]
+    assert [room_log.room_id for room_log in load_room_logs(str(tmp_path))] == [2]
+
+
+def test_loading_room_logs_ignores_partially_written_last_entry(tmp_path, move_log):
+    move_log.handle_game_created(_created())
+    move_log.close()
+    with open(tmp_path / "room-1.log", "a", encoding="utf-8") as file:
+        file.write('{"type":"move","move":{"player_id"')
+    assert load_room_logs(str(tmp_path))[0].inputs == ()
+
+
+def test_loading_room_logs_from_missing_directory_returns_nothing(tmp_path):
+    assert load_room_logs(str(tmp_path / "missing")) == []
+
+
+def test_move_log_sets_aside_log_of_room(tmp_path, move_log):
+    move_log.handle_game_created(_created(room_id=1))
+    move_log.handle_game_created(_created(room_id=2))
+    move_log.close()
+    move_log.set_aside(1)
+    assert [room_log.room_id for room_log in load_room_logs(str(tmp_path))] == [2]
+    assert os.path.exists(tmp_path / "room-1.log.failed")
@@ -7,6 +7,8 @@ from gamehub.core.events.request_events import (
     MakeMove,
     RejoinGame,
     RequestFailed,
+    SetUpdateMode,
+    SyncGame,
     WatchGame,
 )
 from gamehub.core.request_parser import RequestParser
@@ -107,3 +109,27 @@ async def test_request_parser_raises_make_move_event(output_events, build_reques
     assert output_events[0] == MakeMove(
         player_id="Ana", room_id=123, move={"mock": "move"}
     )
+
+
+@pytest.mark.asyncio
+async def test_request_parser_raises_sync_game_event(output_events, build_request):
+    request = build_request(
+        player_id="Ana",
+        request_type=RequestType.SYNC_GAME,
+        payload={"room_id": 123},
+    )
+    output_events = await output_events(request, SyncGame)
+    assert output_events == [SyncGame(player_id="Ana", room_id=123)]
+
+
+@pytest.mark.asyncio
+async def test_request_parser_raises_set_update_mode_event(
+    output_events, build_request
+):
+    request = build_request(
+        player_id="Ana",
+        request_type=RequestType.SET_UPDATE_MODE,
+        payload={"delta_updates": True},
+    )
+    output_events = await output_events(request, SetUpdateMode)
+    assert output_events == [SetUpdateMode(player_id="Ana", delta_updates=True)]
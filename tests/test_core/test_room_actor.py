@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from gamehub.core.room_actor import RoomActor
+
+
+def _recording_job(log: list, name: str):
+    async def job():
+        log.append(f"start {name}")
+        await asyncio.sleep(0)
+        log.append(f"end {name}")
+
+    return job
+
+
+@pytest.mark.asyncio
+async def test_room_actor_processes_jobs_one_at_a_time_in_submission_order():
+    actor = RoomActor(room_id=1, inbox_size=8)
+    log = []
+    for name in ("a", "b", "c"):
+        await actor.submit(_recording_job(log, name))
+    assert log == []
+    await actor.join()
+    assert log == ["start a", "end a", "start b", "end b", "start c", "end c"]
+    assert actor.is_idle
+
+
+@pytest.mark.asyncio
+async def test_room_actor_reports_queue_depth():
+    actor = RoomActor(room_id=1, inbox_size=8)
+    for name in ("a", "b", "c"):
+        await actor.submit(_recording_job([], name))
+    assert actor.queue_depth == 3
+    await actor.join()
+    assert actor.queue_depth == 0
+    assert actor.max_queue_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_room_actor_applies_backpressure_when_inbox_is_full():
+    actor = RoomActor(room_id=1, inbox_size=1)
+    log = []
+    await actor.submit(_recording_job(log, "a"))
+    await actor.submit(_recording_job(log, "b"))
+    assert log == ["start a"]
+    await actor.join()
+    assert log == ["start a", "end a", "start b", "end b"]
+
+
+@pytest.mark.asyncio
+async def test_room_actor_survives_failing_jobs(caplog):
+    actor = RoomActor(room_id=7, inbox_size=8)
+    log = []
+
+    async def failing_job():
+        raise RuntimeError("boom")
+
+    await actor.submit(failing_job)
+    await actor.submit(_recording_job(log, "a"))
+    await actor.join()
+    assert log == ["start a", "end a"]
+    assert "Room 7 failed to process job: boom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_room_actor_restarts_worker_after_draining_inbox():
+    actor = RoomActor(room_id=1, inbox_size=8)
+    log = []
+    await actor.submit(_recording_job(log, "a"))
+    await actor.join()
+    await actor.submit(_recording_job(log, "b"))
+    await actor.join()
+    assert log == ["start a", "end a", "start b", "end b"]
+
+
+@pytest.mark.asyncio
+async def test_room_actor_stop_cancels_pending_work():
+    actor = RoomActor(room_id=1, inbox_size=8)
+    log = []
+    await actor.submit(_recording_job(log, "a"))
+    actor.stop()
+    await asyncio.sleep(0)
+    assert log == []
+    assert actor.is_idle
@@ -1,8 +1,11 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
 from gamehub.core.event_bus import EventBus
+from gamehub.core.event_scheduler import EventScheduler
+from gamehub.core.events.game_log import MoveAccepted
 from gamehub.core.events.player_disconnected import PlayerDisconnected
 from gamehub.core.events.request_events import (
     JoinGameById,
@@ -10,12 +13,18 @@ from gamehub.core.events.request_events import (
     MakeMove,
     RejoinGame,
     RequestFailed,
+    SyncGame,
     WatchGame,
 )
+from gamehub.core.events.room_lifecycle import ReclaimIdleRoom, RoomCreated, RoomRemoved
 from gamehub.core.events.timer_events import TurnTimeout
 from gamehub.core.game_room import GameRoom
+from gamehub.core.move_log import RoomLog
 from gamehub.core.room_manager import RoomManager
+from gamehub.core.room_pool import RoomPool
+from gamehub.core.room_snapshot import RoomSnapshot
 from gamehub.core.room_state import RoomState
+from gamehub.games.rock_paper_scissors import RPSGameLogic, RPSMove
 
 
 @pytest.fixture
@@ -26,7 +35,9 @@ def spy_room():
         room = Mock(spec=GameRoom)
         room.room_id = room_id
         room.is_full = is_full
+        room.num_players = 0
         room.game_type = game_type
+        room.members.return_value = frozenset(["Ana", "Bob"])
         room.room_state.return_value = RoomState[str](
             room_id=room_id,
             capacity=2,
@@ -46,6 +57,7 @@ def spy_room():
         (JoinGameById(player_id="Ana", room_id=2), "join_game_by_id"),
         (RejoinGame(player_id="Ana", room_id=2), "rejoin_game"),
         (WatchGame(player_id="Ana", room_id=2), "watch_game"),
+        (SyncGame(player_id="Ana", room_id=2), "sync_game"),
         (MakeMove(player_id="Ana", room_id=2, move={}), "make_move"),
     ],
 )
@@ -86,11 +98,11 @@ async def test_room_manager_forwards_join_game_request_to_proper_room(spy_room):
 
 @pytest.mark.asyncio
 async def test_room_manager_forwards_rejoin_game_request_to_proper_room(spy_room):
-    request = RejoinGame(player_id="Ana", room_id=1)
+    request = RejoinGame(player_id="Ana", room_id=1, last_seen=7, buffer_id="b1")
     room = spy_room()
     room_manager = RoomManager([room], EventBus())
     await room_manager.rejoin_game(request)
-    room.rejoin.assert_called_once_with("Ana")
+    room.rejoin.assert_called_once_with("Ana", 7, "b1")
 
 
 @pytest.mark.asyncio
@@ -102,6 +114,15 @@ async def test_room_manager_forwards_watch_game_request_to_proper_room(spy_room)
     room.add_spectator.assert_called_once_with("Ana")
 
 
+@pytest.mark.asyncio
+async def test_room_manager_forwards_sync_game_request_to_proper_room(spy_room):
+    request = SyncGame(player_id="Ana", room_id=1, last_seen=7, buffer_id="b1")
+    room = spy_room()
+    room_manager = RoomManager([room], EventBus())
+    await room_manager.sync_game(request)
+    room.sync.assert_called_once_with("Ana", 7, "b1")
+
+
 @pytest.mark.asyncio
 async def test_room_manager_forwards_make_move_request_to_proper_room(spy_room):
     mock_move = {"testkey": "testvalue"}
@@ -136,6 +157,17 @@ async def test_room_manager_notifies_rooms_when_user_disconnects(
     room.handle_player_disconnected.assert_called_once_with("Ana")
 
 
+@pytest.mark.asyncio
+async def test_room_manager_only_notifies_rooms_the_user_is_in(spy_room):
+    room_a = spy_room(room_id=1)
+    room_b = spy_room(room_id=2)
+    room_b.members.return_value = frozenset(["Bob"])
+    room_manager = RoomManager([room_a, room_b], EventBus())
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    room_a.handle_player_disconnected.assert_called_once_with("Ana")
+    room_b.handle_player_disconnected.assert_not_called()
+
+
 @pytest.fixture
 def example_rooms(spy_room):
     return [
@@ -211,3 +243,501 @@ async def test_room_manager_forwards_timeout_event_to_proper_room(spy_room):
     event = TurnTimeout(room_id=1, player_id="Ana", recipients=[])
     await room_manager.handle_timeout(event)
     room.handle_timeout.assert_called_once_with("Ana")
+
+
+@pytest.fixture
+def rps_room_factory(event_bus):
+    def _rps_room(room_id: int) -> GameRoom:
+        return GameRoom(
+            room_id=room_id,
+            game_logic=RPSGameLogic(),
+            move_parser=RPSMove.model_validate,
+            event_bus=event_bus,
+        )
+
+    return _rps_room
+
+
+@pytest.fixture
+def rps_pool(rps_room_factory):
+    def _rps_pool(**kwargs):
+        return RoomPool(
+            room_factories={"rock_paper_scissors": rps_room_factory}, **kwargs
+        )
+
+    return _rps_pool
+
+
+@pytest.mark.asyncio
+async def test_room_manager_spawns_room_when_all_rooms_of_game_type_are_full(
+    spy_room, rps_pool, event_bus, event_spy
+):
+    created = event_spy(RoomCreated)
+    full_room = spy_room(room_id=3, is_full=True, game_type="rock_paper_scissors")
+    room_manager = RoomManager([full_room], event_bus, room_pool=rps_pool())
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="rock_paper_scissors")
+    )
+    assert created == [RoomCreated(room_id=4, game_type="rock_paper_scissors")]
+    room_states = list(room_manager.room_states())
+    assert room_states[-1].room_id == 4
+    assert room_states[-1].player_ids == ["Ana"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_fills_spawned_room_before_spawning_another(
+    rps_pool, event_bus, event_spy
+):
+    created = event_spy(RoomCreated)
+    room_manager = RoomManager([], event_bus, room_pool=rps_pool())
+    for player_id in ("Ana", "Bob", "Cid"):
+        await room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    assert [event.room_id for event in created] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_does_not_spawn_rooms_for_unknown_game_type(
+    rps_pool, event_bus, event_spy
+):
+    failures = event_spy(RequestFailed)
+    room_manager = RoomManager([], event_bus, room_pool=rps_pool())
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="tic_tac_toe")
+    )
+    assert "No available room" in failures[0].error_msg
+
+
+@pytest.mark.asyncio
+async def test_room_manager_does_not_spawn_rooms_beyond_room_cap(
+    rps_pool, event_bus, event_spy
+):
+    failures = event_spy(RequestFailed)
+    room_manager = RoomManager([], event_bus, room_pool=rps_pool(max_rooms=1))
+    for player_id in ("Ana", "Bob", "Cid"):
+        await room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    assert len(list(room_manager.room_states())) == 1
+    assert [f.player_id for f in failures] == ["Cid"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_does_not_spawn_rooms_beyond_memory_cap(
+    rps_pool, event_bus, event_spy
+):
+    failures = event_spy(RequestFailed)
+    pool = rps_pool(max_memory_bytes=100, memory_usage=lambda: 200)
+    room_manager = RoomManager([], event_bus, room_pool=pool)
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="rock_paper_scissors")
+    )
+    assert "No available room" in failures[0].error_msg
+
+
+@pytest.fixture
+def idle_room_manager(rps_pool, event_bus):
+    room_manager = RoomManager(
+        [],
+        event_bus,
+        room_pool=rps_pool(idle_ttl_seconds=0.01),
+        event_scheduler=EventScheduler(event_bus),
+    )
+    event_bus.subscribe(ReclaimIdleRoom, room_manager.reclaim_idle_room)
+    return room_manager
+
+
+@pytest.mark.asyncio
+async def test_room_manager_reclaims_spawned_rooms_after_idle_ttl(
+    idle_room_manager, event_spy
+):
+    removed = event_spy(RoomRemoved)
+    await idle_room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="rock_paper_scissors")
+    )
+    await idle_room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    await asyncio.sleep(0.05)
+    assert removed == [RoomRemoved(room_id=1)]
+    assert list(idle_room_manager.room_states()) == []
+
+
+@pytest.mark.asyncio
+async def test_room_manager_does_not_reclaim_rooms_that_are_in_use(
+    idle_room_manager, event_spy
+):
+    removed = event_spy(RoomRemoved)
+    await idle_room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="rock_paper_scissors")
+    )
+    await idle_room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    await idle_room_manager.join_game_by_id(JoinGameById(player_id="Bob", room_id=1))
+    await asyncio.sleep(0.05)
+    assert removed == []
+
+
+@pytest.mark.asyncio
+async def test_room_manager_never_reclaims_initial_rooms(
+    rps_room_factory, rps_pool, event_bus, event_spy
+):
+    removed = event_spy(RoomRemoved)
+    room_manager = RoomManager(
+        [rps_room_factory(1)],
+        event_bus,
+        room_pool=rps_pool(idle_ttl_seconds=0),
+        event_scheduler=EventScheduler(event_bus),
+    )
+    event_bus.subscribe(ReclaimIdleRoom, room_manager.reclaim_idle_room)
+    await room_manager.join_game_by_id(JoinGameById(player_id="Ana", room_id=1))
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    await asyncio.sleep(0.02)
+    assert removed == []
+
+
+@pytest.mark.asyncio
+async def test_room_manager_prefers_partially_filled_rooms_when_joining_by_type(
+    rps_room_factory, event_bus
+):
+    rooms = [rps_room_factory(room_id) for room_id in (1, 2, 3)]
+    room_manager = RoomManager(rooms, event_bus)
+    await room_manager.join_game_by_id(JoinGameById(player_id="Ana", room_id=2))
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Bob", game_type="rock_paper_scissors")
+    )
+    assert rooms[1].num_players == 2
+    assert rooms[0].num_players == rooms[2].num_players == 0
+
+
+@pytest.mark.asyncio
+async def test_room_manager_reuses_room_after_game_ends(rps_room_factory, event_bus):
+    room = rps_room_factory(1)
+    room_manager = RoomManager([room], event_bus)
+    for player_id in ("Ana", "Bob"):
+        await room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    await room_manager.make_move(
+        MakeMove(player_id="Ana", room_id=1, move={"selection": "ROCK"})
+    )
+    await room_manager.make_move(
+        MakeMove(player_id="Bob", room_id=1, move={"selection": "PAPER"})
+    )
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Cid", game_type="rock_paper_scissors")
+    )
+    assert room.room_state().player_ids == ["Cid"]
+
+
+@pytest.fixture
+def waiting_room_manager(rps_room_factory, event_bus):
+    return RoomManager([rps_room_factory(1)], event_bus, wait_for_room=True)
+
+
+@pytest.mark.asyncio
+async def test_room_manager_queues_players_instead_of_failing_when_rooms_are_full(
+    waiting_room_manager, event_spy
+):
+    failures = event_spy(RequestFailed)
+    for player_id in ("Ana", "Bob", "Cid"):
+        await waiting_room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    assert failures == []
+    assert next(waiting_room_manager.room_states()).player_ids == ["Ana", "Bob"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_seats_waiting_players_when_room_opens(
+    waiting_room_manager,
+):
+    for player_id in ("Ana", "Bob", "Cid", "Dan"):
+        await waiting_room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    for player_id, selection in (("Ana", "ROCK"), ("Bob", "PAPER")):
+        await waiting_room_manager.make_move(
+            MakeMove(player_id=player_id, room_id=1, move={"selection": selection})
+        )
+    assert next(waiting_room_manager.room_states()).player_ids == ["Cid", "Dan"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_drops_disconnected_players_from_waiting_queue(
+    waiting_room_manager,
+):
+    for player_id in ("Ana", "Bob", "Cid", "Dan"):
+        await waiting_room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    await waiting_room_manager.handle_player_disconnected(PlayerDisconnected("Cid"))
+    for player_id, selection in (("Ana", "ROCK"), ("Bob", "PAPER")):
+        await waiting_room_manager.make_move(
+            MakeMove(player_id=player_id, room_id=1, move={"selection": selection})
+        )
+    assert next(waiting_room_manager.room_states()).player_ids == ["Dan"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_keeps_track_of_rooms_players_and_spectators_are_in(
+    rps_room_factory, event_bus
+):
+    room_manager = RoomManager(
+        [rps_room_factory(room_id) for room_id in (1, 2)], event_bus
+    )
+    await room_manager.join_game_by_id(JoinGameById(player_id="Ana", room_id=1))
+    await room_manager.watch_game(WatchGame(player_id="Ana", room_id=2))
+    await room_manager.join_game_by_id(JoinGameById(player_id="Bob", room_id=2))
+    assert room_manager.rooms_of_player("Ana") == [1, 2]
+    assert room_manager.rooms_of_player("Bob") == [2]
+    assert room_manager.rooms_of_player("Cid") == []
+
+
+@pytest.mark.asyncio
+async def test_room_manager_forgets_rooms_players_left(rps_room_factory, event_bus):
+    room_manager = RoomManager([rps_room_factory(1)], event_bus)
+    await room_manager.join_game_by_id(JoinGameById(player_id="Ana", room_id=1))
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    assert room_manager.rooms_of_player("Ana") == []
+
+
+@pytest.mark.asyncio
+async def test_room_manager_keeps_offline_players_in_their_rooms(
+    rps_room_factory, event_bus
+):
+    room_manager = RoomManager([rps_room_factory(1)], event_bus)
+    for player_id in ("Ana", "Bob"):
+        await room_manager.join_game_by_id(JoinGameById(player_id=player_id, room_id=1))
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    assert room_manager.rooms_of_player("Ana") == [1]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_forgets_players_of_finished_game(
+    rps_room_factory, event_bus
+):
+    room_manager = RoomManager([rps_room_factory(1)], event_bus)
+    for player_id in ("Ana", "Bob"):
+        await room_manager.join_game_by_id(JoinGameById(player_id=player_id, room_id=1))
+    for player_id, selection in (("Ana", "ROCK"), ("Bob", "PAPER")):
+        await room_manager.make_move(
+            MakeMove(player_id=player_id, room_id=1, move={"selection": selection})
+        )
+    assert room_manager.rooms_of_player("Ana") == []
+    assert room_manager.rooms_of_player("Bob") == []
+
+
+@pytest.mark.asyncio
+async def test_room_manager_routes_requests_into_room_inboxes(
+    rps_room_factory, rps_pool, event_bus
+):
+    room = rps_room_factory(1)
+    room_manager = RoomManager([room], event_bus, room_pool=rps_pool(inbox_size=8))
+    await room_manager.join_game_by_id(JoinGameById(player_id="Ana", room_id=1))
+    await room_manager.join_game_by_id(JoinGameById(player_id="Bob", room_id=1))
+    assert room.num_players == 0
+    assert room_manager.queue_depths() == {1: 2}
+
+    await room_manager.join()
+    assert room.room_state().player_ids == ["Ana", "Bob"]
+    assert room_manager.queue_depths() == {1: 0}
+    assert room_manager.rooms_of_player("Ana") == [1]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_disconnects_players_with_queued_joins(
+    rps_room_factory, rps_pool, event_bus
+):
+    room = rps_room_factory(1)
+    room_manager = RoomManager([room], event_bus, room_pool=rps_pool(inbox_size=8))
+    await room_manager.join_game_by_id(JoinGameById(player_id="Bob", room_id=1))
+    await room_manager.join_game_by_id(JoinGameById(player_id="Ana", room_id=1))
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    await room_manager.join()
+    assert room.room_state().player_ids == ["Bob", "Ana"]
+    assert room.room_state().offline_players == ["Ana"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_reroutes_queued_joins_when_room_fills_up(
+    rps_room_factory, rps_pool, event_bus, event_spy
+):
+    failed = event_spy(RequestFailed)
+    room_manager = RoomManager(
+        [rps_room_factory(1)], event_bus, room_pool=rps_pool(inbox_size=8)
+    )
+    for player_id in ("Ana", "Bob", "Cid"):
+        await room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    await room_manager.join()
+    assert failed == []
+    assert [state.player_ids for state in room_manager.room_states()] == [
+        ["Ana", "Bob"],
+        ["Cid"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_does_not_reclaim_rooms_with_queued_requests(
+    rps_pool, event_bus, event_spy
+):
+    removed = event_spy(RoomRemoved)
+    room_manager = RoomManager(
+        [], event_bus, room_pool=rps_pool(idle_ttl_seconds=0, inbox_size=8)
+    )
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="rock_paper_scissors")
+    )
+    await room_manager.join()
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    await room_manager.join()
+    await room_manager.join_game_by_id(JoinGameById(player_id="Bob", room_id=1))
+    await room_manager.reclaim_idle_room(ReclaimIdleRoom(room_id=1))
+    await room_manager.join()
+    assert removed == []
+    assert list(room_manager.room_states())[0].player_ids == ["Bob"]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_retries_reclaiming_room_once_it_is_no_longer_busy(
+    rps_pool, event_bus, event_spy
+):
+    removed = event_spy(RoomRemoved)
+    release = asyncio.Event()
+
+    async def block_room(_):
+        await release.wait()
+
+    event_bus.subscribe(RequestFailed, block_room)
+    room_manager = RoomManager(
+        [],
+        event_bus,
+        room_pool=rps_pool(
+            idle_ttl_seconds=0.01, reclaim_retry_seconds=0.01, inbox_size=8
+        ),
+        event_scheduler=EventScheduler(event_bus),
+    )
+    event_bus.subscribe(ReclaimIdleRoom, room_manager.reclaim_idle_room)
+    await room_manager.join_game_by_type(
+        JoinGameByType(player_id="Ana", game_type="rock_paper_scissors")
+    )
+    await room_manager.handle_player_disconnected(PlayerDisconnected("Ana"))
+    await room_manager.join()
+    await room_manager.sync_game(SyncGame(player_id="Bob", room_id=1))
+    await asyncio.sleep(0.05)
+    assert removed == []
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert removed == [RoomRemoved(room_id=1)]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_spawns_room_ids_owned_by_its_shard(
+    rps_room_factory, rps_pool, event_bus, event_spy
+):
+    created = event_spy(RoomCreated)
+    room_manager = RoomManager(
+        [rps_room_factory(4)],
+        event_bus,
+        room_pool=rps_pool(room_id_offset=2, room_id_stride=3),
+    )
+    for player_id in ("Ana", "Bob", "Cid", "Dan", "Eve"):
+        await room_manager.join_game_by_type(
+            JoinGameByType(player_id=player_id, game_type="rock_paper_scissors")
+        )
+    assert [event.room_id for event in created] == [5, 8]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_restores_logged_rooms_under_their_ids(
+    rps_room_factory, rps_pool, event_bus, event_spy
+):
+    created = event_spy(RoomCreated)
+    room_manager = RoomManager([rps_room_factory(1)], event_bus, room_pool=rps_pool())
+    await room_manager.restore_rooms(
+        [
+            RoomLog(
+                room_id=7,
+                game_type="rock_paper_scissors",
+                player_ids=("Ana", "Bob"),
+                seed=0,
+            )
+        ]
+    )
+    assert [event.room_id for event in created] == [7]
+    assert room_manager.rooms_of_player("Ana") == [7]
+    assert [state.room_id for state in room_manager.room_states()] == [1, 7]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_prefers_room_log_of_newer_game_over_snapshot(
+    rps_room_factory, event_bus
+):
+    room = rps_room_factory(1)
+    room_manager = RoomManager([room], event_bus)
+    room_log = RoomLog(
+        room_id=1,
+        game_type="rock_paper_scissors",
+        player_ids=("Ana", "Bob"),
+        seed=2,
+    )
+    stale_snapshot = RoomSnapshot(
+        room_id=1,
+        game_type="rock_paper_scissors",
+        player_ids=("Cid", "Dan"),
+        game_state=None,
+        seed=1,
+        num_inputs=0,
+        random_state=None,
+    )
+    await room_manager.restore_rooms([room_log], [stale_snapshot])
+    assert room.snapshot().player_ids == ("Ana", "Bob")
+
+
+@pytest.mark.asyncio
+async def test_room_manager_skips_rooms_that_fail_to_restore(
+    rps_room_factory, rps_pool, event_bus
+):
+    room_manager = RoomManager([rps_room_factory(1)], event_bus, room_pool=rps_pool())
+    broken_log = RoomLog(
+        room_id=7,
+        game_type="rock_paper_scissors",
+        player_ids=("Ana", "Bob"),
+        seed=0,
+        inputs=(MoveAccepted(room_id=7, move={"player_id": "Ana"}),),
+    )
+    room_log = RoomLog(
+        room_id=8,
+        game_type="rock_paper_scissors",
+        player_ids=("Cid", "Dan"),
+        seed=0,
+    )
+    assert await room_manager.restore_rooms([broken_log, room_log]) == [7]
+    assert room_manager.rooms_of_player("Ana") == []
+    assert room_manager.rooms_of_player("Cid") == [8]
+
+
+@pytest.mark.asyncio
+async def test_room_manager_replays_room_log_when_snapshot_fails_to_restore(
+    rps_room_factory, event_bus
+):
+    room = rps_room_factory(1)
+    room_manager = RoomManager([room], event_bus)
+    room_log = RoomLog(
+        room_id=1,
+        game_type="rock_paper_scissors",
+        player_ids=("Ana", "Bob"),
+        seed=2,
+    )
+    broken_snapshot = RoomSnapshot(
+        room_id=1,
+        game_type="rock_paper_scissors",
+        player_ids=("Ana", "Bob"),
+        game_state=None,
+        seed=2,
+        num_inputs=0,
+        random_state="not a random state",
+    )
+    assert await room_manager.restore_rooms([room_log], [broken_snapshot]) == []
+    assert room.snapshot().player_ids == ("Ana", "Bob")
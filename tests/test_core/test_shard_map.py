@@ -0,0 +1,27 @@
+from gamehub.core.shard_map import ShardMap
+
+
+def test_shard_map_assigns_rooms_round_robin():
+    shard_map = ShardMap(shard_index=1, num_shards=3)
+    assert [shard_map.owner(room_id) for room_id in range(1, 7)] == [1, 2, 0, 1, 2, 0]
+    assert shard_map.is_local(4)
+    assert not shard_map.is_local(5)
+
+
+def test_shard_map_lists_peer_shards():
+    assert list(ShardMap(shard_index=1, num_shards=3).peers()) == [0, 2]
+
+
+def test_shard_map_gives_each_shard_its_own_socket():
+    shard_map = ShardMap(shard_index=0, num_shards=2, socket_dir="/run/gamehub")
+    assert shard_map.socket_path(1) == "/run/gamehub/gamehub-shard-1.sock"
+
+
+def test_shard_map_is_read_from_environment():
+    environ = {
+        "GAMEHUB_SHARD_INDEX": "2",
+        "GAMEHUB_NUM_SHARDS": "4",
+        "GAMEHUB_SHARD_DIR": "/run/gamehub",
+    }
+    assert ShardMap.from_env(environ) == ShardMap(2, 4, "/run/gamehub")
+    assert ShardMap.from_env({}) is None
@@ -0,0 +1,37 @@
+from gamehub.core.shared_view_delta import shared_view_delta
+
+
+def test_delta_of_identical_views_is_empty():
+    view = {"status": "A", "moves": [1, 2]}
+    assert shared_view_delta(view, dict(view)) == {}
+
+
+def test_delta_lists_changed_values():
+    previous = {"status": "A", "players": [{"n": 1}]}
+    current = {"status": "B", "players": [{"n": 2}]}
+    assert shared_view_delta(previous, current) == {
+        "changes": {"status": "B", "players": [{"n": 2}]}
+    }
+
+
+def test_delta_only_carries_items_appended_to_a_sequence():
+    previous = {"moves": ({"m": 1},)}
+    current = {"moves": ({"m": 1}, {"m": 2}, {"m": 3})}
+    assert shared_view_delta(previous, current) == {
+        "appended": {"moves": [{"m": 2}, {"m": 3}]}
+    }
+
+
+def test_delta_replaces_sequence_that_did_not_grow_from_previous_one():
+    previous = {"moves": ({"m": 1}, {"m": 2})}
+    current = {"moves": ({"m": 3},)}
+    assert shared_view_delta(previous, current) == {"changes": {"moves": ({"m": 3},)}}
+
+
+def test_delta_lists_added_and_removed_keys():
+    previous = {"status": "A", "winner": "Bob"}
+    current = {"status": "A", "current_player_id": "Ana"}
+    assert shared_view_delta(previous, current) == {
+        "changes": {"current_player_id": "Ana"},
+        "removed": ["winner"],
+    }
@@ -0,0 +1,186 @@
+import asyncio
+import struct
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from gamehub.core import snapshot_store as snapshot_module
+from gamehub.core.event_bus import EventBus
+from gamehub.core.events.request_events import JoinGameById, MakeMove
+from gamehub.core.game_room import GameRoom
+from gamehub.core.room_manager import RoomManager
+from gamehub.core.setup_bus import setup_snapshot_store
+from gamehub.core.snapshot_store import SnapshotStore, load_room_snapshots
+from gamehub.core.turn_timer import TurnTimerRegistry
+from gamehub.games.rock_paper_scissors import RPSGameLogic, RPSMove
+
+
+def _room_manager(event_bus: EventBus) -> RoomManager:
+    rooms = [
+        GameRoom(
+            room_id=room_id,
+            game_logic=RPSGameLogic(),
+            move_parser=RPSMove.model_validate,
+            event_bus=event_bus,
+        )
+        for room_id in (1, 2)
+    ]
+    return RoomManager(rooms, event_bus)
+
+
+def _snapshot_store(path, event_bus: EventBus, room_manager: RoomManager):
+    snapshot_store = SnapshotStore(
+        str(path), room_manager, TurnTimerRegistry([]), interval_seconds=0.01
+    )
+    setup_snapshot_store(event_bus, snapshot_store)
+    return snapshot_store
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / "rooms.snapshot"
+
+
+@pytest.fixture
+def room_manager(event_bus):
+    return _room_manager(event_bus)
+
+
+@pytest.fixture
+def snapshot_store(snapshot_path, event_bus, room_manager):
+    return _snapshot_store(snapshot_path, event_bus, room_manager)
+
+
+async def _start_game(room_manager: RoomManager, room_id: int) -> None:
+    for player_id in (f"Ana{room_id}", f"Bob{room_id}"):
+        await room_manager.join_game_by_id(
+            JoinGameById(player_id=player_id, room_id=room_id)
+        )
+
+
+async def _select(room_manager: RoomManager, room_id: int, player_id: str) -> None:
+    await room_manager.make_move(
+        MakeMove(player_id=player_id, room_id=room_id, move={"selection": "ROCK"})
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_saves_rooms_with_game_in_progress(
+    snapshot_path, snapshot_store, room_manager
+):
+    await _start_game(room_manager, room_id=1)
+    await room_manager.join_game_by_id(JoinGameById(player_id="Cid", room_id=2))
+    await _select(room_manager, room_id=1, player_id="Ana1")
+    await snapshot_store.save()
+
+    snapshots = load_room_snapshots(str(snapshot_path))
+    assert [snapshot.room_id for snapshot in snapshots] == [1]
+    assert snapshots[0].player_ids == ("Ana1", "Bob1")
+    assert snapshots[0].num_inputs == 1
+    assert snapshot_store.dirty_rooms == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_only_captures_rooms_changed_since_last_save(
+    snapshot_path, snapshot_store, room_manager
+):
+    await _start_game(room_manager, room_id=1)
+    await _start_game(room_manager, room_id=2)
+    await snapshot_store.save()
+    await _select(room_manager, room_id=2, player_id="Ana2")
+    room_manager.snapshot_rooms = AsyncMock(wraps=room_manager.snapshot_rooms)
+    await snapshot_store.save()
+
+    room_manager.snapshot_rooms.assert_awaited_once_with({2})
+    snapshots = load_room_snapshots(str(snapshot_path))
+    assert [snapshot.num_inputs for snapshot in snapshots] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_drops_rooms_whose_game_finished(
+    snapshot_path, snapshot_store, room_manager
+):
+    await _start_game(room_manager, room_id=1)
+    await snapshot_store.save()
+    await _select(room_manager, room_id=1, player_id="Ana1")
+    await _select(room_manager, room_id=1, player_id="Bob1")
+    await snapshot_store.save()
+    assert load_room_snapshots(str(snapshot_path)) == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_restores_saved_rooms_with_players_offline(
+    snapshot_path, snapshot_store, room_manager
+):
+    await _start_game(room_manager, room_id=2)
+    await _select(room_manager, room_id=2, player_id="Ana2")
+    await snapshot_store.save()
+
+    restored_bus = EventBus()
+    restored_manager = _room_manager(restored_bus)
+    restored_store = _snapshot_store(snapshot_path, restored_bus, restored_manager)
+    await restored_store.restore(load_room_snapshots(str(snapshot_path)))
+
+    room_state = list(restored_manager.room_states())[1]
+    assert room_state.player_ids == ["Ana2", "Bob2"]
+    assert sorted(room_state.offline_players) == ["Ana2", "Bob2"]
+    assert restored_manager.rooms_of_player("Ana2") == [2]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_saves_periodically_and_on_close(
+    snapshot_path, snapshot_store, room_manager
+):
+    snapshot_store.start()
+    await _start_game(room_manager, room_id=1)
+    await asyncio.sleep(0.05)
+    assert len(load_room_snapshots(str(snapshot_path))) == 1
+    await _start_game(room_manager, room_id=2)
+    await snapshot_store.close()
+    assert len(load_room_snapshots(str(snapshot_path))) == 2
+
+
+def test_loading_snapshots_ignores_missing_or_unknown_files(snapshot_path):
+    assert load_room_snapshots(str(snapshot_path)) == []
+    snapshot_path.write_bytes(b"not a snapshot")
+    assert load_room_snapshots(str(snapshot_path)) == []
+
+
+async def _save_two_rooms(snapshot_store, room_manager) -> None:
+    await _start_game(room_manager, room_id=1)
+    await _start_game(room_manager, room_id=2)
+    await snapshot_store.save()
+
+
+@pytest.mark.asyncio
+async def test_loading_snapshots_skips_records_that_cannot_be_unpickled(
+    snapshot_path, snapshot_store, room_manager
+):
+    await _save_two_rooms(snapshot_store, room_manager)
+    data = snapshot_path.read_bytes()
+    first_record = len(snapshot_module._MAGIC) + 2 + 4
+    snapshot_path.write_bytes(data[:first_record] + b"\xff" + data[first_record + 1 :])
+    assert [s.room_id for s in load_room_snapshots(str(snapshot_path))] == [2]
+
+
+@pytest.mark.asyncio
+async def test_loading_snapshots_keeps_records_before_truncation(
+    snapshot_path, snapshot_store, room_manager
+):
+    await _save_two_rooms(snapshot_store, room_manager)
+    data = snapshot_path.read_bytes()
+    snapshot_path.write_bytes(data[:-10])
+    assert [s.room_id for s in load_room_snapshots(str(snapshot_path))] == [1]
+    snapshot_path.write_bytes(data + b"\x00")
+    assert [s.room_id for s in load_room_snapshots(str(snapshot_path))] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_loading_snapshots_ignores_other_schema_versions(
+    snapshot_path, snapshot_store, room_manager
+):
+    with patch.object(snapshot_module, "_SCHEMA_VERSION", 0):
+        await _save_two_rooms(snapshot_store, room_manager)
+    assert load_room_snapshots(str(snapshot_path)) == []
+    snapshot_path.write_bytes(b"GHSNAP1\n" + struct.pack(">I", 0))
+    assert load_room_snapshots(str(snapshot_path)) == []
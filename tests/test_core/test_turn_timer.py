@@ -1,16 +1,20 @@
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import pytest
 from freezegun import freeze_time
 
 from gamehub.core.event_scheduler import EventScheduler
+from gamehub.core.events.game_room_update import GameRoomUpdate
 from gamehub.core.events.game_state_update import (
     GameEnded,
     GameStarted,
     TurnEnded,
     TurnStarted,
 )
+from gamehub.core.events.room_lifecycle import RoomCreated, RoomRemoved, RoomRestored
 from gamehub.core.events.timer_events import TurnTimeout
+from gamehub.core.room_state import RoomState
 from gamehub.core.turn_timer import TurnTimer, TurnTimerRegistry
 
 
@@ -64,6 +68,111 @@ def test_turn_timer_registry_cancels_turn_timer_on_turn_end(spy_timers, registry
     spy_timers[1].cancel.assert_not_called()
 
 
+def test_turn_timer_registry_creates_turn_timer_for_new_room_of_timed_game(
+    spy_timer,
+):
+    created_timers = []
+
+    def _timer_factory(room_id):
+        created_timers.append(spy_timer(room_id))
+        return created_timers[-1]
+
+    registry = TurnTimerRegistry(
+        [], turn_timer_factories={"timed_game": _timer_factory}
+    )
+    registry.handle_room_created(RoomCreated(room_id=7, game_type="timed_game"))
+    registry.handle_room_created(RoomCreated(room_id=8, game_type="untimed_game"))
+    registry.handle_turn_start(TurnStarted(room_id=7, player_id="p1", recipients=[]))
+    assert [timer.room_id for timer in created_timers] == [7]
+    created_timers[0].start.assert_called_once_with("p1", [])
+
+
+def test_turn_timer_registry_resets_and_forgets_timer_of_removed_room(
+    spy_timers, registry
+):
+    registry.handle_room_removed(RoomRemoved(room_id=1))
+    spy_timers[0].reset.assert_called_once()
+    registry.handle_game_start(GameStarted(room_id=1))
+    spy_timers[0].reset.assert_called_once()
+
+
+def _room_update(room_id, offline_players):
+    return GameRoomUpdate(
+        room_state=RoomState(
+            room_id=room_id,
+            capacity=2,
+            player_ids=["p1", "p2"],
+            offline_players=offline_players,
+            is_full=True,
+        ),
+        recipients=["p1", "p2"],
+    )
+
+
+def test_turn_timer_registry_starts_offline_timer_for_offline_player_turn(
+    spy_timers, registry
+):
+    registry.handle_room_update(_room_update(1, ["p2"]))
+    registry.handle_turn_start(TurnStarted(room_id=1, player_id="p1", recipients=[]))
+    registry.handle_turn_start(TurnStarted(room_id=1, player_id="p2", recipients=[]))
+    spy_timers[0].start.assert_called_once_with("p1", [])
+    spy_timers[0].start_offline.assert_called_once_with("p2", [])
+
+
+def test_turn_timer_registry_notifies_timer_when_players_go_offline_and_return(
+    spy_timers, registry
+):
+    registry.handle_room_update(_room_update(1, ["p2"]))
+    registry.handle_room_update(_room_update(1, ["p2"]))
+    spy_timers[0].handle_player_offline.assert_called_once_with("p2")
+    registry.handle_room_update(_room_update(1, []))
+    spy_timers[0].handle_player_online.assert_called_once_with("p2")
+    spy_timers[1].handle_player_offline.assert_not_called()
+
+
+def test_turn_timer_registry_resumes_turn_with_restored_deadline(spy_timers, registry):
+    expires_at = datetime(2025, 5, 31, 13, 46, tzinfo=timezone.utc)
+    registry.resume_turns(1, {"p1": expires_at})
+    registry.handle_turn_start(
+        TurnStarted(room_id=1, player_id="p1", recipients=["p1"])
+    )
+    registry.handle_turn_start(
+        TurnStarted(room_id=1, player_id="p1", recipients=["p1"])
+    )
+    spy_timers[0].resume.assert_called_once_with("p1", ["p1"], expires_at)
+    spy_timers[0].start.assert_called_once_with("p1", ["p1"])
+
+
+def test_turn_timer_registry_reports_deadlines_of_room_timer(spy_timers, registry):
+    spy_timers[0].deadlines = {"p1": datetime(2025, 5, 31, tzinfo=timezone.utc)}
+    assert registry.turn_deadlines(1) == spy_timers[0].deadlines
+    assert registry.turn_deadlines(3) == {}
+
+
+def test_turn_timer_registry_forgets_offline_players_at_game_end(spy_timers, registry):
+    registry.handle_room_update(_room_update(1, ["p2"]))
+    registry.handle_game_end(GameEnded(room_id=1))
+    registry.handle_turn_start(TurnStarted(room_id=1, player_id="p2", recipients=[]))
+    spy_timers[0].start.assert_called_once_with("p2", [])
+    spy_timers[0].start_offline.assert_not_called()
+
+
+def test_turn_timer_registry_gives_restored_players_full_turns_until_they_rejoin(
+    spy_timers, registry
+):
+    registry.handle_room_restored(RoomRestored(room_id=1, player_ids=("p1", "p2")))
+    registry.handle_room_update(_room_update(1, ["p1", "p2"]))
+    registry.handle_turn_start(TurnStarted(room_id=1, player_id="p1", recipients=[]))
+    spy_timers[0].start.assert_called_once_with("p1", [])
+    spy_timers[0].start_offline.assert_not_called()
+    spy_timers[0].handle_player_offline.assert_not_called()
+
+    registry.handle_room_update(_room_update(1, ["p2"]))
+    spy_timers[0].handle_player_online.assert_called_once_with("p1")
+    registry.handle_room_update(_room_update(1, ["p1", "p2"]))
+    spy_timers[0].handle_player_offline.assert_called_once_with("p1")
+
+
 @pytest.fixture
 def event_scheduler_spy():
     return Mock(spec=EventScheduler)
@@ -76,6 +185,7 @@ def turn_timer(event_scheduler_spy):
         room_id=1,
         timeout_seconds=60,
         reminders_at_seconds_remaining=(5, 20),
+        offline_grace_seconds=10,
     )
 
 
@@ -121,3 +231,91 @@ def test_turn_timer_allows_cancelling_all_scheduled_events(
     turn_timer.start(player_id="p2", recipients=["p1", "p2"])
     turn_timer.reset()
     assert event_scheduler_spy.cancel_event.call_count == 6
+
+
+def test_turn_timer_shortens_timeout_and_reminders_for_offline_player(
+    event_scheduler_spy, turn_timer
+):
+    turn_timer.start_offline(player_id="p1", recipients=["p1", "p2"])
+    scheduled = event_scheduler_spy.schedule_event.call_args_list
+    assert [call.args[1] for call in scheduled] == [10, 5]
+    assert scheduled[0].args[0] == TurnTimeout(
+        room_id=1, player_id="p1", recipients=["p1", "p2"]
+    )
+
+
+def test_turn_timer_restarts_active_turn_when_player_goes_offline(
+    event_scheduler_spy, turn_timer
+):
+    turn_timer.start(player_id="p1", recipients=["p1", "p2"])
+    event_scheduler_spy.reset_mock()
+    turn_timer.handle_player_offline("p1")
+    assert event_scheduler_spy.cancel_event.call_count == 3
+    assert event_scheduler_spy.schedule_event.call_args_list[0].args[1] == 10
+
+
+def test_turn_timer_restores_full_timeout_when_player_comes_back_online(
+    event_scheduler_spy, turn_timer
+):
+    turn_timer.start_offline(player_id="p1", recipients=["p1", "p2"])
+    event_scheduler_spy.reset_mock()
+    turn_timer.handle_player_online("p1")
+    assert event_scheduler_spy.schedule_event.call_args_list[0].args[1] == 60
+
+
+def test_turn_timer_resumes_remaining_time_when_player_reconnects_during_grace(
+    event_scheduler_spy, turn_timer
+):
+    with freeze_time("2025-05-31 13:45:00") as frozen_time:
+        turn_timer.start(player_id="p1", recipients=["p1", "p2"])
+        frozen_time.tick(20)
+        turn_timer.handle_player_offline("p1")
+        frozen_time.tick(5)
+        event_scheduler_spy.reset_mock()
+        turn_timer.handle_player_online("p1")
+    assert event_scheduler_spy.schedule_event.call_args_list[0].args[1] == 35
+    assert turn_timer.deadlines == {
+        "p1": datetime(2025, 5, 31, 13, 46, tzinfo=timezone.utc)
+    }
+
+
+def test_turn_timer_ignores_connectivity_changes_outside_player_turn(
+    event_scheduler_spy, turn_timer
+):
+    turn_timer.start(player_id="p1", recipients=["p1", "p2"])
+    turn_timer.cancel(player_id="p1")
+    event_scheduler_spy.reset_mock()
+    turn_timer.handle_player_offline("p1")
+    turn_timer.handle_player_online("p2")
+    event_scheduler_spy.schedule_event.assert_not_called()
+
+
+@freeze_time("2025-05-31 13:45:00")
+def test_turn_timer_tracks_deadline_of_active_turns(turn_timer):
+    turn_timer.start(player_id="p1", recipients=["p1", "p2"])
+    turn_timer.start(player_id="p2", recipients=["p1", "p2"])
+    turn_timer.cancel(player_id="p2")
+    assert turn_timer.deadlines == {
+        "p1": datetime(2025, 5, 31, 13, 46, tzinfo=timezone.utc)
+    }
+
+
+@freeze_time("2025-05-31 13:45:00")
+def test_turn_timer_resumes_turn_until_previous_deadline(
+    event_scheduler_spy, turn_timer
+):
+    expires_at = datetime(2025, 5, 31, 13, 45, 30, tzinfo=timezone.utc)
+    turn_timer.resume(player_id="p1", recipients=["p1"], expires_at=expires_at)
+    scheduled = event_scheduler_spy.schedule_event.call_args_list
+    assert sorted(call.args[1] for call in scheduled) == [10, 25, 30]
+    assert turn_timer.deadlines == {"p1": expires_at}
+
+
+@freeze_time("2025-05-31 13:45:00")
+def test_turn_timer_times_out_resumed_turn_past_its_deadline(
+    event_scheduler_spy, turn_timer
+):
+    expires_at = datetime(2025, 5, 31, 13, 44, tzinfo=timezone.utc)
+    turn_timer.resume(player_id="p1", recipients=["p1"], expires_at=expires_at)
+    scheduled = event_scheduler_spy.schedule_event.call_args_list
+    assert [call.args[1] for call in scheduled] == [0]
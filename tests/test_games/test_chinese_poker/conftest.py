@@ -6,6 +6,7 @@ from gamehub.games.chinese_poker import (
     ChinesePokerMove,
 )
 from gamehub.games.chinese_poker.game_state import ChinesePokerState
+from gamehub.games.chinese_poker.hand import to_card_set
 from gamehub.games.chinese_poker.player import ChinesePokerPlayer
 from gamehub.games.chinese_poker.status import ChinesePokerStatus
 from gamehub.games.playing_cards import PlayingCard
@@ -131,7 +132,9 @@ def deal_cards(player_ids, initial_cards):
         status=ChinesePokerStatus.DEAL_CARDS,
         players=[
             ChinesePokerPlayer(
-                player_id=player_id, num_points=0, cards=initial_cards[player_id]
+                player_id=player_id,
+                num_points=0,
+                card_set=to_card_set(initial_cards[player_id]),
             )
             for player_id in player_ids
         ],
@@ -202,7 +205,7 @@ def last_points_update(player_ids):
     return ChinesePokerState(
         status=ChinesePokerStatus.UPDATE_POINTS,
         players=[
-            ChinesePokerPlayer(player_id=player_id, num_points=num_points, cards=())
+            ChinesePokerPlayer(player_id=player_id, num_points=num_points)
             for player_id, num_points in zip(player_ids, points)
         ],
     )
@@ -1,5 +1,8 @@
+from random import Random
+
 import pytest
 
+from gamehub.games.chinese_poker import ChinesePokerGameLogic
 from gamehub.games.chinese_poker.status import ChinesePokerStatus
 
 
@@ -203,3 +206,27 @@ def test_players_receive_cards_without_repetition(game_logic, start_match):
 
 def test_player_with_the_smallest_card_starts_first_round(start_round):
     assert start_round.current_player_id() == "Diana"
+
+
+def test_seeded_game_logic_deals_reproducible_cards(default_config, start_match):
+    deals = [
+        ChinesePokerGameLogic(default_config, Random(5)).next_automated_state(
+            start_match
+        )
+        for _ in range(2)
+    ]
+    assert deals[0].players == deals[1].players
+
+
+def test_game_logic_deals_same_cards_after_restoring_random_state(
+    default_config, start_match
+):
+    game_logic = ChinesePokerGameLogic(default_config, Random(5))
+    game_logic.next_automated_state(start_match)
+    random_state = game_logic.random_state()
+    first_deal = game_logic.next_automated_state(start_match)
+    restored_logic = ChinesePokerGameLogic(default_config)
+    restored_logic.restore_random_state(random_state)
+    assert restored_logic.next_automated_state(start_match).players == (
+        first_deal.players
+    )
@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gamehub.games.chinese_poker import ChinesePokerGameLogic
+from gamehub.games.chinese_poker.bots import (
+    GreedyStrategy,
+    HeuristicStrategy,
+    MonteCarloStrategy,
+    PassingStrategy,
+)
+from gamehub.games.chinese_poker.game_state import ChinesePokerState
+from gamehub.games.chinese_poker.hand import to_card_set
+from gamehub.games.chinese_poker.player import ChinesePokerPlayer
+from gamehub.games.chinese_poker.status import ChinesePokerStatus
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture
+def respond_to_single(parse_hand, parse_move):
+    def _respond_to_single(own_cards, opponent_cards):
+        return ChinesePokerState(
+            status=ChinesePokerStatus.AWAIT_PLAYER_ACTION,
+            players=(
+                ChinesePokerPlayer("Alice", 0, to_card_set(parse_hand(own_cards))),
+                ChinesePokerPlayer("Bob", 0, to_card_set(parse_hand(opponent_cards))),
+            ),
+            current_player_idx=0,
+            move_history=(parse_move("Bob", "Qd"),),
+        )
+
+    return _respond_to_single
+
+
+@pytest.fixture
+def strategies(executor):
+    return {
+        "passing": PassingStrategy(),
+        "greedy": GreedyStrategy(),
+        "heuristic": HeuristicStrategy(),
+        "monte_carlo": MonteCarloStrategy(executor, num_rollouts=2, seed=1),
+    }
+
+
+@pytest.mark.parametrize("strategy", ["passing", "greedy", "heuristic", "monte_carlo"])
+@pytest.mark.parametrize("state", ["await_action", "await_second_action"])
+def test_bot_strategies_choose_legal_moves(
+    request, game_logic, strategies, strategy, state
+):
+    state = request.getfixturevalue(state)
+    strategy = strategies[strategy]
+    move = strategy.choose_move(state, game_logic.configuration)
+    assert move.player_id == state.current_player_id()
+    assert game_logic.make_move(state, move).status == ChinesePokerStatus.END_TURN
+
+
+def test_greedy_strategy_plays_weakest_legal_hand(game_logic, await_second_action):
+    move = GreedyStrategy.choose_move(await_second_action, game_logic.configuration)
+    assert move == next(game_logic.legal_moves(await_second_action))
+    assert not move.is_pass
+
+
+def test_heuristic_strategy_sheds_as_many_cards_as_possible(game_logic, await_action):
+    move = HeuristicStrategy().choose_move(await_action, game_logic.configuration)
+    assert len(move.cards) == 5
+
+
+def test_heuristic_strategy_holds_top_rank_outside_endgame(
+    game_logic, respond_to_single
+):
+    state = respond_to_single("2c 4d 5d 6d 9h 9s", "3d 4c 5s 6h 7h 8h")
+    move = HeuristicStrategy().choose_move(state, game_logic.configuration)
+    assert move.is_pass
+
+
+def test_heuristic_strategy_uses_top_rank_in_endgame(
+    game_logic, respond_to_single, parse_hand
+):
+    state = respond_to_single("2c 4d 5d 6d 9h 9s", "3d 4c")
+    move = HeuristicStrategy().choose_move(state, game_logic.configuration)
+    assert move.cards == parse_hand("2c")
+
+
+def test_monte_carlo_strategy_is_deterministic_for_a_seed(
+    game_logic, await_second_action, executor
+):
+    strategy = MonteCarloStrategy(executor, num_rollouts=4, seed=3)
+    moves = [
+        strategy.choose_move(await_second_action, game_logic.configuration)
+        for _ in range(2)
+    ]
+    assert moves[0] == moves[1]
+
+
+def test_monte_carlo_strategy_plays_winning_card_in_endgame(
+    game_logic, respond_to_single, parse_hand, executor
+):
+    state = respond_to_single("2c", "3d 4c")
+    strategy = MonteCarloStrategy(executor, num_rollouts=4, seed=3)
+    move = strategy.choose_move(state, game_logic.configuration)
+    assert move.cards == parse_hand("2c")
+
+
+def test_timeout_uses_configured_bot_strategy(default_config, await_second_action):
+    game_logic = ChinesePokerGameLogic(default_config, bot_strategy=GreedyStrategy())
+    move = game_logic.timeout_move(await_second_action, "Alice")
+    expected_move = next(game_logic.legal_moves(await_second_action))
+    assert move.cards == expected_move.cards
+    assert move.is_bot_move
@@ -0,0 +1,56 @@
+import pytest
+
+from gamehub.games.chinese_poker.hand import card_value
+from gamehub.games.chinese_poker.hand.card_set import (
+    CARDS_BY_BIT,
+    EMPTY_CARD_SET,
+    contains_all,
+    lowest_card,
+    num_cards,
+    to_card_set,
+    to_cards,
+)
+
+
+def test_cards_by_bit_are_ordered_by_card_value():
+    values = [card_value(card) for card in CARDS_BY_BIT]
+    assert len(CARDS_BY_BIT) == 52
+    assert values == sorted(values)
+    assert len(set(values)) == 52
+
+
+def test_card_set_round_trips_in_card_value_order(parse_hand):
+    cards = parse_hand("2c Kd 3s 9h 3d")
+    assert to_cards(to_card_set(cards)) == parse_hand("3d 3s 9h Kd 2c")
+
+
+def test_full_deck_uses_52_bits():
+    assert to_card_set(CARDS_BY_BIT) == (1 << 52) - 1
+
+
+def test_num_cards_counts_set_bits(parse_hand):
+    assert num_cards(to_card_set(parse_hand("3d 4c 5s 6d 7h"))) == 5
+    assert num_cards(EMPTY_CARD_SET) == 0
+
+
+def test_lowest_card_is_the_card_with_smallest_value(parse_hand, parse_card):
+    assert lowest_card(to_card_set(parse_hand("2c As 3h 3c"))) == parse_card("3h")
+
+
+def test_lowest_card_raises_value_error_for_empty_card_set():
+    with pytest.raises(ValueError, match="Empty card set"):
+        lowest_card(EMPTY_CARD_SET)
+
+
+@pytest.mark.parametrize(
+    ("owned", "requested", "expected"),
+    [
+        ("3d 4c 5s", "3d 5s", True),
+        ("3d 4c 5s", "", True),
+        ("3d 4c 5s", "3d 6s", False),
+        ("", "2c", False),
+    ],
+)
+def test_contains_all(parse_hand, owned, requested, expected):
+    owned_set = to_card_set(parse_hand(owned))
+    assert contains_all(owned_set, to_card_set(parse_hand(requested))) == expected
@@ -1,6 +1,7 @@
 import pytest
 
-from gamehub.games.chinese_poker.hand import hand_value
+from gamehub.games.chinese_poker.hand import hand_rank, hand_value, to_card_set
+from gamehub.games.chinese_poker.hand.hand_value import hands_ranked_above
 
 
 @pytest.mark.parametrize(
@@ -41,3 +42,29 @@ def test_hand_value_raises_value_error_if_invalid_hand(bad_hand, parse_hand):
 )
 def test_hand_value_allows_comparison_between_hands(hand_a, hand_b, parse_hand):
     assert hand_value(parse_hand(hand_a)) < hand_value(parse_hand(hand_b))
+
+
+@pytest.mark.parametrize(
+    ("size", "num_hands"),
+    [(1, 52), (2, 78), (3, 52), (4, 0), (5, 3744 + 624 + 10240 + 5148 - 40)],
+)
+def test_every_valid_hand_is_ranked(size, num_hands):
+    assert len(list(hands_ranked_above(size))) == num_hands
+
+
+def test_hand_rank_of_card_set_matches_hand_value(parse_hand):
+    hand = parse_hand("9h Tc Jd Qc Kc")
+    assert hand_rank(to_card_set(hand)) == hand_value(hand)
+
+
+def test_hand_rank_raises_value_error_if_invalid_hand(parse_hand):
+    with pytest.raises(ValueError, match="Invalid hand"):
+        hand_rank(to_card_set(parse_hand("3d 4d")))
+
+
+def test_hands_ranked_above_are_stronger_and_in_increasing_order(parse_hand):
+    pair = hand_value(parse_hand("Kd Kc"))
+    ranks = [rank for rank, _ in hands_ranked_above(2, pair)]
+    assert ranks == sorted(ranks)
+    assert all(rank > pair for rank in ranks)
+    assert len(ranks) == 12
@@ -0,0 +1,65 @@
+from itertools import combinations
+
+import pytest
+
+from gamehub.core.exceptions import InvalidMoveError
+from gamehub.games.chinese_poker import ChinesePokerMove
+from gamehub.games.chinese_poker.hand import hand_value
+
+
+def _brute_force_legal_moves(game_logic, state):
+    player = state.current_player()
+    candidates = [()] + [
+        cards
+        for size in range(1, len(player.cards) + 1)
+        for cards in combinations(player.cards, size)
+    ]
+    for cards in candidates:
+        move = ChinesePokerMove(player_id=player.player_id, cards=cards)
+        try:
+            game_logic.make_move(state, move)
+        except InvalidMoveError:
+            continue
+        yield frozenset(cards)
+
+
+@pytest.mark.parametrize("state", ["await_action", "await_second_action"])
+def test_legal_moves_match_brute_force_validation(request, game_logic, state):
+    state = request.getfixturevalue(state)
+    generated = [frozenset(move.cards) for move in game_logic.legal_moves(state)]
+    assert len(generated) == len(set(generated))
+    assert set(generated) == set(_brute_force_legal_moves(game_logic, state))
+
+
+@pytest.mark.parametrize("state", ["await_action", "await_second_action"])
+def test_legal_moves_are_ordered_by_hand_strength(request, game_logic, state):
+    state = request.getfixturevalue(state)
+    values = [
+        hand_value(move.cards)
+        for move in game_logic.legal_moves(state)
+        if not move.is_pass
+    ]
+    assert values == sorted(values)
+
+
+def test_legal_moves_of_the_first_turn_use_the_smallest_card(
+    game_logic, await_action, parse_card
+):
+    moves = list(game_logic.legal_moves(await_action))
+    assert moves
+    assert all(parse_card("3d") in move.cards for move in moves)
+    assert all(move.player_id == "Diana" for move in moves)
+
+
+def test_pass_is_the_last_legal_move_when_there_is_a_hand_to_beat(
+    game_logic, await_second_action
+):
+    moves = list(game_logic.legal_moves(await_second_action))
+    assert moves[-1].is_pass
+    assert not any(move.is_pass for move in moves[:-1])
+
+
+@pytest.mark.parametrize("state", ["start_turn", "end_turn", "end_round"])
+def test_there_are_no_legal_moves_if_not_awaiting_action(request, game_logic, state):
+    state = request.getfixturevalue(state)
+    assert list(game_logic.legal_moves(state)) == []
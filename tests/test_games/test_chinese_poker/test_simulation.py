@@ -0,0 +1,33 @@
+import csv
+import io
+
+from gamehub.games.chinese_poker.simulation import run_simulations, simulate_game
+
+
+def test_simulated_game_ends_once_point_threshold_is_reached(default_config):
+    result = simulate_game(default_config, seed=7)
+    assert max(result.points) >= default_config.game_over_point_threshold
+    assert result.num_matches >= 1
+    assert result.num_moves >= result.num_matches
+
+
+def test_simulated_game_credits_add_up_to_zero(default_config):
+    result = simulate_game(default_config, seed=7)
+    assert sum(result.credits) == 0
+
+
+def test_simulated_games_are_deterministic_per_seed(default_config):
+    assert simulate_game(default_config, seed=3) == simulate_game(
+        default_config, seed=3
+    )
+
+
+def test_simulations_stream_one_row_per_game_in_seed_order(default_config):
+    output = io.StringIO()
+    num_games = run_simulations(default_config, range(4), output, max_workers=2)
+    rows = list(csv.reader(io.StringIO(output.getvalue())))
+    assert num_games == 4
+    assert [int(row[0]) for row in rows] == [0, 1, 2, 3]
+    assert rows[2] == [
+        str(value) for value in simulate_game(default_config, 2).to_row()
+    ]
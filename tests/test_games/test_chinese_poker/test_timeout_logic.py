@@ -20,31 +20,32 @@ from gamehub.games.chinese_poker.status import ChinesePokerStatus
         "last_points_update",
     ],
 )
-def test_state_after_timeout_is_null_if_current_state_not_awaiting_action(
+def test_timeout_move_is_null_if_current_state_not_awaiting_action(
     request, game_logic, state
 ):
     current_state = request.getfixturevalue(state)
-    assert game_logic.state_after_timeout(current_state, "Alice") is None
+    assert game_logic.timeout_move(current_state, "Alice") is None
 
 
-def test_state_after_timeout_is_null_if_not_players_turn(game_logic, await_action):
-    next_state = game_logic.state_after_timeout(await_action, "Alice")
-    assert next_state is None
+def test_timeout_move_is_null_if_not_players_turn(game_logic, await_action):
+    assert game_logic.timeout_move(await_action, "Alice") is None
 
 
-def test_state_after_timeout_is_player_passing_if_they_can_pass(
+def test_timeout_move_is_player_passing_if_they_can_pass(
     game_logic, await_second_action
 ):
-    next_state = game_logic.state_after_timeout(await_second_action, "Alice")
+    move = game_logic.timeout_move(await_second_action, "Alice")
+    next_state = game_logic.make_move(await_second_action, move)
     assert next_state.status == ChinesePokerStatus.END_TURN
     assert next_state.move_history[-1].cards == tuple()
     assert next_state.move_history[-1].is_bot_move
 
 
-def test_state_after_timeout_is_player_playing_smallest_card_if_they_cannot_pass(
+def test_timeout_move_is_player_playing_smallest_card_if_they_cannot_pass(
     game_logic, await_action, parse_hand
 ):
-    next_state = game_logic.state_after_timeout(await_action, "Diana")
+    move = game_logic.timeout_move(await_action, "Diana")
+    next_state = game_logic.make_move(await_action, move)
     assert next_state.status == ChinesePokerStatus.END_TURN
     assert next_state.move_history[-1].cards == parse_hand("3d")
     assert next_state.move_history[-1].is_bot_move
@@ -1,7 +1,9 @@
+from random import Random
+
 import pytest
 from pydantic import ValidationError
 
-from gamehub.games.playing_cards import PlayingCard, Suits, deal_hands
+from gamehub.games.playing_cards import STANDARD_DECK, PlayingCard, Suits, deal_hands
 
 
 @pytest.mark.parametrize("invalid_rank", ["x", "0", "1", "t", "k"])
@@ -20,3 +22,17 @@ def test_cards_are_dealt_without_repetition():
     for hand in deal_hands(num_hands=13, hand_size=4):
         unique_cards.update(set(hand))
     assert len(unique_cards) == 52
+
+
+def test_seeded_rng_deals_reproducible_hands():
+    hands_a = list(deal_hands(num_hands=4, hand_size=13, rng=Random(42)))
+    hands_b = list(deal_hands(num_hands=4, hand_size=13, rng=Random(42)))
+    assert hands_a == hands_b
+
+
+def test_dealing_permutes_the_deck_template_without_modifying_it():
+    deck = STANDARD_DECK
+    hands = list(deal_hands(num_hands=4, hand_size=13, rng=Random(1)))
+    assert STANDARD_DECK is deck
+    assert len(set(STANDARD_DECK)) == 52
+    assert all(card in STANDARD_DECK for hand in hands for card in hand)
@@ -128,5 +128,5 @@ def test_rock_paper_scissors_states_have_no_derived_events(initial_state):
     )
 
 
-def test_rock_paper_scissors_has_no_state_after_timeout(initial_state):
-    assert RPSGameLogic().state_after_timeout(initial_state, "Alice") is None
+def test_rock_paper_scissors_has_no_timeout_move(initial_state):
+    assert RPSGameLogic().timeout_move(initial_state, "Alice") is None
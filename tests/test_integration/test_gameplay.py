@@ -2,7 +2,11 @@ import pytest
 
 from gamehub.core.event_bus import EventBus
 from gamehub.core.event_scheduler import EventScheduler
-from gamehub.core.events.outgoing_message import OutgoingMessage
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
 from gamehub.core.events.request import RequestType
 from gamehub.core.game_room import GameRoom
 from gamehub.core.message import MessageType
@@ -22,6 +26,15 @@ def message_spy():
         async def send(self, message: OutgoingMessage) -> None:
             self.messages.append(message)
 
+        async def broadcast(self, broadcast: OutgoingBroadcast) -> None:
+            self.messages.append(broadcast)
+
+        async def resume(self, resume: OutgoingResume) -> None:
+            self.messages.append(resume)
+
+        def forget_client(self, _) -> None:
+            pass
+
     return _MessageSenderSpy()
 
 
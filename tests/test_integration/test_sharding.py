@@ -0,0 +1,182 @@
+import asyncio
+import tempfile
+
+import pytest
+import pytest_asyncio
+
+from gamehub.core.event_bus import EventBus
+from gamehub.core.events.outgoing_message import (
+    OutgoingBroadcast,
+    OutgoingMessage,
+    OutgoingResume,
+)
+from gamehub.core.events.player_disconnected import PlayerDisconnected
+from gamehub.core.events.request import RequestType
+from gamehub.core.game_room import GameRoom
+from gamehub.core.message import MessageType
+from gamehub.core.room_manager import RoomManager
+from gamehub.core.setup_bus import setup_event_bus
+from gamehub.core.shard_map import ShardMap
+from gamehub.core.shard_router import ShardRouter
+from gamehub.core.turn_timer import TurnTimerRegistry
+from gamehub.games.rock_paper_scissors import RPSGameLogic, RPSMove
+from tests.utils import expand_broadcasts
+
+
+class _MessageSenderSpy:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message: OutgoingMessage) -> None:
+        self.messages.append(message)
+
+    async def broadcast(self, broadcast: OutgoingBroadcast) -> None:
+        self.messages.append(broadcast)
+
+    async def resume(self, resume: OutgoingResume) -> None:
+        self.messages.append(resume)
+
+    def forget_client(self, _) -> None:
+        pass
+
+    def received(self, player_id: str) -> list[MessageType]:
+        return [
+            message.message.message_type
+            for message in expand_broadcasts(self.messages)
+            if message.player_id == player_id
+        ]
+
+
+class _Shard:
+    def __init__(self, shard_map: ShardMap):
+        self.event_bus = EventBus()
+        self.sender = _MessageSenderSpy()
+        rooms = [
+            GameRoom(
+                room_id=room_id,
+                game_logic=RPSGameLogic(),
+                move_parser=RPSMove.model_validate,
+                event_bus=self.event_bus,
+            )
+            for room_id in (1, 2, 3)
+            if shard_map.is_local(room_id)
+        ]
+        self.room_manager = RoomManager(rooms, self.event_bus)
+        self.router = ShardRouter(self.room_manager, self.event_bus, shard_map)
+        setup_event_bus(
+            self.event_bus,
+            self.sender,
+            self.room_manager,
+            TurnTimerRegistry(turn_timers=[]),
+            self.router,
+        )
+
+
+@pytest_asyncio.fixture
+async def shards():
+    with tempfile.TemporaryDirectory() as socket_dir:
+        shards = [
+            _Shard(ShardMap(shard_index, num_shards=2, socket_dir=socket_dir))
+            for shard_index in (0, 1)
+        ]
+        for shard in shards:
+            await shard.router.start()
+        yield shards
+        for shard in shards:
+            await shard.router.close()
+
+
+async def _eventually(condition, timeout=2.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def join_game(build_request):
+    return lambda player_id, room_id=1: build_request(
+        player_id=player_id,
+        request_type=RequestType.JOIN_GAME_BY_ID,
+        payload={"room_id": room_id},
+    )
+
+
+@pytest.fixture
+def make_move(build_request):
+    return lambda player_id, selection: build_request(
+        player_id=player_id,
+        request_type=RequestType.MAKE_MOVE,
+        payload={"room_id": 1, "move": {"selection": selection}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_are_handled_by_shard_owning_the_room(
+    shards, join_game, make_move
+):
+    local, owner = shards
+    for request in (
+        join_game("Alice"),
+        join_game("Bob"),
+        make_move("Alice", "ROCK"),
+        make_move("Bob", "SCISSORS"),
+    ):
+        await local.event_bus.publish(request)
+
+    await _eventually(lambda: len(local.sender.received("Bob")) == 4)
+    assert local.sender.received("Alice") == [
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_STATE,
+        MessageType.GAME_STATE,
+        MessageType.GAME_STATE,
+        MessageType.GAME_STATE,
+    ]
+    assert local.sender.received("Bob") == [
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_STATE,
+        MessageType.GAME_STATE,
+        MessageType.GAME_STATE,
+    ]
+    assert owner.sender.messages == []
+    assert owner.room_manager.rooms_of_player("Alice") == []
+
+
+@pytest.mark.asyncio
+async def test_players_on_different_shards_share_a_room(shards, join_game):
+    shard_a, shard_b = shards
+    await shard_a.event_bus.publish(join_game("Alice"))
+    await shard_b.event_bus.publish(join_game("Bob"))
+
+    await _eventually(lambda: len(shard_a.sender.received("Alice")) == 2)
+    assert shard_a.sender.received("Alice") == [
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_STATE,
+    ]
+    assert shard_b.sender.received("Bob") == [
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_ROOM_UPDATE,
+        MessageType.GAME_STATE,
+    ]
+    assert shard_a.sender.received("Bob") == []
+    assert shard_b.sender.received("Alice") == []
+
+
+@pytest.mark.asyncio
+async def test_disconnects_reach_rooms_on_other_shards(shards, join_game):
+    local, owner = shards
+    await local.event_bus.publish(join_game("Alice"))
+    await local.event_bus.publish(join_game("Bob"))
+    await _eventually(lambda: MessageType.GAME_STATE in local.sender.received("Bob"))
+
+    await local.event_bus.publish(PlayerDisconnected("Alice"))
+    await _eventually(
+        lambda: next(owner.room_manager.room_states()).offline_players == ["Alice"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_room_states_are_aggregated_across_shards(shards):
+    for shard in shards:
+        room_states = await shard.router.room_states()
+        assert [state.room_id for state in room_states] == [1, 2, 3]
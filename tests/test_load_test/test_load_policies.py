@@ -0,0 +1,83 @@
+from random import Random
+
+from gamehub.load_test.policies import (
+    ChinesePokerPolicy,
+    RockPaperScissorsPolicy,
+    TicTacToePolicy,
+)
+
+
+def _poker_view(move_history=(), current_player_id="Ana", status=None):
+    return {
+        "status": status or "AWAIT_PLAYER_ACTION",
+        "current_player_id": current_player_id,
+        "move_history": list(move_history),
+    }
+
+
+_CARDS = {
+    "cards": [
+        {"rank": "K", "suit": "h"},
+        {"rank": "3", "suit": "d"},
+        {"rank": "7", "suit": "s"},
+    ]
+}
+
+
+def test_poker_policy_only_plays_on_own_turn():
+    policy = ChinesePokerPolicy()
+    assert policy.is_turn("Ana", _poker_view())
+    assert not policy.is_turn("Bob", _poker_view())
+    assert not policy.is_turn("Ana", _poker_view(status="END_TURN"))
+    assert policy.is_over(_poker_view(status="END_GAME"))
+
+
+def test_scripted_poker_policy_leads_smallest_card_and_passes_otherwise():
+    policy = ChinesePokerPolicy()
+    assert policy.candidate_moves("Ana", _poker_view(), _CARDS, rng=None) == [
+        {"cards": [{"rank": "3", "suit": "d"}]}
+    ]
+    following = _poker_view(move_history=[{"player_id": "Bob", "cards": []}])
+    assert policy.candidate_moves("Ana", following, _CARDS, rng=None) == [{"cards": []}]
+
+
+def test_random_poker_policy_falls_back_to_scripted_move():
+    moves = ChinesePokerPolicy().candidate_moves(
+        "Ana", _poker_view(), _CARDS, Random(0)
+    )
+    assert len(moves) == 2
+    assert moves[0]["cards"][0] in _CARDS["cards"]
+    assert moves[-1] == {"cards": [{"rank": "3", "suit": "d"}]}
+
+
+def test_tic_tac_toe_policy_picks_free_cells():
+    view = {
+        "players": [
+            {"player_id": "Ana", "selections": [0, 4]},
+            {"player_id": "Bob", "selections": [1]},
+        ],
+        "current_player": "Bob",
+        "is_over": False,
+    }
+    policy = TicTacToePolicy()
+    assert policy.is_turn("Bob", view)
+    assert not policy.is_turn("Ana", view)
+    assert policy.candidate_moves("Bob", view, None, rng=None) == [{"cell_index": 2}]
+    [move] = policy.candidate_moves("Bob", view, None, Random(0))
+    assert move["cell_index"] in {2, 3, 5, 6, 7, 8}
+
+
+def test_rock_paper_scissors_move_is_applied_once_player_has_selected():
+    view = {
+        "players": [
+            {"player_id": "Ana", "selected": True},
+            {"player_id": "Bob", "selected": False},
+        ]
+    }
+    policy = RockPaperScissorsPolicy()
+    assert policy.move_applied("Ana", view)
+    assert not policy.move_applied("Bob", view)
+    assert not policy.is_over(view)
+    assert policy.candidate_moves("Bob", view, None, rng=None) == [
+        {"selection": "ROCK"}
+    ]
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+import pytest
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+
+from gamehub.load_test.asgi_client import AsgiWebSocket, asgi_lifespan
+
+
+@pytest.fixture
+def echo_app():
+    app = FastAPI()
+
+    @app.websocket("/ws")
+    async def echo(websocket: WebSocket, player_id: str):
+        await websocket.accept()
+        try:
+            while True:
+                text = await websocket.receive_text()
+                await websocket.send_text(f"{player_id}: {text}")
+        except WebSocketDisconnect:
+            pass
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_asgi_websocket_talks_to_app_without_network(echo_app):
+    async with asgi_lifespan(echo_app):
+        socket = AsgiWebSocket(echo_app, "/ws", {"player_id": "Ana"})
+        await socket.connect()
+        socket.send_text("hello")
+        assert await socket.receive_text() == "Ana: hello"
+        await socket.close()
+        assert socket.is_closed
+        assert await socket.receive_text() is None
+
+
+@pytest.mark.asyncio
+async def test_asgi_websocket_reports_rejected_connections(echo_app):
+    socket = AsgiWebSocket(echo_app, "/ws", {})
+    with pytest.raises(ConnectionError):
+        await socket.connect()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_close_leaves_websocket_closable(echo_app):
+    socket = AsgiWebSocket(echo_app, "/ws", {"player_id": "Ana"})
+    await socket.connect()
+    closing = asyncio.create_task(socket.close())
+    await asyncio.sleep(0)
+    closing.cancel()
+    await asyncio.gather(closing, return_exceptions=True)
+    await socket.close()
+    assert socket.is_closed
+
+
+def test_load_test_plays_every_game_against_the_server(tmp_path):
+    scenario = tmp_path / "scenario.json"
+    scenario.write_text(
+        json.dumps(
+            {
+                "name": "tiny",
+                "duration_seconds": 1,
+                "tables": {
+                    "chinese_poker": 1,
+                    "tic_tac_toe": 2,
+                    "rock_paper_scissors": 2,
+                },
+                "spectator_ratio": 0.5,
+                "disconnect_rate": 0.05,
+                "policy": "random",
+            }
+        )
+    )
+    result = subprocess.run(
+        [sys.executable, "-m", "gamehub.load_test", str(scenario), "--json"],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    report = json.loads(result.stdout)
+    assert report["num_clients"] == 18
+    assert report["moves"] > 0
+    assert report["games_finished"] > 0
+    assert report["messages_per_move"] > 1
+    assert report["latency_p50_ms"] <= report["latency_p99_ms"]
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from gamehub.load_test.report import LoadMetrics, percentile
+from gamehub.load_test.scenario import Scenario, load_scenario
+
+
+def test_scenario_is_loaded_from_json_file(tmp_path):
+    path = tmp_path / "scenario.json"
+    path.write_text(
+        json.dumps(
+            {
+                "name": "small",
+                "duration_seconds": 2,
+                "tables": {"chinese_poker": 1, "tic_tac_toe": 3},
+                "spectator_ratio": 0.5,
+                "policy": "random",
+            }
+        )
+    )
+    scenario = load_scenario(str(path))
+    assert scenario.name == "small"
+    assert scenario.policy == "random"
+    assert scenario.num_players("chinese_poker") == 4
+    assert scenario.num_players("tic_tac_toe") == 6
+    assert scenario.num_spectators("tic_tac_toe") == 3
+
+
+@pytest.mark.parametrize(
+    ("overrides", "error"),
+    [
+        ({"tables": {"checkers": 1}}, "Unknown game types: checkers"),
+        ({"tables": {"tic_tac_toe": -1}}, "cannot be negative"),
+        ({"policy": "greedy"}, "Policy must be one of"),
+        ({"duration_seconds": 0}, "Duration must be positive"),
+        ({"spectator_ratio": -1}, "cannot be negative"),
+        ({"disconnect_rate": 1.5}, "between 0 and 1"),
+    ],
+)
+def test_invalid_scenarios_are_rejected(overrides, error):
+    with pytest.raises(ValueError, match=error):
+        Scenario(**{"name": "bad", "tables": {"tic_tac_toe": 1}, **overrides})
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([3.0], 0.95) == 3
+    assert percentile([], 0.5) == 0
+
+
+def test_load_report_is_normalized_per_move():
+    metrics = LoadMetrics()
+    for latency in (0.001, 0.002, 0.003, 0.004):
+        metrics.record_move(latency)
+    for frame in ('{"a":1}', "{}", "{}", "{}", "{}", "{}", "{}", "{}"):
+        metrics.record_frame(frame)
+    report = metrics.report("small", num_clients=4, elapsed_seconds=2)
+    assert report.moves == 4
+    assert report.moves_per_second == 2
+    assert report.latency_p50_ms == pytest.approx(2)
+    assert report.latency_p99_ms == pytest.approx(4)
+    assert report.messages_per_move == 2
+    assert report.bytes_per_move == 5.25
+    assert report.peak_memory_bytes > 0
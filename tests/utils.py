@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from typing import Iterator
 
-from gamehub.core.events.outgoing_message import OutgoingMessage
+from gamehub.core.events.outgoing_message import OutgoingBroadcast, OutgoingMessage
 from gamehub.core.message import MessageType
 
 
@@ -16,9 +17,22 @@ class ExpectedBroadcast:
         assert [m.player_id for m in messages] == self.recipients
 
 
+def expand_broadcasts(
+    messages: list[OutgoingMessage | OutgoingBroadcast],
+) -> Iterator[OutgoingMessage]:
+    for message in messages:
+        if isinstance(message, OutgoingBroadcast):
+            for recipient in message.recipients:
+                yield OutgoingMessage(player_id=recipient, message=message.message)
+        else:
+            yield message
+
+
 def check_messages(
-    messages: list[OutgoingMessage], expected_broadcasts: list[ExpectedBroadcast]
+    messages: list[OutgoingMessage | OutgoingBroadcast],
+    expected_broadcasts: list[ExpectedBroadcast],
 ) -> None:
+    messages = list(expand_broadcasts(messages))
     current_idx = 0
     for expected in expected_broadcasts:
         expected.check_messages(